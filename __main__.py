@@ -1,34 +1,254 @@
+import time
+
+# Taken before anything else so --first-frame covers interpreter startup too
+_START_TIME = time.time()
+
+import argparse
 import os
 import sys
+from typing import Iterable
+from typing import List
+from typing import Optional
+
+from src.backend import export
+from src.backend import midi
+from src.backend import notes
+from src.backend.notes import Note
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='scales', description='View the notes of a major scale.')
+    parser.add_argument(
+        '--qrc', action='store_true',
+        help='Load the QML from the compiled resource module src/qml_rc.py '
+             'instead of the .qml files on disk.')
+    parser.add_argument(
+        '--qml-cache-dir', metavar='DIR',
+        help='Cache compiled QML in DIR. Files loaded with --qrc are cached '
+             'too.')
+    parser.add_argument(
+        '--instrument', nargs='?', const='', metavar='FILE',
+        help='Show slot, model update and frame timings in an overlay, and '
+             'write them to FILE as JSON on exit if given.')
+    parser.add_argument(
+        '--record', metavar='FILE',
+        help='Play clicked notes on an audio thread and record them to FILE '
+             'as WAV.')
+    parser.add_argument(
+        '--first-frame', action='store_true',
+        help='Print the time from process start to the first rendered frame '
+             'and quit.')
 
-from PySide2.QtCore import QUrl
-from PySide2.QtWidgets import QApplication
-from PySide2.QtWidgets import QWidget
-from PySide2.QtWidgets import QVBoxLayout
-from PySide2.QtQuickWidgets import QQuickWidget
+    subparsers = parser.add_subparsers(dest='command')
+    batch = subparsers.add_parser(
+        'batch', help='Stream major scales and chords without the GUI.')
+    batch.add_argument(
+        '--roots', nargs='+', metavar='ROOT', type=parse_root,
+        help='Roots such as F#, Gb, fis or F♯. Defaults to every key.')
+    batch.add_argument('--format', choices=export.FORMATS,
+                       default=export.JSONL)
+    batch.add_argument('--output', '-o', metavar='FILE',
+                       help='Write to FILE instead of stdout.')
 
-from src.main import Manager
+    midi_export = subparsers.add_parser(
+        'midi', help='Write a MIDI file with the major scale and chords for '
+                     'each key.')
+    midi_export.add_argument(
+        '--roots', nargs='+', metavar='ROOT', type=parse_root,
+        help='Roots such as F#, Gb, fis or F♯. Defaults to every key.')
+    midi_export.add_argument('--output', '-o', metavar='DIR', default='.',
+                             help='Write the files to DIR.')
 
+    wav_export = subparsers.add_parser(
+        'wav', help='Render the major scale and chords for each key to a WAV '
+                    'file.')
+    wav_export.add_argument(
+        '--roots', nargs='+', metavar='ROOT', type=parse_root,
+        help='Roots such as F#, Gb, fis or F♯. Defaults to every key.')
+    wav_export.add_argument('--timbre', default='Sine',
+                            choices=('Sine', 'Organ', 'Reed'))
+    wav_export.add_argument('--output', '-o', metavar='DIR', default='.',
+                            help='Write the files to DIR.')
 
-def main():
+    chart = subparsers.add_parser(
+        'chart', help='Resolve the chord symbols in a chord chart file.')
+    chart.add_argument('file', metavar='FILE')
+    chart.add_argument('--errors', choices=('raise', 'skip'),
+                       default='raise',
+                       help='Stop at or skip unrecognized symbols.')
+    chart.add_argument('--format', choices=export.FORMATS,
+                       default=export.JSONL)
+    chart.add_argument('--output', '-o', metavar='FILE',
+                       help='Write to FILE instead of stdout.')
+
+    serve = subparsers.add_parser(
+        'serve', help='Serve scale and chord lookups as JSON over HTTP.')
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8000)
+    return parser.parse_args(argv)
+
+
+def parse_root(text: str) -> Note:
     """
-    Run QML inside a QWidget.
+    Return the key root named `text`, in any spelling notes.parse_note()
+    accepts.
     """
+    try:
+        root = notes.parse_note(text)
+    except ValueError:
+        root = None
+    if root not in notes.ROOT_ACCIDENTALS_MAP:
+        raise argparse.ArgumentTypeError(f'{text!r} is not a key root.')
+    return root
+
+
+def run_batch(args: argparse.Namespace):
+    """
+    Stream scales and chords for the requested roots.
+    """
+    roots = args.roots or export.default_roots()
+    write_records(export.iter_records(roots), args)
+
+
+def run_chart(args: argparse.Namespace):
+    """
+    Stream the chords of a chord chart and report the throughput on stderr.
+    """
+    from src.backend import chord_chart
+
+    start = time.perf_counter()
+    chords = chord_chart.iter_chart_file(args.file, args.errors)
+    try:
+        count = write_records(export.iter_chord_records(
+            (chord.root, chord.quality, chord.notes) for chord in chords),
+            args)
+    except ValueError as error:
+        sys.exit(f'{args.file}: {error}')
+    if count is None:
+        return
+    elapsed = time.perf_counter() - start
+    print(f'{count} symbols in {elapsed:.3f} s '
+          f'({count / max(elapsed, 1e-9):,.0f} symbols/s)', file=sys.stderr)
+
+
+def write_records(records: Iterable[export.Record],
+                  args: argparse.Namespace) -> Optional[int]:
+    """
+    Write `records` in args.format to args.output or stdout and return the
+    number written, or None if stdout was closed before all were written.
+    """
+    write = export.WRITERS[args.format]
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8', newline='') as f:
+            return write(records, f)
+    try:
+        count = write(records, sys.stdout)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader went away, e.g. `| head`. Silence the error Python
+        # would otherwise print when flushing stdout at exit.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return None
+    return count
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Run QML inside a QWidget, or one of the headless commands.
+    """
+    args = parse_args(argv)
+    if args.command == 'batch':
+        run_batch(args)
+        return
+    if args.command == 'midi':
+        midi.export_keys(args.roots or export.default_roots(), args.output)
+        return
+    if args.command == 'chart':
+        run_chart(args)
+        return
+    if args.command == 'wav':
+        # NumPy is only needed for rendering audio
+        from src.backend import synth
+        synth.export_keys(args.roots or export.default_roots(), args.output,
+                          synth.Timbre(args.timbre))
+        return
+    if args.command == 'serve':
+        from src import server
+        server.main(['--host', args.host, '--port', str(args.port)])
+        return
+
+    if args.qml_cache_dir:
+        # Must be set before the QML engine is created. Qt 5 keeps its cache
+        # under the platform cache location rather than QML_DISK_CACHE_PATH.
+        cache_dir = os.path.abspath(args.qml_cache_dir)
+        os.environ['QML_DISK_CACHE_PATH'] = cache_dir
+        os.environ['XDG_CACHE_HOME'] = cache_dir
+        os.environ['QML_FORCE_DISK_CACHE'] = '1'
+
+    # Qt is only imported once the GUI is actually launched
+    from PySide2.QtCore import QTimer
+    from PySide2.QtCore import QUrl
+    from PySide2.QtWidgets import QApplication
+    from PySide2.QtWidgets import QWidget
+    from PySide2.QtWidgets import QVBoxLayout
+    from PySide2.QtQuickWidgets import QQuickWidget
+
+    from src.instrumentation import Instrumentation
+    from src.main import Manager
+
     # Set up the application window
-    app = QApplication(sys.argv)
+    app = QApplication(sys.argv[:1])
+    app.setApplicationName('scales')
     window = QWidget()
 
     # To use a QML view we need this widget
     qquick_widget = QQuickWidget()
     qquick_widget.setResizeMode(QQuickWidget.ResizeMode.SizeRootObjectToView)
 
+    if args.first_frame:
+        def on_first_frame():
+            qquick_widget.quickWindow().afterRendering.disconnect(
+                on_first_frame)
+            # The launching process can pass its own clock to include spawning
+            start_time = float(os.environ.get('SCALES_LAUNCH_TIME',
+                                              _START_TIME))
+            print(f'first frame: {(time.time() - start_time) * 1e3:.1f} ms')
+            QTimer.singleShot(0, app.quit)
+
+        qquick_widget.quickWindow().afterRendering.connect(on_first_frame)
+
+    instrumentation = None
+    if args.instrument is not None:
+        instrumentation = Instrumentation()
+        instrumentation.attachFrameSignal(
+            qquick_widget.quickWindow().afterRendering)
+        if args.instrument:
+            app.aboutToQuit.connect(
+                lambda: instrumentation.dump(args.instrument))
+
+    player = None
+    if args.record:
+        from src.backend import playback
+        player = playback.Player(playback.WavSink(args.record))
+        player.start()
+        app.aboutToQuit.connect(player.stop)
+
     # Expose the manager to the Qml code
-    manager = Manager()
+    manager = Manager(instrumentation=instrumentation, player=player)
     qquick_widget.rootContext().setContextProperty("manager", manager)
+    qquick_widget.rootContext().setContextProperty("instrumentation",
+                                                   instrumentation)
 
     # Load the QML file
-    qml_file = os.path.join(os.path.dirname(__file__), "src/main.qml")
-    qquick_widget.setSource(QUrl.fromLocalFile(os.path.abspath(qml_file)))
+    if args.qrc:
+        # Importing the module registers the compiled resources
+        import src.qml_rc
+        qquick_widget.setSource(QUrl('qrc:/main.qml'))
+    else:
+        qml_file = os.path.join(os.path.dirname(__file__), "src/main.qml")
+        qquick_widget.setSource(QUrl.fromLocalFile(os.path.abspath(qml_file)))
 
     # Allow QML to take up the full window
     layout = QVBoxLayout()
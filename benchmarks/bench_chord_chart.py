@@ -0,0 +1,68 @@
+"""
+Measure chord chart parsing throughput in symbols per second on a generated
+chart file, and the peak Python memory used while parsing it.
+
+Run from the repository root with `python -m benchmarks.bench_chord_chart`.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from typing import List
+
+from src.backend import chord_chart
+
+
+SYMBOLS = ('C', 'Cmaj7', 'Dm7', 'G7', 'Em', 'Am7', 'F#m7b5', 'B7', 'Bbmaj7',
+           'Eb7', 'Abdim7', 'D#m', 'C/E', 'G/B', 'Fm(maj7)', 'E+')
+SYMBOLS_PER_BAR = 2
+BARS_PER_LINE = 4
+
+
+def write_chart(path: str, count: int, seed: int = 0):
+    """
+    Write a chart of `count` random symbols to `path`.
+    """
+    rng = random.Random(seed)
+    per_line = SYMBOLS_PER_BAR * BARS_PER_LINE
+    with open(path, 'w', encoding='utf-8') as f:
+        for start in range(0, count, per_line):
+            bars = []
+            for bar in range(start, min(start + per_line, count),
+                             SYMBOLS_PER_BAR):
+                bars.append(' '.join(
+                    rng.choice(SYMBOLS)
+                    for _ in range(min(SYMBOLS_PER_BAR, count - bar))))
+            f.write('| ' + ' | '.join(bars) + ' |\n')
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--count', type=int, default=2 * 10 ** 6)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'chart.txt')
+        write_chart(path, args.count)
+        size = os.path.getsize(path)
+
+        chord_chart.clear_symbol_cache()
+        start = time.perf_counter()
+        count = sum(1 for _ in chord_chart.iter_chart_file(path))
+        elapsed = time.perf_counter() - start
+        print(f'{count:,} symbols ({size / 2 ** 20:.1f} MiB) in {elapsed:.2f} s'
+              f'  {count / elapsed:12,.0f} symbols/s')
+        print(f'symbol cache: {chord_chart.symbol_cache_info()}')
+
+        tracemalloc.start()
+        for _ in chord_chart.iter_chart_file(path):
+            pass
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f'peak Python memory while parsing: {peak / 2 ** 10:.1f} KiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Compare building the full roots x qualities chord table one chord at a time
+with a single pitch_classes.build_chords() call, and measure the throughput of
+the stateless chord_builder.build_chord() from a thread pool.
+
+Run from the repository root with `python -m benchmarks.bench_chords`.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.backend import intervals
+from src.backend import notes
+from src.backend import pitch_classes
+from src.backend.chord_builder import ChordBuilder
+from src.backend.chord_builder import build_chord
+
+from .timing import report
+from .timing import time_per_call
+
+
+def main():
+    roots = list(notes.ROOT_ACCIDENTALS_MAP)
+    root_codes = pitch_classes.encode(roots)
+    num_chords = len(roots) * len(intervals.ALL_CHORD_INTS)
+
+    def per_chord_loop():
+        for root in roots:
+            builder = ChordBuilder(root)
+            for quality in intervals.ALL_CHORD_INTS:
+                builder.build_chord(quality)
+
+    def bulk():
+        pitch_classes.build_chords(root_codes)
+
+    baseline = time_per_call(per_chord_loop, number=200) / num_chords
+    report('ChordBuilder.build_chord loop (per chord)', baseline)
+    report('build_chords() (per chord)',
+           time_per_call(bulk, number=2000) / num_chords, baseline)
+
+    jobs = [(root, quality) for root in roots
+            for quality in intervals.ALL_CHORD_INTS]
+
+    def stateless():
+        for root, quality in jobs:
+            build_chord(root, quality)
+
+    report('build_chord(root, quality) (per chord)',
+           time_per_call(stateless, number=2000) / num_chords, baseline)
+
+    def build_all(_):
+        stateless()
+
+    for workers in (1, 4, 8):
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            start = time.perf_counter()
+            list(executor.map(build_all, range(2000)))
+            elapsed = time.perf_counter() - start
+        print(f'{workers} thread(s): {2000 * num_chords / elapsed:,.0f} chords/s')
+
+
+if __name__ == '__main__':
+    main()
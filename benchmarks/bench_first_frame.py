@@ -0,0 +1,67 @@
+"""
+Measure the time from process start to the first rendered frame of the GUI
+when loading QML from disk and from the compiled resource module, with and
+without a warm QML disk cache.
+
+Run from the repository root with `python -m benchmarks.bench_first_frame`.
+Set QT_QPA_PLATFORM=offscreen to run without a display.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODES = {
+    'disk': [],
+    'qrc': ['--qrc']
+}
+
+
+def first_frame_time(args: List[str], **env_vars: str) -> float:
+    """
+    Launch the GUI once and return the milliseconds until its first frame.
+    """
+    env = dict(os.environ, **env_vars, SCALES_LAUNCH_TIME=repr(time.time()))
+    result = subprocess.run(
+        [sys.executable, os.path.join(ROOT_DIR, '__main__.py'),
+         '--first-frame', *args],
+        cwd=ROOT_DIR, env=env, stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL, universal_newlines=True, check=True)
+    for line in result.stdout.splitlines():
+        if line.startswith('first frame:'):
+            return float(line.split()[2])
+    raise RuntimeError(f'No frame was rendered with {args}.')
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    for mode, mode_args in MODES.items():
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for cache in ('no cache', 'disk cache'):
+                run_args = list(mode_args)
+                env_vars = {}
+                if cache == 'disk cache':
+                    run_args += ['--qml-cache-dir', cache_dir]
+                    # Populate the cache before timing
+                    first_frame_time(run_args)
+                else:
+                    env_vars['QML_DISABLE_DISK_CACHE'] = '1'
+                times = [first_frame_time(run_args, **env_vars)
+                         for _ in range(args.runs)]
+                print(f'{mode:<5} {cache:<11} median '
+                      f'{statistics.median(times):7.1f} ms   '
+                      f'min {min(times):7.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
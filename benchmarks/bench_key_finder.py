@@ -0,0 +1,37 @@
+"""
+Compare finding the keys that contain a melody by building every MajorScale
+with the precomputed key_finder index.
+
+Run from the repository root with `python -m benchmarks.bench_key_finder`.
+"""
+from src.backend import key_finder
+from src.backend import notes
+from src.backend.notes import Note
+from src.backend.scales import MajorScale
+
+from .timing import report
+from .timing import time_per_call
+
+
+MELODY = (Note.E, Note.FSharp, Note.G, Note.A, Note.B, Note.D, Note.E)
+
+
+def keys_containing_scan():
+    melody = set(MELODY)
+    return [root for root in notes.ROOT_ACCIDENTALS_MAP
+            if melody.issubset(MajorScale(root).notes)]
+
+
+def main():
+    assert keys_containing_scan() == key_finder.keys_containing(MELODY)
+    baseline = time_per_call(keys_containing_scan, number=2000)
+    report('MajorScale scan', baseline)
+    report('keys_containing()',
+           time_per_call(lambda: key_finder.keys_containing(MELODY)),
+           baseline)
+    report('closest_keys()',
+           time_per_call(lambda: key_finder.closest_keys(MELODY, count=3)))
+
+
+if __name__ == '__main__':
+    main()
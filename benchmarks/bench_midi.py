@@ -0,0 +1,37 @@
+"""
+Measure how long it takes to export every key with every chord quality as
+MIDI files.
+
+Run from the repository root with `python -m benchmarks.bench_midi`.
+"""
+import argparse
+import tempfile
+import time
+from typing import List
+
+from src.backend import export
+from src.backend import midi
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    roots = export.default_roots()
+    best = float('inf')
+    with tempfile.TemporaryDirectory() as directory:
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            paths = midi.export_keys(roots, directory)
+            best = min(best, time.perf_counter() - start)
+    print(f'{len(paths)} files in {best * 1e3:.2f} ms (best of {args.repeat})')
+
+    start = time.perf_counter()
+    size = sum(len(midi.encode_key(root)) for root in roots)
+    elapsed = time.perf_counter() - start
+    print(f'encoding only: {size:,} bytes in {elapsed * 1e3:.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Measure note name parsing throughput in notes per second, one name at a time
+and in bulk.
+
+Run from the repository root with `python -m benchmarks.bench_parse`.
+"""
+import argparse
+import random
+import time
+from typing import List
+
+from src.backend import notes
+from src.backend.notes import Note
+
+
+SPELLINGS = ('C', 'C#', 'Db', 'cis', 'des', 'es', 'as', 'F♯', 'g', 'Bb',
+             'F-sharp', 'e-flat', 'FSharp')
+
+
+def _rate(count: int, seconds: float) -> str:
+    return f'{count / seconds:14,.0f} notes/s'
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--count', type=int, default=10 ** 6)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    names = [rng.choice(SPELLINGS) for _ in range(args.count)]
+    buffer = ' '.join(names).encode('utf-8')
+
+    # What parsing costs without the table: Note() on the Unicode values only
+    values = [note.value for note in notes.parse_notes(names)]
+    start = time.perf_counter()
+    [Note(value) for value in values]
+    print(f'{"Note(value) (baseline)":<28} '
+          f'{_rate(len(values), time.perf_counter() - start)}')
+
+    start = time.perf_counter()
+    [notes.parse_note(name) for name in names]
+    print(f'{"parse_note()":<28} {_rate(len(names), time.perf_counter() - start)}')
+
+    start = time.perf_counter()
+    notes.parse_notes(names)
+    print(f'{"parse_notes(list)":<28} {_rate(len(names), time.perf_counter() - start)}')
+
+    start = time.perf_counter()
+    parsed = notes.parse_notes(buffer)
+    elapsed = time.perf_counter() - start
+    assert len(parsed) == len(names)
+    print(f'{"parse_notes(bytes)":<28} {_rate(len(parsed), elapsed)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Compare building many major scales one MajorScale at a time with a single
+vectorized pitch_classes.scale_degrees() call, and transposing a long melody
+note by note with a single pitch_classes.transpose_key() call.
+
+Run from the repository root with `python -m benchmarks.bench_pitch_classes`.
+"""
+import numpy as np
+
+from src.backend import notes
+from src.backend import pitch_classes
+from src.backend.notes import Note
+from src.backend.notes import PITCH_CLASSES
+from src.backend.scales import ChromaticScale
+from src.backend.scales import MajorScale
+
+from .timing import report
+from .timing import time_per_call
+
+
+NUM_KEYS = 10000
+NUM_MELODY_NOTES = 10 ** 6
+
+
+def main():
+    key_roots = list(notes.ROOT_ACCIDENTALS_MAP)
+    roots = [key_roots[i % len(key_roots)] for i in range(NUM_KEYS)]
+    root_codes = pitch_classes.encode(roots)
+    codes = np.resize(pitch_classes.encode(key_roots), NUM_KEYS)
+
+    def objects():
+        for root in roots:
+            MajorScale(root).notes
+
+    def vectorized():
+        pitch_classes.scale_degrees(root_codes)
+
+    def transposed():
+        pitch_classes.transpose_notes(codes, 5, root_codes)
+
+    baseline = time_per_call(objects, number=5, repeat=3) / NUM_KEYS
+    report(f'MajorScale(root) x {NUM_KEYS}', baseline)
+    report(f'scale_degrees() x {NUM_KEYS}',
+           time_per_call(vectorized, number=50, repeat=3) / NUM_KEYS,
+           baseline)
+    report(f'transpose_notes() x {NUM_KEYS}',
+           time_per_call(transposed, number=50, repeat=3) / NUM_KEYS)
+
+    source, target = Note.D, Note.EFlat
+    melody = [MajorScale(source).notes[i % 7] for i in range(NUM_MELODY_NOTES)]
+    melody_codes = pitch_classes.encode(melody)
+    source_code = pitch_classes.NOTE_CODES[source]
+    target_code = pitch_classes.NOTE_CODES[target]
+
+    def transpose_by_hand():
+        target_notes = ChromaticScale(target).notes
+        offset = PITCH_CLASSES[source]
+        return [target_notes[(PITCH_CLASSES[note] - offset) % 12]
+                for note in melody]
+
+    def transpose_key():
+        return pitch_classes.transpose_key(melody_codes, source_code,
+                                           target_code)
+
+    assert pitch_classes.decode_list(transpose_key()) == transpose_by_hand()
+    baseline = time_per_call(transpose_by_hand, number=1, repeat=3) \
+        / NUM_MELODY_NOTES
+    report(f'ChromaticScale mapping x {NUM_MELODY_NOTES}', baseline)
+    report(f'transpose_key() x {NUM_MELODY_NOTES}',
+           time_per_call(transpose_key, number=5, repeat=3)
+           / NUM_MELODY_NOTES,
+           baseline)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Measure click-to-first-sample latency and block timing jitter of the
+playback thread, using a sink paced at real time.
+
+Run from the repository root with `python -m benchmarks.bench_playback`.
+"""
+import argparse
+import statistics
+import time
+from typing import List
+
+import numpy as np
+
+from src.backend import playback
+from src.backend import synth
+from src.backend.notes import Note
+
+
+# Seconds to wait for a note before giving up
+TIMEOUT = 2.0
+
+
+def measure_latency(player: playback.Player, sink: playback.NullSink,
+                    clicks: int) -> List[float]:
+    """
+    Return the seconds from play_note() to the first audible sample being
+    written, for `clicks` notes played one at a time.
+    """
+    latencies = []
+    for _ in range(clicks):
+        sink.reset()
+        clicked = time.perf_counter()
+        player.play_note(Note.A, duration=0.02)
+        deadline = clicked + TIMEOUT
+        while sink.first_sound_time is None:
+            if time.perf_counter() > deadline:
+                raise RuntimeError(f'No sound within {TIMEOUT} s; the audio '
+                                   f'thread may have died.')
+            time.sleep(0.0005)
+        latencies.append(sink.first_sound_time - clicked)
+        # Let the note finish so the thread goes idle again
+        time.sleep(0.03)
+    return latencies
+
+
+def measure_jitter(player: playback.Player, sink: playback.NullSink,
+                   root: Note) -> np.ndarray:
+    """
+    Play a scale and return how far each block write strayed from the block
+    period, in seconds.
+    """
+    sink.reset()
+    player.play_scale(root, duration=0.1)
+    time.sleep(0.9)
+    intervals = np.diff(np.array(sink.write_times))
+    return intervals - player.block_size / sink.sample_rate
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--clicks', type=int, default=100)
+    parser.add_argument('--block-size', type=int, default=playback.BLOCK_SIZE)
+    args = parser.parse_args(argv)
+
+    sink = playback.NullSink()
+    player = playback.Player(sink, block_size=args.block_size)
+    player.start()
+    # Fill the note cache so only playback is measured
+    synth.render_note(69, 0.02)
+    try:
+        latencies = sorted(measure_latency(player, sink, args.clicks))
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        print(f'latency: median {statistics.median(latencies) * 1e3:.3f} ms'
+              f'  p99 {p99 * 1e3:.3f} ms  max {latencies[-1] * 1e3:.3f} ms')
+        jitter = measure_jitter(player, sink, Note.C)
+        block_ms = args.block_size / sink.sample_rate * 1e3
+        print(f'jitter: {len(jitter)} blocks of {block_ms:.2f} ms, std '
+              f'{jitter.std() * 1e3:.3f} ms  max {np.abs(jitter).max() * 1e3:.3f} ms')
+    finally:
+        player.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Compare the precomputed chromatic scale tables against rebuilding the scale on
+every call, and time memoized scale lookups after warm-up.
+
+Run from the repository root with `python -m benchmarks.bench_scales`.
+"""
+from src.backend import intervals
+from src.backend import notes
+from src.backend import scales
+
+from .timing import report
+from .timing import time_per_call
+
+
+def main():
+    roots = sorted(notes.USED_KEYS, key=lambda root: root.value)
+    sharps = [root in notes.SHARP_KEYS for root in roots]
+
+    def rebuild():
+        for root, sharp in zip(roots, sharps):
+            scales._build_chromatic_notes(root, sharp)
+
+    def lookup():
+        for root, sharp in zip(roots, sharps):
+            scales.chromatic_notes(root, sharp)
+
+    chromatic_scales = [scales.ChromaticScale(root) for root in roots]
+
+    def notes_property():
+        for scale in chromatic_scales:
+            scale.notes
+
+    def major_scales():
+        for root in roots:
+            scales.MajorScale(root)
+
+    per_root = len(roots)
+    baseline = time_per_call(rebuild, number=2000) / per_root
+    report('rebuild chromatic scale (pre-table)', baseline)
+    report('chromatic_notes() table lookup',
+           time_per_call(lookup, number=2000) / per_root, baseline)
+    report('ChromaticScale.notes',
+           time_per_call(notes_property, number=2000) / per_root, baseline)
+    report('MajorScale(root)',
+           time_per_call(major_scales, number=2000) / per_root)
+
+    combos = [(root, scale_type) for root in roots
+              for scale_type in intervals.ScaleType]
+
+    def scale_lookups():
+        for root, scale_type in combos:
+            scales.scale_notes(root, scale_type)
+
+    scale_lookups()
+    report('scale_notes(root, scale) after warm-up',
+           time_per_call(scale_lookups, number=500) / len(combos))
+    print(scales.scale_cache_info())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Measure interpreter startup for the headless backend and the GUI import paths
+with `python -X importtime`.
+
+Run from the repository root with `python -m benchmarks.bench_startup`. The
+exit status is non-zero when a headless path imports Qt or its median wall time
+exceeds --max-headless-ms, so it can run in CI.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List
+from typing import Tuple
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEADLESS_PATHS = {
+    'backend import': ['-c', 'import src.backend.scales, '
+                             'src.backend.chord_builder'],
+    'backend CLI': ['-m', 'src.backend', 'C']
+}
+GUI_PATHS = {
+    'GUI import': ['-c', 'import src.main; '
+                         'from PySide2 import QtQuickWidgets, QtWidgets']
+}
+
+
+def run_importtime(args: List[str]) -> Tuple[float, float, List[str]]:
+    """
+    Run the interpreter once with `args` and return its wall time in seconds,
+    the total import time in seconds, and the names of the imported modules.
+    """
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', *args],
+                            cwd=ROOT_DIR, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, universal_newlines=True,
+                            check=True)
+    wall_time = time.perf_counter() - start
+    import_time = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        import_time += int(self_us)
+        modules.append(name.strip())
+    return wall_time, import_time / 1e6, modules
+
+
+def measure(name: str, args: List[str], runs: int) -> Tuple[float, bool]:
+    """
+    Print the median wall and import times of a path and return the median
+    wall time and whether Qt was imported.
+    """
+    results = [run_importtime(args) for _ in range(runs)]
+    wall_time = statistics.median(result[0] for result in results)
+    import_time = statistics.median(result[1] for result in results)
+    modules = results[0][2]
+    imports_qt = any(module.startswith('PySide2') for module in modules)
+    print(f'{name:<20} wall {wall_time * 1e3:8.1f} ms   imports '
+          f'{import_time * 1e3:8.1f} ms   {len(modules):4d} modules'
+          f'{"   (Qt)" if imports_qt else ""}')
+    return wall_time, imports_qt
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--max-headless-ms', type=float, default=None)
+    parser.add_argument('--headless-only', action='store_true')
+    args = parser.parse_args(argv)
+
+    failed = False
+    for name, path_args in HEADLESS_PATHS.items():
+        wall_time, imports_qt = measure(name, path_args, args.runs)
+        if imports_qt:
+            print(f'FAIL: {name} imports Qt')
+            failed = True
+        if args.max_headless_ms and wall_time * 1e3 > args.max_headless_ms:
+            print(f'FAIL: {name} took longer than {args.max_headless_ms} ms')
+            failed = True
+    if not args.headless_only:
+        for name, path_args in GUI_PATHS.items():
+            measure(name, path_args, args.runs)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,36 @@
+"""
+Measure audio rendering throughput in samples per second, with the note cache
+cold and warm.
+
+Run from the repository root with `python -m benchmarks.bench_synth`.
+"""
+import argparse
+import time
+from typing import List
+
+from src.backend import export
+from src.backend import synth
+
+
+def _render_all(timbre: synth.Timbre, duration: float) -> int:
+    return sum(len(synth.render_key(root, duration, timbre))
+               for root in export.default_roots())
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--duration', type=float, default=synth.DEFAULT_DURATION)
+    args = parser.parse_args(argv)
+
+    for timbre in synth.Timbre:
+        synth.clear_note_cache()
+        for label in ('cold', 'warm'):
+            start = time.perf_counter()
+            count = _render_all(timbre, args.duration)
+            elapsed = time.perf_counter() - start
+            print(f'{timbre.value:6s} {label}: {count:,} samples in '
+                  f'{elapsed:6.3f} s  {count / elapsed:14,.0f} samples/s')
+
+
+if __name__ == '__main__':
+    main()
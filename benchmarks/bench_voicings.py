@@ -0,0 +1,43 @@
+"""
+Measure voicing enumeration throughput for every chord quality on every key
+root with an increasing number of worker processes.
+
+Run from the repository root with `python -m benchmarks.bench_voicings`.
+"""
+import argparse
+import os
+import time
+from typing import List
+
+from src.backend import intervals
+from src.backend import notes
+from src.backend import voicings
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--low', type=int, default=36)
+    parser.add_argument('--high', type=int, default=84)
+    parser.add_argument('--extra-voices', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    roots = list(notes.ROOT_ACCIDENTALS_MAP)
+    qualities = list(intervals.ALL_CHORD_INTS)
+    worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    single = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        count = 0
+        for chunk in voicings.iter_voicing_chunks(
+                roots, qualities, args.low, args.high, args.extra_voices,
+                workers=workers):
+            count += len(chunk)
+        elapsed = time.perf_counter() - start
+        rate = count / elapsed
+        single = single or rate
+        print(f'{workers:3d} worker(s): {count:,} voicings in {elapsed:6.2f} s'
+              f'  {rate:12,.0f} voicings/s  ({rate / single:4.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
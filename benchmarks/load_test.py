@@ -0,0 +1,92 @@
+"""
+Load test the scale service with keep-alive connections and report
+requests/second and latency percentiles.
+
+Run from the repository root with `python -m benchmarks.load_test`. Without
+--port an in-process server is started on a free port.
+"""
+import argparse
+import asyncio
+import itertools
+import statistics
+import time
+from typing import List
+
+from src import server as scale_server
+from src.backend import intervals
+from src.backend.notes import ROOT_ACCIDENTALS_MAP
+
+
+def request_paths() -> List[str]:
+    paths = []
+    for root in ROOT_ACCIDENTALS_MAP:
+        paths.append(f'/scales/{root.name}')
+        for quality in intervals.ALL_CHORD_INTS:
+            paths.append(
+                f'/chords/{root.name}/{scale_server.quality_slug(quality)}')
+    return paths
+
+
+async def client(host: str, port: int, paths, num_requests: int,
+                 latencies: List[float]):
+    """
+    Send `num_requests` requests one after another over one connection.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    for _ in range(num_requests):
+        path = next(paths)
+        start = time.perf_counter()
+        writer.write(f'GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n'
+                     .encode('ascii'))
+        head = await reader.readuntil(b'\r\n\r\n')
+        length = 0
+        for line in head.split(b'\r\n'):
+            if line.lower().startswith(b'content-length:'):
+                length = int(line.split(b':', 1)[1])
+        await reader.readexactly(length)
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+
+
+async def run(host: str, port: int, connections: int, num_requests: int):
+    in_process = None
+    if port is None:
+        in_process = scale_server.ScaleServer()
+        await in_process.start(host, 0)
+        port = in_process.port
+
+    paths = itertools.cycle(request_paths())
+    latencies = []
+    per_client = num_requests // connections
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, paths, per_client, latencies)
+                           for _ in range(connections)))
+    elapsed = time.perf_counter() - start
+
+    if in_process is not None:
+        in_process.close()
+        await in_process.wait_closed()
+
+    latencies.sort()
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(f'{len(latencies)} requests over {connections} connections in '
+          f'{elapsed:.2f} s')
+    print(f'{len(latencies) / elapsed:,.0f} requests/s')
+    print(f'latency p50 {percentiles[49] * 1e3:.3f} ms   '
+          f'p90 {percentiles[89] * 1e3:.3f} ms   '
+          f'p99 {percentiles[98] * 1e3:.3f} ms   '
+          f'max {latencies[-1] * 1e3:.3f} ms')
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--host', default=scale_server.DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=None)
+    parser.add_argument('--connections', type=int, default=50)
+    parser.add_argument('--requests', type=int, default=20000)
+    args = parser.parse_args(argv)
+    asyncio.run(run(args.host, args.port, args.connections, args.requests))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+"""
+Benchmark the backend hot paths and the Manager slots, and compare the results
+against a stored baseline.
+
+Every benchmark is reported as a ratio to a reference workload of plain Python
+timed in the same rounds, so the baseline holds across machines and system
+load. Rounds are interleaved across benchmarks and each ratio is the median
+over all rounds.
+
+Run from the repository root with `python -m benchmarks.suite`. The exit status
+is non-zero when any ratio exceeds its baseline by more than --threshold. Use
+--save-baseline to record the current results instead.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import timeit
+from typing import Callable
+from typing import Dict
+from typing import List
+
+# The Manager benchmarks need Qt but not a display
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from src import main as gui
+from src.backend import intervals
+from src.backend import notes
+from src.backend import scales
+from src.backend.chord_builder import ChordBuilder
+
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             'baseline.json')
+DEFAULT_THRESHOLD = 0.5
+REFERENCE = 'reference'
+
+
+def build_cases() -> Dict[str, Callable]:
+    """
+    Return benchmark name -> function to time. Each function runs once over
+    every key root so results are comparable between benchmarks.
+    """
+    roots = list(notes.ROOT_ACCIDENTALS_MAP)
+    chromatic_scales = [scales.ChromaticScale(root) for root in roots]
+    builders = [ChordBuilder(root) for root in roots]
+    key_signatures = gui.KeySignatures()
+    manager = gui.Manager()
+    rows = range(len(roots))
+
+    def chromatic_scale_notes():
+        for scale in chromatic_scales:
+            scale.notes
+
+    def major_scale():
+        for root in roots:
+            scales.MajorScale(root)
+
+    def generate_signature_name():
+        for root in roots:
+            key_signatures._generateSignatureName(root)
+
+    def on_root_index_changed():
+        for row in rows:
+            manager.onRootIndexChanged(row)
+
+    def on_key_signature_index_changed():
+        for row in rows:
+            manager.onKeySignatureIndexChanged(row)
+
+    def reference():
+        # Plain Python with no project code: dict and tuple work over the
+        # same roots, which the ratios are taken against
+        table = {}
+        for i, root in enumerate(roots):
+            table[root] = (i, root.name)
+        return sorted(table.values())
+
+    cases = {
+        REFERENCE: reference,
+        'ChromaticScale.notes': chromatic_scale_notes,
+        'MajorScale()': major_scale,
+        'KeySignatures._generateSignatureName': generate_signature_name,
+        'Manager.onRootIndexChanged': on_root_index_changed,
+        'Manager.onKeySignatureIndexChanged': on_key_signature_index_changed
+    }
+    for quality in intervals.ALL_CHORD_INTS:
+        def build_chord(quality=quality):
+            for builder in builders:
+                builder.build_chord(quality)
+
+        cases[f'ChordBuilder.build_chord({quality.value})'] = build_chord
+    return cases
+
+
+def run(cases: Dict[str, Callable], number: int,
+        repeat: int) -> Dict[str, float]:
+    """
+    Time every case in `repeat` interleaved rounds of `number` calls and
+    return benchmark name -> median ratio of its time to the reference case
+    in the same round.
+    """
+    timers = {name: timeit.Timer(func) for name, func in cases.items()}
+    ratios = {name: [] for name in cases if name != REFERENCE}
+    for _ in range(repeat):
+        reference = timers[REFERENCE].timeit(number)
+        for name in ratios:
+            ratios[name].append(timers[name].timeit(number) / reference)
+    return {name: statistics.median(values)
+            for name, values in ratios.items()}
+
+
+def find_regressions(results: Dict[str, float],
+                     baseline: Dict[str, float],
+                     threshold: float) -> List[str]:
+    """
+    Return the names of benchmarks whose ratio exceeds their baseline ratio by
+    more than `threshold`, as a fraction of the baseline.
+    """
+    return [name for name, ratio in results.items()
+            if name in baseline and ratio > baseline[name] * (1 + threshold)]
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Allowed slowdown as a fraction of the baseline '
+                             '(default: %(default)s).')
+    parser.add_argument('--number', type=int, default=500,
+                        help='Calls per timing round.')
+    parser.add_argument('--repeat', type=int, default=25,
+                        help='Timing rounds; the median is kept.')
+    parser.add_argument('--save-baseline', action='store_true')
+    args = parser.parse_args(argv)
+
+    results = run(build_cases(), args.number, args.repeat)
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    for name, ratio in results.items():
+        line = f'{name:<56} {ratio:8.3f}x ref'
+        if name in baseline:
+            change = ratio / baseline[name] - 1
+            line += f'  {change:+7.1%}'
+        print(line)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=4, sort_keys=True)
+            f.write('\n')
+        print(f'Saved baseline to {args.baseline}')
+        return 0
+
+    regressions = find_regressions(results, baseline, args.threshold)
+    for name in regressions:
+        print(f'REGRESSION: {name} is more than {args.threshold:.0%} slower '
+              f'than the baseline')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,22 @@
+import timeit
+from typing import Callable
+
+
+def time_per_call(func: Callable, number: int = 10000, repeat: int = 5) -> float:
+    """
+    Return the best time in seconds of a single call to `func` over `repeat`
+    rounds of `number` calls.
+    """
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def report(name: str, seconds: float, baseline: float = None):
+    """
+    Print a single benchmark result, optionally with its speedup over a
+    baseline time.
+    """
+    line = f'{name:<48} {seconds * 1e6:10.3f} us/call'
+    if baseline:
+        line += f'  ({baseline / seconds:5.1f}x)'
+    print(line)
@@ -20,7 +20,7 @@ Item {
             hoverEnabled: true
             onEntered: { rect.color = '#f5c26c' }
             onExited: { rect.color = '#2699fb' }
-            onClicked: { console.log(noteName.text) }
+            onClicked: { manager.playNote(noteName.text) }
         }
     }
     Text {
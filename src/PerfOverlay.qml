@@ -0,0 +1,18 @@
+import QtQuick 2.15
+
+Rectangle {
+    id: root
+    width: summaryText.implicitWidth + 12
+    height: summaryText.implicitHeight + 8
+    color: '#cc000000'
+    radius: 3
+
+    Text {
+        id: summaryText
+        anchors.centerIn: parent
+        text: instrumentation ? instrumentation.summary : ''
+        color: 'white'
+        font.family: 'monospace'
+        font.pointSize: 8
+    }
+}
@@ -0,0 +1,39 @@
+"""
+Print a scale and the chords built on its root without importing Qt.
+
+Run from the repository root with `python -m src.backend [ROOT] [SCALE]`,
+using Note and ScaleType member names, e.g. `python -m src.backend FSharp
+Dorian`.
+"""
+import argparse
+from typing import List
+from typing import Optional
+
+from . import intervals
+from .chord_builder import build_chord
+from .notes import Note
+from .notes import ROOT_ACCIDENTALS_MAP
+from .scales import scale_notes
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(prog='python -m src.backend',
+                                     description=__doc__.strip().split('\n')[0])
+    parser.add_argument('root', nargs='?', default=Note.C.name,
+                        choices=[root.name for root in ROOT_ACCIDENTALS_MAP])
+    parser.add_argument('scale', nargs='?',
+                        default=intervals.ScaleType.Major.name,
+                        choices=[scale.name for scale in intervals.ScaleType])
+    args = parser.parse_args(argv)
+
+    root = Note[args.root]
+    scale_type = intervals.ScaleType[args.scale]
+    names = ' '.join(note.value for note in scale_notes(root, scale_type))
+    print(f'{root.value} {scale_type.value}: {names}')
+    for quality in intervals.ALL_CHORD_INTS:
+        names = ' '.join(note.value for note in build_chord(root, quality))
+        print(f'{root.value} {quality.value}: {names}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,15 +1,46 @@
+import functools
 from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Union
 
 from . import intervals
 from .notes import Note
+from .pitch_class_set import PitchClassSet
 from .scales import ChromaticScale
+from .scales import chromatic_notes
+from .scales import uses_sharps
 
 
 NUM_NOTES = 12
 AUGMENTED_CHORDS = (intervals.Triad.Augmented,)
 
 
+@functools.lru_cache(maxsize=None)
+def build_chord(root: Note,
+                chord_quality: Union[intervals.Triad, intervals.SeventhChord],
+                sharps: Optional[bool] = None) -> Tuple[Note]:
+    """
+    Return the notes in a chord of `chord_quality` built on `root`. This never
+    mutates shared state, so it's safe to call from any number of threads.
+
+    :param root: The root note of the chord.
+    :param chord_quality: The quality of chord to build.
+    :param sharps: Whether to spell the chord with sharps instead of flats.
+        Only C can be spelled either way. Defaults to the root's spelling,
+        except for augmented chords on C, which use sharps.
+    :raise KeyError: if `root` can't be spelled with the requested accidentals.
+    """
+    if sharps is None:
+        if chord_quality in AUGMENTED_CHORDS and root == Note.C:
+            sharps = True
+        else:
+            sharps = uses_sharps(root)
+    chromatic = chromatic_notes(root, sharps)
+    return (root, *(chromatic[interval]
+                    for interval in intervals.ALL_CHORD_INTS[chord_quality]))
+
+
 class ChordBuilder:
 
     def __init__(self, root: Note):
@@ -72,14 +103,16 @@ class ChordBuilder:
 
         :param chord_quality: The quality of chord to build.
         """
-        chord_notes = [self._root]
-        reset_sharps = False
-        if chord_quality in AUGMENTED_CHORDS and self.root == Note.C:
-            self._chromatic_scale.use_sharps()
-            reset_sharps = True
-        chromatic_notes = self._chromatic_scale.notes
-        for interval in intervals.ALL_CHORD_INTS[chord_quality]:
-            chord_notes.append(chromatic_notes[interval])
-        if reset_sharps:
-            self._update_chromatic_scale()
-        return chord_notes
+        return list(build_chord(self._root, chord_quality))
+
+    def build_chord_set(self,
+                        chord_quality: Union[
+                            intervals.Triad, intervals.SeventhChord]
+                        ) -> PitchClassSet:
+        """
+        Return the pitch classes of a chord of `chord_quality` built on the
+        root of this builder.
+
+        :param chord_quality: The quality of chord to build.
+        """
+        return PitchClassSet.from_notes(build_chord(self._root, chord_quality))
@@ -0,0 +1,172 @@
+"""
+Parse chord charts such as 'Cmaj7 | F7 | Bbm7b5 E7 | Am' into chords.
+
+Files are memory-mapped and scanned with a regular expression, so chords are
+yielded lazily and memory use doesn't depend on the size of the file. Each
+distinct symbol is resolved once and then served from a bounded cache.
+"""
+import functools
+import mmap
+import re
+from typing import Iterator
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from . import intervals
+from .chord_builder import build_chord
+from .notes import Note
+from .notes import parse_note
+
+
+SYMBOL_CACHE_SIZE = 4096
+RAISE = 'raise'
+SKIP = 'skip'
+ERRORS = (RAISE, SKIP)
+
+# Anything but whitespace, bar lines, repeat signs and simile marks
+_SYMBOL_PATTERN = re.compile(rb'[^\s|:%]+')
+# No chord markings, which hold a bar silent rather than naming a chord
+_NO_CHORD_SYMBOLS = frozenset({b'N.C.', b'N.C', b'NC', b'n.c.', b'n.c'})
+_ROOT_PATTERN = re.compile(r'([A-Ga-g])([#♯b♭]?)(.*)')
+
+_QUALITY_SYMBOLS = {
+    intervals.Triad.Major: ('', 'M', 'maj', 'Maj'),
+    intervals.Triad.Minor: ('m', 'min', '-'),
+    intervals.Triad.Diminished: ('dim', '°', 'o'),
+    intervals.Triad.Augmented: ('aug', '+'),
+    intervals.SeventhChord.Major: ('maj7', 'Maj7', 'M7', 'ma7', 'Δ', 'Δ7'),
+    intervals.SeventhChord.Dominant: ('7', 'dom7'),
+    intervals.SeventhChord.Minor: ('m7', 'min7', '-7'),
+    intervals.SeventhChord.MinorMajor: ('mMaj7', 'mmaj7', 'mM7', 'm(maj7)',
+                                        'minmaj7', '-maj7', 'mΔ7'),
+    intervals.SeventhChord.HalfDiminished: ('m7b5', 'm7♭5', 'min7b5', '-7b5',
+                                            'ø', 'ø7'),
+    intervals.SeventhChord.Diminished: ('dim7', '°7', 'o7'),
+}
+QUALITIES = {symbol: quality
+             for quality, symbols in _QUALITY_SYMBOLS.items()
+             for symbol in symbols}
+
+
+class ChartChord(NamedTuple):
+    symbol: str
+    root: Note
+    quality: Union[intervals.Triad, intervals.SeventhChord]
+    # The note after a slash, e.g. E in C/E, or None
+    bass: Optional[Note]
+    notes: Tuple[Note, ...]
+
+
+def key_root(note: Note) -> Note:
+    """
+    Return `note`, or its enharmonic equivalent if `note` isn't the root of a
+    key in notes.ROOT_ACCIDENTALS_MAP, e.g. E♭ for D♯.
+    """
+    if note.info.key_type is not None:
+        return note
+    for enharmonic in note.info.enharmonics:
+        if enharmonic.info.key_type is not None:
+            return enharmonic
+    raise ValueError(f'{note} has no enharmonic key root.')
+
+
+@functools.lru_cache(maxsize=SYMBOL_CACHE_SIZE)
+def _resolve(symbol: bytes) -> Optional[ChartChord]:
+    """
+    Return the chord for `symbol`, or None if it can't be parsed. Failures
+    are cached too, so a chart full of the same typo stays fast.
+    """
+    try:
+        text = symbol.decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+    chord_text, slash, bass_text = text.partition('/')
+    if slash and not bass_text:
+        return None
+    match = _ROOT_PATTERN.fullmatch(chord_text)
+    if match is None:
+        return None
+    letter, accidental, quality_text = match.groups()
+    quality = QUALITIES.get(quality_text)
+    if quality is None:
+        return None
+    bass = None
+    try:
+        root = key_root(parse_note(letter + accidental))
+        if bass_text:
+            bass = parse_note(bass_text)
+    except ValueError:
+        return None
+    return ChartChord(text, root, quality, bass, build_chord(root, quality))
+
+
+def resolve_symbol(symbol: Union[str, bytes]) -> ChartChord:
+    """
+    Return the chord for a symbol such as 'Bbm7b5' or 'C/E'. Roots that aren't
+    key roots are respelled, so 'D#m' is resolved as E♭ minor.
+
+    :raise ValueError: if `symbol` isn't a recognized chord symbol.
+    """
+    if isinstance(symbol, str):
+        symbol = symbol.encode('utf-8')
+    chord = _resolve(symbol)
+    if chord is None:
+        raise ValueError(f'{symbol.decode("utf-8", "replace")!r} is not a '
+                         f'chord symbol.')
+    return chord
+
+
+def symbol_cache_info():
+    """
+    Return the hit/miss statistics of the symbol cache.
+    """
+    return _resolve.cache_info()
+
+
+def clear_symbol_cache():
+    """
+    Empty the symbol cache and reset its statistics.
+    """
+    _resolve.cache_clear()
+
+
+def iter_chords(buffer: Union[bytes, mmap.mmap],
+                errors: str = RAISE) -> Iterator[ChartChord]:
+    """
+    Yield the chord for each symbol in a UTF-8 chart. Bar lines, repeat signs
+    (|: and :|), simile marks (%) and whitespace separate symbols, and no
+    chord markings (N.C.) are passed over.
+
+    :param errors: RAISE to stop at the first unrecognized symbol, or SKIP to
+        leave it out.
+    :raise ValueError: on an unrecognized symbol when errors is RAISE.
+    """
+    if errors not in ERRORS:
+        raise ValueError(f'errors must be one of {ERRORS}, not {errors!r}.')
+    for match in _SYMBOL_PATTERN.finditer(buffer):
+        symbol = match.group()
+        chord = _resolve(symbol)
+        if chord is not None:
+            yield chord
+        elif symbol in _NO_CHORD_SYMBOLS:
+            continue
+        elif errors == RAISE:
+            msg = f'{symbol.decode("utf-8", "replace")!r} at byte ' \
+                  f'{match.start()} is not a chord symbol.'
+            raise ValueError(msg)
+
+
+def iter_chart_file(path: str, errors: str = RAISE) -> Iterator[ChartChord]:
+    """
+    Yield the chords of the chart in the file at `path`. See iter_chords().
+    """
+    with open(path, 'rb') as f:
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            return
+        with buffer:
+            yield from iter_chords(buffer, errors)
@@ -0,0 +1,85 @@
+"""
+Identify chords from the notes they contain.
+
+Every chord in intervals.ALL_CHORD_INTS on every pitch class is indexed once by
+its 12-bit pitch class mask, so identifying a chord is a single dict lookup.
+"""
+from typing import Dict
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+from . import intervals
+from .notes import Note
+from .notes import PITCH_CLASSES
+from .notes import pitch_class_mask
+
+
+NUM_NOTES = 12
+
+ChordQuality = Union[intervals.Triad, intervals.SeventhChord]
+
+
+class ChordMatch(NamedTuple):
+    """
+    A chord identified from a collection of notes. `inversion` is 0 for root
+    position, 1 for first inversion, etc., based on the lowest note.
+    """
+    root: Note
+    quality: ChordQuality
+    inversion: int
+
+
+def _build_chord_index() -> Dict[int, Tuple[Tuple[int, ChordQuality,
+                                                    Tuple[int, ...]], ...]]:
+    """
+    Return a pitch class mask -> (root pitch class, quality, chord offsets)
+    index of every chord quality on every pitch class. Symmetric chords like
+    augmented triads and diminished 7ths map one mask to several roots.
+    """
+    index = {}
+    for root_pc in range(NUM_NOTES):
+        for quality, chord_ints in intervals.ALL_CHORD_INTS.items():
+            offsets = (0, *chord_ints)
+            mask = 0
+            for offset in offsets:
+                mask |= 1 << ((root_pc + offset) % NUM_NOTES)
+            index.setdefault(mask, []).append((root_pc, quality, offsets))
+    return {mask: tuple(chords) for mask, chords in index.items()}
+
+
+_CHORD_INDEX = _build_chord_index()
+
+
+def identify_chords(notes: Sequence[Note]) -> Tuple[ChordMatch, ...]:
+    """
+    Return every chord whose pitch classes are exactly those of `notes`.
+    Doubled notes are allowed. The first note is taken as the bass to work out
+    the inversion; matches with the bass as their root come first.
+
+    :param notes: The notes of the chord, lowest first.
+    """
+    if not notes:
+        return ()
+    candidates = _CHORD_INDEX.get(pitch_class_mask(notes), ())
+    bass_pc = PITCH_CLASSES[notes[0]]
+    spelled = {PITCH_CLASSES[note]: note for note in reversed(notes)}
+    matches = []
+    for root_pc, quality, offsets in candidates:
+        inversion = offsets.index((bass_pc - root_pc) % NUM_NOTES)
+        matches.append(ChordMatch(spelled[root_pc], quality, inversion))
+    matches.sort(key=lambda match: match.inversion != 0)
+    return tuple(matches)
+
+
+def identify_chord(notes: Sequence[Note]) -> Optional[ChordMatch]:
+    """
+    Return the chord made up of `notes`, or None if they don't form a chord
+    in intervals.ALL_CHORD_INTS. See identify_chords().
+
+    :param notes: The notes of the chord, lowest first.
+    """
+    matches = identify_chords(notes)
+    return matches[0] if matches else None
@@ -0,0 +1,109 @@
+"""
+Stream major scales and chords as JSON lines or CSV rows.
+
+Records are produced by generators and written one at a time, so memory use
+doesn't grow with the number of roots.
+"""
+import csv
+import json
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Sequence
+from typing import TextIO
+from typing import Tuple
+from typing import Union
+
+from . import intervals
+from .chord_builder import build_chord
+from .notes import Note
+from .notes import ROOT_ACCIDENTALS_MAP
+from .scales import scale_notes
+
+
+JSONL = 'jsonl'
+CSV = 'csv'
+FORMATS = (JSONL, CSV)
+
+SCALE = 'scale'
+CHORD = 'chord'
+FIELDS = ('root', 'type', 'name', 'notes')
+
+Record = Dict[str, Union[str, List[str]]]
+ChordQuality = Union[intervals.Triad, intervals.SeventhChord]
+
+
+def default_roots() -> List[Note]:
+    """
+    Return every root in notes.USED_KEYS, ordered by key signature.
+    """
+    return list(ROOT_ACCIDENTALS_MAP)
+
+
+def iter_records(roots: Iterable[Note]) -> Iterator[Record]:
+    """
+    Yield the major scale and then every chord in intervals.ALL_CHORD_INTS
+    for each root.
+    """
+    for root in roots:
+        yield _record(root, SCALE, intervals.ScaleType.Major.value,
+                      scale_notes(root, intervals.ScaleType.Major))
+        for quality in intervals.ALL_CHORD_INTS:
+            yield _record(root, CHORD, quality.value,
+                          build_chord(root, quality))
+
+
+def iter_chord_records(chords: Iterable[Tuple[Note, ChordQuality,
+                                              Sequence[Note]]]
+                       ) -> Iterator[Record]:
+    """
+    Yield a chord record for each (root, quality, notes) in `chords`, e.g. the
+    ChartChords of a parsed chord chart.
+    """
+    for root, quality, notes in chords:
+        yield _record(root, CHORD, quality.value, notes)
+
+
+def write_jsonl(records: Iterable[Record], stream: TextIO) -> int:
+    """
+    Write each record to `stream` as a line of JSON and return the number of
+    records written.
+    """
+    count = 0
+    for record in records:
+        stream.write(json.dumps(record, ensure_ascii=False))
+        stream.write('\n')
+        count += 1
+    return count
+
+
+def write_csv(records: Iterable[Record], stream: TextIO) -> int:
+    """
+    Write each record to `stream` as a CSV row, with the notes separated by
+    spaces, and return the number of records written.
+    """
+    writer = csv.writer(stream)
+    writer.writerow(FIELDS)
+    count = 0
+    for record in records:
+        writer.writerow([record['root'], record['type'], record['name'],
+                         ' '.join(record['notes'])])
+        count += 1
+    return count
+
+
+WRITERS = {
+    JSONL: write_jsonl,
+    CSV: write_csv
+}
+
+
+def _record(root: Note, record_type: str, name: str,
+            notes: Iterable[Note]) -> Record:
+    return {
+        'root': root.value,
+        'type': record_type,
+        'name': name,
+        'notes': [note.value for note in notes]
+    }
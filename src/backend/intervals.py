@@ -82,9 +82,53 @@ SEVENTH_CHORDS = {
 
 ALL_CHORD_INTS = {**TRIADS, **SEVENTH_CHORDS}
 
-MAJOR_SCALE_INTS = (INTERVALS[Interval.M2],
-                    INTERVALS[Interval.M2],
-                    INTERVALS[Interval.m2],
-                    INTERVALS[Interval.M2],
-                    INTERVALS[Interval.M2],
-                    INTERVALS[Interval.M2])
+# ==============================================================================
+# Scales
+# ==============================================================================
+
+# Scales are stored as the steps between consecutive degrees, starting from the
+# root.
+_m2 = INTERVALS[Interval.m2]
+_M2 = INTERVALS[Interval.M2]
+_m3 = INTERVALS[Interval.m3]
+
+MAJOR_SCALE_INTS = (_M2, _M2, _m2, _M2, _M2, _M2)
+
+
+class ScaleType(Enum):
+    Major = 'Major'
+    Dorian = 'Dorian'
+    Phrygian = 'Phrygian'
+    Lydian = 'Lydian'
+    Mixolydian = 'Mixolydian'
+    NaturalMinor = 'Natural Minor'
+    Locrian = 'Locrian'
+    HarmonicMinor = 'Harmonic Minor'
+    MelodicMinor = 'Melodic Minor'
+    MajorPentatonic = 'Major Pentatonic'
+    MinorPentatonic = 'Minor Pentatonic'
+    Blues = 'Blues'
+
+
+SCALE_INTS = {
+    ScaleType.Major: MAJOR_SCALE_INTS,
+    ScaleType.Dorian: (_M2, _m2, _M2, _M2, _M2, _m2),
+    ScaleType.Phrygian: (_m2, _M2, _M2, _M2, _m2, _M2),
+    ScaleType.Lydian: (_M2, _M2, _M2, _m2, _M2, _M2),
+    ScaleType.Mixolydian: (_M2, _M2, _m2, _M2, _M2, _m2),
+    ScaleType.NaturalMinor: (_M2, _m2, _M2, _M2, _m2, _M2),
+    ScaleType.Locrian: (_m2, _M2, _M2, _m2, _M2, _M2),
+    ScaleType.HarmonicMinor: (_M2, _m2, _M2, _M2, _m2, _m3),
+    ScaleType.MelodicMinor: (_M2, _m2, _M2, _M2, _M2, _M2),
+    ScaleType.MajorPentatonic: (_M2, _M2, _m3, _M2),
+    ScaleType.MinorPentatonic: (_m3, _M2, _M2, _m3),
+    ScaleType.Blues: (_m3, _M2, _m2, _m2, _m3)
+}
+
+# Letters of the degrees of scales that don't have seven notes, as steps from
+# the root's letter. Seven-note scales use one letter per degree.
+SCALE_LETTERS = {
+    ScaleType.MajorPentatonic: (0, 1, 2, 4, 5),
+    ScaleType.MinorPentatonic: (0, 2, 3, 4, 6),
+    ScaleType.Blues: (0, 2, 3, 4, 4, 6)
+}
@@ -0,0 +1,55 @@
+"""
+Find the keys whose scales contain a set of notes.
+
+The pitch class mask of every scale type on every key root is built once at
+import, so each query is a handful of integer ANDs and popcount lookups.
+"""
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from .intervals import ScaleType
+from .notes import Note
+from .notes import ROOT_ACCIDENTALS_MAP
+from .notes import pitch_class_mask
+from .scales import scale_notes
+
+
+NUM_NOTES = 12
+_POPCOUNT = bytes(bin(mask).count('1') for mask in range(1 << NUM_NOTES))
+
+_SCALE_MASKS = {
+    scale_type: tuple((root, pitch_class_mask(scale_notes(root, scale_type)))
+                      for root in ROOT_ACCIDENTALS_MAP)
+    for scale_type in ScaleType
+}
+
+
+def keys_containing(notes: Iterable[Note],
+                    scale_type: ScaleType = ScaleType.Major) -> List[Note]:
+    """
+    Return the roots in notes.ROOT_ACCIDENTALS_MAP whose `scale_type` scale
+    contains the pitch classes of every note in `notes`. Enharmonic keys, such
+    as C♯ and D♭, are both returned.
+    """
+    mask = pitch_class_mask(notes)
+    return [root for root, key_mask in _SCALE_MASKS[scale_type]
+            if mask & key_mask == mask]
+
+
+def closest_keys(notes: Iterable[Note],
+                 scale_type: ScaleType = ScaleType.Major,
+                 count: Optional[int] = None) -> List[Tuple[Note, int]]:
+    """
+    Return (root, number of pitch classes outside the key) pairs for the keys
+    closest to `notes`, best first. Ties keep the order of
+    notes.ROOT_ACCIDENTALS_MAP.
+
+    :param count: The maximum number of keys to return. All keys by default.
+    """
+    mask = pitch_class_mask(notes)
+    distances = [(root, _POPCOUNT[mask & ~key_mask])
+                 for root, key_mask in _SCALE_MASKS[scale_type]]
+    distances.sort(key=lambda distance: distance[1])
+    return distances[:count]
@@ -0,0 +1,153 @@
+"""
+Write scales and chords as Standard MIDI Files.
+
+Each track is encoded into a single preallocated buffer sized for its
+worst case, and a whole file is written with one call.
+"""
+import os
+from typing import BinaryIO
+from typing import Iterable
+from typing import List
+from typing import Sequence
+
+from . import intervals
+from .notes import Note
+from .pitched import iter_chord
+from .pitched import iter_scale
+from .pitched import midi_number
+
+
+TICKS_PER_BEAT = 480
+DEFAULT_VELOCITY = 96
+NOTE_ON = 0x90
+NOTE_OFF = 0x80
+_END_OF_TRACK = b'\xff\x2f\x00'
+_MAX_DELTA_SIZE = 4
+_EVENT_SIZE = 3
+
+# A step is the MIDI numbers sounding together for one duration
+Step = Sequence[int]
+
+
+def _write_delta(buffer: memoryview, offset: int, value: int) -> int:
+    """
+    Write `value` as a variable-length quantity at `offset` and return the
+    offset after it.
+    """
+    if value < 0x80:
+        buffer[offset] = value
+        return offset + 1
+    groups = [value & 0x7f]
+    value >>= 7
+    while value:
+        groups.append(value & 0x7f | 0x80)
+        value >>= 7
+    for byte in reversed(groups):
+        buffer[offset] = byte
+        offset += 1
+    return offset
+
+
+def encode_track(steps: Sequence[Step],
+                 duration: int = TICKS_PER_BEAT,
+                 velocity: int = DEFAULT_VELOCITY,
+                 channel: int = 0) -> bytes:
+    """
+    Return a complete MTrk chunk playing each step for `duration` ticks.
+
+    :raise ValueError: if a MIDI number, velocity or channel is out of range.
+    """
+    if not 0 <= velocity < 0x80 or not 0 <= channel < 0x10:
+        raise ValueError(f'Invalid velocity {velocity} or channel {channel}.')
+    num_events = 2 * sum(len(step) for step in steps)
+    size = 8 + num_events * (_MAX_DELTA_SIZE + _EVENT_SIZE) \
+        + _MAX_DELTA_SIZE + len(_END_OF_TRACK)
+    data = bytearray(size)
+    buffer = memoryview(data)
+    buffer[:4] = b'MTrk'
+    offset = 8
+    note_on = NOTE_ON | channel
+    note_off = NOTE_OFF | channel
+    rest = 0
+    for step in steps:
+        if not step:
+            rest += duration
+            continue
+        for i, midi in enumerate(step):
+            if not 0 <= midi < 0x80:
+                raise ValueError(f'Invalid MIDI number {midi}.')
+            offset = _write_delta(buffer, offset, 0 if i else rest)
+            buffer[offset:offset + 3] = bytes((note_on, midi, velocity))
+            offset += 3
+        for i, midi in enumerate(step):
+            offset = _write_delta(buffer, offset, 0 if i else duration)
+            buffer[offset:offset + 3] = bytes((note_off, midi, 0))
+            offset += 3
+        rest = 0
+    offset = _write_delta(buffer, offset, rest)
+    buffer[offset:offset + 3] = _END_OF_TRACK
+    offset += 3
+    buffer[4:8] = (offset - 8).to_bytes(4, 'big')
+    return bytes(buffer[:offset])
+
+
+def encode_file(tracks: Sequence[bytes],
+                ticks_per_beat: int = TICKS_PER_BEAT) -> bytes:
+    """
+    Return a Standard MIDI File containing encoded `tracks`. A single track
+    is written as format 0, several as format 1.
+    """
+    midi_format = 0 if len(tracks) == 1 else 1
+    header = b'MThd' + (6).to_bytes(4, 'big') \
+        + midi_format.to_bytes(2, 'big') + len(tracks).to_bytes(2, 'big') \
+        + ticks_per_beat.to_bytes(2, 'big')
+    return b''.join((header, *tracks))
+
+
+def write_file(tracks: Sequence[bytes], stream: BinaryIO) -> int:
+    """
+    Write a Standard MIDI File to `stream` and return the number of bytes
+    written.
+    """
+    return stream.write(encode_file(tracks))
+
+
+def scale_steps(root: Note, octave: int = 4) -> List[Step]:
+    """
+    Return one octave of the major scale on `root`, one note per step.
+    """
+    low = midi_number(root, octave)
+    return [(note.midi,) for note in iter_scale(root, low, low + 12)]
+
+
+def chord_steps(root: Note, octave: int = 4) -> List[Step]:
+    """
+    Return every chord in intervals.ALL_CHORD_INTS on `root` in root position,
+    one chord per step.
+    """
+    return [tuple(note.midi for note in iter_chord(root, quality,
+                                                   octave=octave))
+            for quality in intervals.ALL_CHORD_INTS]
+
+
+def encode_key(root: Note) -> bytes:
+    """
+    Return a format 1 file with the major scale and the chords on `root`.
+    """
+    return encode_file((encode_track(scale_steps(root)),
+                        encode_track(chord_steps(root), 2 * TICKS_PER_BEAT)))
+
+
+def export_keys(roots: Iterable[Note], directory: str) -> List[str]:
+    """
+    Write a file for each root to `directory`, named after the Note member,
+    and return their paths.
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for root in roots:
+        path = os.path.join(directory, f'{root.name}.mid')
+        with open(path, 'wb') as f:
+            f.write(encode_key(root))
+        paths.append(path)
+    return paths
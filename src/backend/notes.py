@@ -1,4 +1,13 @@
 import enum
+import functools
+import sys
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import Union
 
 
 class Note(enum.Enum):
@@ -24,6 +33,14 @@ class Note(enum.Enum):
     BSharp = 'B♯'
     CFlat = 'C♭'
 
+    @functools.cached_property
+    def info(self) -> 'NoteInfo':
+        """
+        Return the precomputed NoteInfo of this note. Cached on the member
+        after the first access, so it costs as little as a plain attribute.
+        """
+        return NOTE_INFO[self]
+
 
 CHROMATIC_NOTES_SHARPS = (
     Note.C,
@@ -95,3 +112,187 @@ ROOT_ACCIDENTALS_MAP = {
     **_ROOT_FLATS_MAP,
     **_ROOT_SHARPS_MAP
 }
+
+# ==============================================================================
+# Integer representation
+# ==============================================================================
+
+SHARP_SIGN = '♯'
+FLAT_SIGN = '♭'
+LETTER_NAMES = ('C', 'D', 'E', 'F', 'G', 'A', 'B')
+_LETTER_PITCH_CLASSES = (0, 2, 4, 5, 7, 9, 11)
+_ACCIDENTAL_OFFSETS = {'': 0, SHARP_SIGN: 1, FLAT_SIGN: -1}
+
+# The spelling code of a note is the index of its letter in LETTER_NAMES, so a
+# (pitch class, letter) pair identifies a Note exactly.
+LETTERS = {note: LETTER_NAMES.index(note.value[0]) for note in Note}
+PITCH_CLASSES = {
+    note: (_LETTER_PITCH_CLASSES[LETTERS[note]]
+           + _ACCIDENTAL_OFFSETS[note.value[1:]]) % 12
+    for note in Note
+}
+# (pitch class, letter) -> the Note spelled that way, if there is one
+NOTE_SPELLINGS = {(PITCH_CLASSES[note], LETTERS[note]): note for note in Note}
+
+
+# ==============================================================================
+# Per-note attributes
+# ==============================================================================
+
+class KeyType(enum.Enum):
+    Natural = 'Natural'
+    Sharp = 'Sharp'
+    Flat = 'Flat'
+
+
+class NoteInfo(NamedTuple):
+    pitch_class: int
+    letter: int
+    # -1 for a flat, 0 for a natural and 1 for a sharp
+    accidental: int
+    # None for notes that aren't the root of a key in ROOT_ACCIDENTALS_MAP
+    key_type: Optional[KeyType]
+    num_accidentals: Optional[int]
+    enharmonics: Tuple[Note, ...]
+
+
+def _build_note_info(note: Note) -> NoteInfo:
+    """
+    Gather everything the backend looks up about `note` into one record.
+    """
+    key_type = None
+    if note == Note.C:
+        key_type = KeyType.Natural
+    elif note in _SHARP_KEYS:
+        key_type = KeyType.Sharp
+    elif note in _FLAT_KEYS:
+        key_type = KeyType.Flat
+    return NoteInfo(
+        pitch_class=PITCH_CLASSES[note],
+        letter=LETTERS[note],
+        accidental=_ACCIDENTAL_OFFSETS[note.value[1:]],
+        key_type=key_type,
+        num_accidentals=ROOT_ACCIDENTALS_MAP.get(note),
+        enharmonics=tuple(other for other in Note
+                          if other != note
+                          and PITCH_CLASSES[other] == PITCH_CLASSES[note]))
+
+
+NOTE_INFO = {note: _build_note_info(note) for note in Note}
+
+
+def pitch_class_mask(notes: Iterable[Note]) -> int:
+    """
+    Return the 12-bit mask with bit `n` set for every note of pitch class `n`.
+    """
+    mask = 0
+    for note in notes:
+        mask |= 1 << PITCH_CLASSES[note]
+    return mask
+
+
+# ==============================================================================
+# Parsing
+# ==============================================================================
+
+# Accidental suffixes accepted after a letter, in lowercase. Besides the signs
+# this covers ASCII, English words and the -is/-es names like cis and des
+# shared by Dutch and German.
+_SHARP_SUFFIXES = (SHARP_SIGN, '#', 'is', 'sharp', ' sharp', '-sharp')
+_FLAT_SUFFIXES = (FLAT_SIGN, 'b', 'es', 'flat', ' flat', '-flat')
+# Vowel letters drop the e of -es: es, as. Dutch also writes ees, aes.
+_VOWEL_FLATS = {'e': ('s', 'es'), 'a': ('s', 'es')}
+# German calls B natural H and B flat plain B.
+_GERMAN_LETTER_NAMES = {'b': 'h'}
+_GERMAN_B = 'b'
+
+
+def _build_note_names(german: bool = False) -> Dict[str, Note]:
+    """
+    Return a table of every accepted spelling of every note. Each spelling is
+    stored in lowercase, capitalized and uppercase so that common input
+    needs a single lookup.
+
+    :param german: spell B natural as h (his, h#, ...) and B flat as b.
+        B♭ and B♯ keep their sign spellings.
+    """
+    suffixes = {'': 0, **{suffix: 1 for suffix in _SHARP_SUFFIXES},
+                **{suffix: -1 for suffix in _FLAT_SUFFIXES}}
+    notes = {(LETTERS[note], _ACCIDENTAL_OFFSETS[note.value[1:]]): note
+             for note in Note}
+    names = {}
+    for letter, letter_name in enumerate(LETTER_NAMES):
+        letter_name = letter_name.lower()
+        letter_suffixes = dict(suffixes)
+        for suffix in _VOWEL_FLATS.get(letter_name, ()):
+            letter_suffixes[suffix] = -1
+        if german:
+            letter_name = _GERMAN_LETTER_NAMES.get(letter_name, letter_name)
+        for suffix, accidental in letter_suffixes.items():
+            note = notes.get((letter, accidental))
+            if note is None:
+                continue
+            name = letter_name + suffix
+            for variant in (name, name.capitalize(), name.upper()):
+                names[sys.intern(variant)] = note
+    for note in Note:
+        names[sys.intern(note.name)] = note
+    if german:
+        # Spellings with a sign such as B♭ and B♯ are unambiguous, so every
+        # Note value except a bare 'B' parses as itself
+        for note in Note:
+            if note.value[1:]:
+                for variant in (note.value, note.value.lower()):
+                    names[sys.intern(variant)] = note
+        # Overrides the enum name 'B' as well
+        for variant in (_GERMAN_B, _GERMAN_B.upper()):
+            names[sys.intern(variant)] = Note.BFlat
+    return names
+
+
+_NOTE_NAMES = _build_note_names()
+_GERMAN_NOTE_NAMES = _build_note_names(german=True)
+
+
+def parse_note(name: str, german: bool = False) -> Note:
+    """
+    Return the Note spelled `name`, e.g. 'C#', 'Db', 'cis', 'es', 'F sharp',
+    'B♭' or 'FSharp', in any case. Letters are English, so 'b' is B natural
+    and 'h' isn't a note.
+
+    :param german: read German letters instead, where 'h' is B natural and
+        'b' is B flat
+    :raise ValueError: if `name` isn't a recognized note name.
+    """
+    names = _GERMAN_NOTE_NAMES if german else _NOTE_NAMES
+    note = names.get(name)
+    if note is None:
+        note = names.get(name.strip().lower())
+        if note is None:
+            raise ValueError(f'{name!r} is not a note name.')
+    return note
+
+
+def parse_notes(names: Union[str, bytes, Iterable[str]],
+                german: bool = False) -> List[Note]:
+    """
+    Parse each note name in `names`, which is either an iterable of names or
+    a whitespace-separated buffer of them. Spellings containing a space, like
+    'F sharp', only work in an iterable.
+
+    :param german: read German letters, see parse_note()
+    :raise ValueError: if any name isn't a recognized note name.
+    """
+    if isinstance(names, bytes):
+        names = names.decode('utf-8')
+    if isinstance(names, str):
+        names = names.split()
+    elif not isinstance(names, list):
+        names = list(names)
+    notes = list(map((_GERMAN_NOTE_NAMES if german else _NOTE_NAMES).get,
+                     names))
+    if None in notes:
+        # Only names that aren't stored verbatim take the slow path
+        notes = [note if note is not None else parse_note(name, german)
+                 for name, note in zip(names, notes)]
+    return notes
@@ -0,0 +1,166 @@
+"""
+An immutable set of pitch classes stored as a 12-bit integer mask.
+"""
+from typing import Iterable
+from typing import Iterator
+from typing import Tuple
+from typing import Union
+
+from .notes import Note
+from .notes import PITCH_CLASSES
+from .notes import pitch_class_mask
+
+
+NUM_NOTES = 12
+_ALL_PITCH_CLASSES = (1 << NUM_NOTES) - 1
+_MASK_PITCH_CLASSES = tuple(
+    tuple(pc for pc in range(NUM_NOTES) if mask >> pc & 1)
+    for mask in range(1 << NUM_NOTES)
+)
+
+
+class PitchClassSet:
+    """
+    A set of pitch classes (0-11) where C is 0. Set algebra and transposition
+    are done with bit operations on the mask. There are only 4096 possible
+    sets, so every instance is shared: equal sets are the same object.
+    """
+
+    __slots__ = ('_mask',)
+
+    def __new__(cls, pitch_classes: Iterable[int] = ()):
+        """
+        :param pitch_classes: Integer pitch classes. Values outside 0-11 are
+            wrapped into the octave.
+        """
+        mask = 0
+        for pitch_class in pitch_classes:
+            mask |= 1 << (pitch_class % NUM_NOTES)
+        return _SETS[mask]
+
+    @classmethod
+    def from_mask(cls, mask: int) -> 'PitchClassSet':
+        """
+        Return the set with bit `n` of `mask` set for every pitch class `n`.
+        """
+        return _SETS[mask & _ALL_PITCH_CLASSES]
+
+    @classmethod
+    def from_notes(cls, notes: Iterable[Note]) -> 'PitchClassSet':
+        """
+        Return the set of pitch classes of `notes`.
+        """
+        return _SETS[pitch_class_mask(notes)]
+
+    @property
+    def mask(self) -> int:
+        return self._mask
+
+    def __contains__(self, item: Union[int, Note]) -> bool:
+        if isinstance(item, Note):
+            item = PITCH_CLASSES[item]
+        return bool(self._mask >> (item % NUM_NOTES) & 1)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(_MASK_PITCH_CLASSES[self._mask])
+
+    def __len__(self) -> int:
+        return len(_MASK_PITCH_CLASSES[self._mask])
+
+    def __bool__(self) -> bool:
+        return bool(self._mask)
+
+    def __hash__(self) -> int:
+        return self._mask
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PitchClassSet):
+            return self._mask == other._mask
+        return NotImplemented
+
+    def __le__(self, other: 'PitchClassSet') -> bool:
+        if not isinstance(other, PitchClassSet):
+            return NotImplemented
+        return self._mask & other._mask == self._mask
+
+    def __ge__(self, other: 'PitchClassSet') -> bool:
+        if not isinstance(other, PitchClassSet):
+            return NotImplemented
+        return self._mask & other._mask == other._mask
+
+    def __or__(self, other: 'PitchClassSet') -> 'PitchClassSet':
+        if not isinstance(other, PitchClassSet):
+            return NotImplemented
+        return _SETS[self._mask | other._mask]
+
+    def __and__(self, other: 'PitchClassSet') -> 'PitchClassSet':
+        if not isinstance(other, PitchClassSet):
+            return NotImplemented
+        return _SETS[self._mask & other._mask]
+
+    def __sub__(self, other: 'PitchClassSet') -> 'PitchClassSet':
+        if not isinstance(other, PitchClassSet):
+            return NotImplemented
+        return _SETS[self._mask & ~other._mask]
+
+    def __xor__(self, other: 'PitchClassSet') -> 'PitchClassSet':
+        if not isinstance(other, PitchClassSet):
+            return NotImplemented
+        return _SETS[self._mask ^ other._mask]
+
+    def __repr__(self) -> str:
+        return f'PitchClassSet({list(self)})'
+
+    def __reduce__(self):
+        return PitchClassSet.from_mask, (self._mask,)
+
+    # Named like the set methods. Going through the operators raises
+    # TypeError for other types instead of returning NotImplemented.
+    def union(self, other: 'PitchClassSet') -> 'PitchClassSet':
+        return self | other
+
+    def intersection(self, other: 'PitchClassSet') -> 'PitchClassSet':
+        return self & other
+
+    def difference(self, other: 'PitchClassSet') -> 'PitchClassSet':
+        return self - other
+
+    def symmetric_difference(self, other: 'PitchClassSet'
+                             ) -> 'PitchClassSet':
+        return self ^ other
+
+    def issubset(self, other: 'PitchClassSet') -> bool:
+        return self <= other
+
+    def issuperset(self, other: 'PitchClassSet') -> bool:
+        return self >= other
+
+    def complement(self) -> 'PitchClassSet':
+        """
+        Return the pitch classes not in this set.
+        """
+        return _SETS[~self._mask & _ALL_PITCH_CLASSES]
+
+    def transpose(self, semitones: int) -> 'PitchClassSet':
+        """
+        Return this set transposed up by `semitones` by rotating the mask.
+        """
+        semitones %= NUM_NOTES
+        mask = self._mask
+        rotated = (mask << semitones) | (mask >> (NUM_NOTES - semitones))
+        return _SETS[rotated & _ALL_PITCH_CLASSES]
+
+
+def _build_sets() -> Tuple[PitchClassSet, ...]:
+    """
+    Create the shared instance of every possible set.
+    """
+    sets = []
+    for mask in range(1 << NUM_NOTES):
+        pitch_class_set = object.__new__(PitchClassSet)
+        pitch_class_set._mask = mask
+        sets.append(pitch_class_set)
+    return tuple(sets)
+
+
+_SETS = _build_sets()
@@ -0,0 +1,246 @@
+"""
+Batch operations on integer-encoded notes.
+
+Every Note has a note code (its position in NOTES). Arrays of note codes,
+pitch classes (0-11) and roots can be transposed, spelled or expanded into
+scales in a single vectorized call.
+"""
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Sequence
+from typing import Union
+
+import numpy as np
+
+from . import intervals
+from .chord_builder import ChordBuilder
+from .notes import Note
+from .notes import LETTERS
+from .notes import LETTER_NAMES
+from .notes import NOTE_SPELLINGS
+from .notes import PITCH_CLASSES
+from .notes import ROOT_ACCIDENTALS_MAP
+from .scales import ChromaticScale
+
+
+NUM_NOTES = 12
+NOTES = tuple(Note)
+NOTE_CODES = {note: code for code, note in enumerate(NOTES)}
+
+PITCH_CLASS = np.array([PITCH_CLASSES[note] for note in NOTES], dtype=np.int8)
+LETTER = np.array([LETTERS[note] for note in NOTES], dtype=np.int8)
+_NOTE_ARRAY = np.array(NOTES, dtype=object)
+# Padding code -1 maps to the trailing empty name.
+_NAME_ARRAY = np.array([note.value for note in NOTES] + [''], dtype=object)
+
+CHORD_QUALITIES = tuple(intervals.ALL_CHORD_INTS)
+MAX_CHORD_TONES = 1 + max(len(chord_ints)
+                          for chord_ints in intervals.ALL_CHORD_INTS.values())
+_QUALITY_INDICES = {quality: i for i, quality in enumerate(CHORD_QUALITIES)}
+
+
+def _build_spelling_table() -> np.ndarray:
+    """
+    Return a (note code, pitch class) -> note code table holding the spelling
+    of each pitch class in the chromatic scale of every conventional root.
+    Rows for roots that aren't conventional keys are filled with -1.
+    """
+    table = np.full((len(NOTES), NUM_NOTES), -1, dtype=np.int8)
+    for root in ROOT_ACCIDENTALS_MAP:
+        for note in ChromaticScale(root).notes:
+            table[NOTE_CODES[root], PITCH_CLASSES[note]] = NOTE_CODES[note]
+    return table
+
+
+def _build_chord_table() -> np.ndarray:
+    """
+    Return a (note code, chord quality index, chord tone) -> note code table of
+    every chord in intervals.ALL_CHORD_INTS on every conventional root. Missing
+    chord tones and roots that aren't conventional keys are filled with -1.
+    """
+    table = np.full((len(NOTES), len(CHORD_QUALITIES), MAX_CHORD_TONES), -1,
+                    dtype=np.int8)
+    for root in ROOT_ACCIDENTALS_MAP:
+        builder = ChordBuilder(root)
+        for i, quality in enumerate(CHORD_QUALITIES):
+            chord_notes = builder.build_chord(quality)
+            table[NOTE_CODES[root], i, :len(chord_notes)] = encode(chord_notes)
+    return table
+
+
+_SPELLING = _build_spelling_table()
+_KEY_ROOTS = np.zeros(len(NOTES), dtype=bool)
+_KEY_ROOTS[[NOTE_CODES[root] for root in ROOT_ACCIDENTALS_MAP]] = True
+
+
+def _build_transposition_table() -> np.ndarray:
+    """
+    Return a (source root code, target root code, note code) -> note code
+    table transposing every note from one key to another.
+
+    Notes keep their letter distance from the root where the result exists as
+    a Note, so a raised fourth stays a raised fourth. Otherwise, e.g. where it
+    would need a double sharp, the target key's chromatic spelling is used.
+    The last note column maps the padding code -1 to itself.
+    """
+    table = np.full((len(NOTES), len(NOTES), len(NOTES) + 1), -1,
+                    dtype=np.int8)
+    for source in ROOT_ACCIDENTALS_MAP:
+        for target in ROOT_ACCIDENTALS_MAP:
+            semitones = PITCH_CLASSES[target] - PITCH_CLASSES[source]
+            letters = LETTERS[target] - LETTERS[source]
+            row = table[NOTE_CODES[source], NOTE_CODES[target]]
+            for code, note in enumerate(NOTES):
+                pitch_class = (PITCH_CLASSES[note] + semitones) % NUM_NOTES
+                letter = (LETTERS[note] + letters) % len(LETTER_NAMES)
+                spelled = NOTE_SPELLINGS.get((pitch_class, letter))
+                row[code] = NOTE_CODES[spelled] if spelled is not None \
+                    else _SPELLING[NOTE_CODES[target], pitch_class]
+    return table
+
+
+_TRANSPOSITION = _build_transposition_table()
+
+
+def _are_key_roots(roots: np.ndarray) -> bool:
+    """
+    Return whether every code in `roots` is the code of a key root. Codes are
+    range checked first, since negative ones would index from the end.
+    """
+    return bool(((roots >= 0) & (roots < len(NOTES))).all()) and \
+        bool(_KEY_ROOTS[roots].all())
+
+
+def encode(notes: Iterable[Note]) -> np.ndarray:
+    """
+    Return the note codes of `notes` as an array.
+    """
+    return np.fromiter((NOTE_CODES[note] for note in notes), dtype=np.int8)
+
+
+def decode(codes: np.ndarray) -> np.ndarray:
+    """
+    Return an object array of Note enums with the same shape as `codes`.
+    """
+    return _NOTE_ARRAY[np.asarray(codes)]
+
+
+def decode_list(codes: np.ndarray) -> List:
+    """
+    Return the Note enums of `codes` as (nested) lists.
+    """
+    return decode(codes).tolist()
+
+
+def pitch_classes(codes: np.ndarray) -> np.ndarray:
+    """
+    Return the pitch class of every note code in `codes`.
+    """
+    return PITCH_CLASS[np.asarray(codes)]
+
+
+def transpose(pitch_classes: np.ndarray, semitones) -> np.ndarray:
+    """
+    Transpose `pitch_classes` by `semitones`. Both arguments broadcast against
+    each other, so a single call can transpose many notes into many keys.
+    """
+    pitch_classes = np.asarray(pitch_classes, dtype=np.int64)
+    semitones = np.asarray(semitones, dtype=np.int64)
+    return ((pitch_classes + semitones) % NUM_NOTES).astype(np.int8)
+
+
+def spell(pitch_classes: np.ndarray, roots: np.ndarray) -> np.ndarray:
+    """
+    Return the note codes of `pitch_classes` spelled as in the chromatic scale
+    of the matching root codes in `roots`. Both arguments broadcast.
+
+    :raise ValueError: if any root isn't a conventional key root.
+    """
+    codes = _SPELLING[np.asarray(roots), np.asarray(pitch_classes)]
+    if (codes < 0).any():
+        raise ValueError('Every root must be a key root in '
+                         'notes.ROOT_ACCIDENTALS_MAP.')
+    return codes
+
+
+def transpose_notes(codes: np.ndarray, semitones, roots: np.ndarray
+                    ) -> np.ndarray:
+    """
+    Transpose the note codes in `codes` by `semitones` and spell the results
+    in the chromatic scales of `roots`. All arguments broadcast.
+    """
+    return spell(transpose(pitch_classes(codes), semitones), roots)
+
+
+def transpose_key(codes: np.ndarray, source_roots, target_roots
+                  ) -> np.ndarray:
+    """
+    Transpose the note codes in `codes` from the keys of `source_roots` to the
+    keys of `target_roots`, spelled for the target keys, in a single lookup.
+    Codes of -1, such as the padding in ChordTable.codes, stay -1, so whole
+    progressions can be transposed at once. All arguments broadcast.
+
+    :raise ValueError: if any root isn't a key root in
+        notes.ROOT_ACCIDENTALS_MAP, or any code is neither a note code nor -1.
+    """
+    source_roots = np.asarray(source_roots)
+    target_roots = np.asarray(target_roots)
+    codes = np.asarray(codes)
+    if not (_are_key_roots(source_roots) and _are_key_roots(target_roots)):
+        raise ValueError('Every root must be a key root in '
+                         'notes.ROOT_ACCIDENTALS_MAP.')
+    if ((codes < -1) | (codes >= len(NOTES))).any():
+        raise ValueError('Every code must be a note code or -1.')
+    return _TRANSPOSITION[source_roots, target_roots, codes]
+
+
+def scale_degrees(roots: np.ndarray,
+                  scale_ints: Sequence[int] = intervals.MAJOR_SCALE_INTS
+                  ) -> np.ndarray:
+    """
+    Return the note codes of the scale built from `scale_ints` on every root
+    code in `roots`. The result has shape `roots.shape + (num_degrees,)`.
+
+    :param roots: Note codes of the scale roots.
+    :param scale_ints: The steps between consecutive scale degrees, as in
+        intervals.MAJOR_SCALE_INTS.
+    """
+    roots = np.asarray(roots)[..., np.newaxis]
+    offsets = np.cumsum((0, *scale_ints))
+    return spell(transpose(PITCH_CLASS[roots], offsets), roots)
+
+
+_CHORD_TABLE = _build_chord_table()
+
+
+class ChordTable(NamedTuple):
+    """
+    Chords for many roots and qualities. `codes` has shape
+    (roots, qualities, MAX_CHORD_TONES) and is padded with -1 where a chord has
+    fewer tones; `names` holds the matching note names, padded with ''.
+    """
+    codes: np.ndarray
+    names: np.ndarray
+
+
+def build_chords(roots: np.ndarray,
+                 qualities: Sequence[Union[intervals.Triad,
+                                           intervals.SeventhChord]]
+                 = CHORD_QUALITIES) -> ChordTable:
+    """
+    Build every chord of `qualities` on every root code in `roots` in a single
+    lookup into the precomputed chord table.
+
+    :param roots: 1-D array of root note codes.
+    :param qualities: The chord qualities to build on each root.
+    :raise ValueError: if any root isn't a conventional key root.
+    """
+    roots = np.asarray(roots)
+    quality_indices = np.array([_QUALITY_INDICES[quality]
+                                for quality in qualities], dtype=np.intp)
+    codes = _CHORD_TABLE[roots[:, np.newaxis], quality_indices]
+    if (codes[..., 0] < 0).any():
+        raise ValueError('Every root must be a key root in '
+                         'notes.ROOT_ACCIDENTALS_MAP.')
+    return ChordTable(codes, _NAME_ARRAY[codes])
@@ -0,0 +1,94 @@
+"""
+Octave-aware notes: MIDI note numbers paired with their spelled Note.
+
+The generators here yield notes lazily, so arbitrarily long ranges can be
+consumed with constant memory.
+"""
+from typing import Iterator
+from typing import NamedTuple
+from typing import Tuple
+from typing import Union
+
+from . import intervals
+from .chord_builder import build_chord
+from .notes import Note
+from .notes import PITCH_CLASSES
+from .scales import scale_notes
+
+
+NUM_NOTES = 12
+MIDI_MIN = 0
+MIDI_MAX = 127
+_LETTER_PITCH_CLASSES = (0, 2, 4, 5, 7, 9, 11)
+
+ChordQuality = Union[intervals.Triad, intervals.SeventhChord]
+
+
+def midi_number(note: Note, octave: int) -> int:
+    """
+    Return the MIDI number of `note` in scientific pitch notation, where C4 is
+    60. The octave follows the letter, so B♯3 is 60 and C♭4 is 59.
+    """
+    return (octave + 1) * NUM_NOTES + _LETTER_PITCH_CLASSES[note.info.letter] \
+        + note.info.accidental
+
+
+class PitchedNote(NamedTuple):
+    midi: int
+    note: Note
+
+    @property
+    def octave(self) -> int:
+        """
+        Return the octave of the note's letter, e.g. 3 for B♯ at MIDI 60.
+        """
+        return (self.midi - self.note.info.accidental) // NUM_NOTES - 1
+
+    @property
+    def name(self) -> str:
+        return f'{self.note.value}{self.octave}'
+
+
+def iter_scale(root: Note,
+               low: int,
+               high: int,
+               scale: Union[intervals.ScaleType, Tuple[int, ...]]
+               = intervals.ScaleType.Major) -> Iterator[PitchedNote]:
+    """
+    Yield the notes of a scale on `root` with MIDI numbers in [low, high],
+    ascending.
+
+    :param scale: A ScaleType, or a tuple of the steps between consecutive
+        degrees in semitones.
+    """
+    degrees = {PITCH_CLASSES[note]: note for note in scale_notes(root, scale)}
+    for midi in range(max(low, MIDI_MIN), min(high, MIDI_MAX) + 1):
+        note = degrees.get(midi % NUM_NOTES)
+        if note is not None:
+            yield PitchedNote(midi, note)
+
+
+def iter_chord(root: Note,
+               quality: ChordQuality,
+               inversion: int = 0,
+               octave: int = 4) -> Iterator[PitchedNote]:
+    """
+    Yield the notes of a chord in close position from the bass up.
+
+    :param inversion: 0 for root position, 1 for first inversion, etc.
+    :param octave: The octave of the bass note.
+    :raise ValueError: if the chord has no such inversion.
+    """
+    chord_notes = build_chord(root, quality)
+    if not 0 <= inversion < len(chord_notes):
+        msg = f'{quality.value} has no inversion {inversion}.'
+        raise ValueError(msg)
+    previous = None
+    for i in range(len(chord_notes)):
+        note = chord_notes[(inversion + i) % len(chord_notes)]
+        if previous is None:
+            midi = midi_number(note, octave)
+        else:
+            midi = previous + (PITCH_CLASSES[note] - previous) % NUM_NOTES
+        yield PitchedNote(midi, note)
+        previous = midi
@@ -0,0 +1,249 @@
+"""
+Play rendered audio on a dedicated thread.
+
+Callers, such as Qt slots on the GUI thread, hand pre-rendered buffers to a
+Player through a bounded queue and return immediately. The audio thread
+mixes everything that is sounding into fixed-size blocks and writes them to
+a sink. Notes in a sequence are placed at exact frame offsets from a common
+start, so their timing doesn't depend on when the thread wakes up.
+"""
+import collections
+import queue
+import threading
+import time
+import wave
+from typing import Deque
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+
+from . import intervals
+from .midi import Step
+from .midi import scale_steps
+from .notes import Note
+from .pitched import iter_chord
+from .pitched import midi_number
+from .synth import DEFAULT_DURATION
+from .synth import SAMPLE_RATE
+from .synth import Timbre
+from .synth import render_note
+from .synth import to_pcm16
+
+
+BLOCK_SIZE = 256
+QUEUE_SIZE = 64
+WRITE_TIMES_SIZE = 4096
+
+# Buffers to start at a frame offset from the start of the schedule
+Schedule = List[Tuple[int, np.ndarray]]
+
+
+def schedule_steps(steps: Sequence[Step],
+                   duration: float = DEFAULT_DURATION,
+                   timbre: Timbre = Timbre.Sine,
+                   sample_rate: int = SAMPLE_RATE) -> Schedule:
+    """
+    Return a schedule playing `steps` one after another, each lasting
+    `duration`. Notes in a step are scaled so the step keeps the peak level
+    of a single note.
+    """
+    step_size = int(round(duration * sample_rate))
+    schedule = []
+    for i, step in enumerate(steps):
+        for midi in step:
+            samples = render_note(midi, duration, timbre, sample_rate)
+            if len(step) > 1:
+                samples = samples / len(step)
+            schedule.append((i * step_size, samples))
+    return schedule
+
+
+class NullSink:
+    """
+    Discard samples, recording when they were written. With `realtime` set,
+    writes are paced like a sound card consuming them at the sample rate.
+    """
+
+    def __init__(self, sample_rate: int = SAMPLE_RATE, realtime: bool = True):
+        self.sample_rate = sample_rate
+        self.realtime = realtime
+        self.frames_written = 0
+        # perf_counter() at which the first sample after reset() was written
+        self.first_sound_time: Optional[float] = None
+        self.first_sound_frame: Optional[int] = None
+        self.write_times: Deque[float] = collections.deque(
+            maxlen=WRITE_TIMES_SIZE)
+        self._clock_start = None
+
+    def reset(self):
+        self.first_sound_time = None
+        self.first_sound_frame = None
+        self.write_times.clear()
+
+    def write(self, samples: np.ndarray):
+        now = time.perf_counter()
+        if self.realtime:
+            if self._clock_start is None:
+                self._clock_start = now - self.frames_written / self.sample_rate
+            due = self._clock_start + self.frames_written / self.sample_rate
+            if due > now:
+                time.sleep(due - now)
+                now = time.perf_counter()
+            else:
+                # Restart the clock after an idle gap instead of catching up
+                self._clock_start = now - self.frames_written / self.sample_rate
+        if self.first_sound_time is None:
+            nonzero = np.flatnonzero(samples)
+            if len(nonzero):
+                self.first_sound_time = now
+                self.first_sound_frame = self.frames_written + int(nonzero[0])
+        self.write_times.append(now)
+        self.frames_written += len(samples)
+
+    def close(self):
+        pass
+
+
+class WavSink:
+    """
+    Write samples to a mono 16-bit WAV file.
+    """
+
+    def __init__(self, path: str, sample_rate: int = SAMPLE_RATE):
+        self.sample_rate = sample_rate
+        self._wav = wave.open(path, 'wb')
+        self._wav.setnchannels(1)
+        self._wav.setsampwidth(2)
+        self._wav.setframerate(sample_rate)
+
+    def write(self, samples: np.ndarray):
+        self._wav.writeframes(to_pcm16(samples))
+
+    def close(self):
+        self._wav.close()
+
+
+class Player:
+    """
+    Mix scheduled buffers into blocks on an audio thread and write them to a
+    sink. The thread idles without writing while nothing is sounding.
+    """
+
+    def __init__(self, sink, block_size: int = BLOCK_SIZE,
+                 queue_size: int = QUEUE_SIZE):
+        """
+        :param sink: An object with write(samples) and close() methods and a
+            sample_rate attribute, e.g. NullSink or WavSink. The block passed
+            to write() is reused, so sinks must copy anything they keep.
+        """
+        self._sink = sink
+        self._block_size = block_size
+        self._queue = queue.Queue(queue_size)
+        self._thread = None
+        self.dropped = 0
+
+    @property
+    def sample_rate(self) -> int:
+        return self._sink.sample_rate
+
+    @property
+    def block_size(self) -> int:
+        return self._block_size
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='audio',
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Finish playing everything queued, then stop the thread and close the
+        sink.
+        """
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        self._sink.close()
+
+    def play(self, schedule: Schedule) -> bool:
+        """
+        Start playing `schedule` at the next block without waiting. Return
+        False if the queue is full and the schedule was dropped.
+        """
+        try:
+            self._queue.put_nowait(schedule)
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def play_note(self, note: Note, octave: int = 4,
+                  duration: float = DEFAULT_DURATION,
+                  timbre: Timbre = Timbre.Sine) -> bool:
+        midi = midi_number(note, octave)
+        return self.play([(0, render_note(midi, duration, timbre,
+                                          self.sample_rate))])
+
+    def play_scale(self, root: Note, octave: int = 4,
+                   duration: float = DEFAULT_DURATION,
+                   timbre: Timbre = Timbre.Sine) -> bool:
+        return self.play(schedule_steps(scale_steps(root, octave), duration,
+                                        timbre, self.sample_rate))
+
+    def play_chord(self, root: Note,
+                   quality: Union[intervals.Triad, intervals.SeventhChord],
+                   inversion: int = 0, octave: int = 4,
+                   duration: float = 2 * DEFAULT_DURATION,
+                   timbre: Timbre = Timbre.Sine) -> bool:
+        step = tuple(note.midi for note in iter_chord(root, quality,
+                                                      inversion, octave))
+        return self.play(schedule_steps((step,), duration, timbre,
+                                        self.sample_rate))
+
+    def _run(self):
+        block_size = self._block_size
+        block = np.zeros(block_size, dtype=np.float32)
+        # [start frame, samples] of everything sounding or about to
+        voices = []
+        frame = 0
+        stopping = False
+        while True:
+            if not voices and not stopping:
+                # Nothing to mix, so wait for work rather than write silence
+                schedule = self._queue.get()
+                if schedule is None:
+                    break
+                voices.extend([frame + offset, samples]
+                              for offset, samples in schedule)
+            while True:
+                try:
+                    schedule = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if schedule is None:
+                    stopping = True
+                    continue
+                voices.extend([frame + offset, samples]
+                              for offset, samples in schedule)
+            if stopping and not voices:
+                break
+
+            block.fill(0.0)
+            end = frame + block_size
+            for voice in voices:
+                start, samples = voice
+                if start >= end:
+                    continue
+                offset = max(start, frame)
+                block[offset - frame:min(end, start + len(samples)) - frame] \
+                    += samples[offset - start:end - start]
+            voices = [voice for voice in voices
+                      if voice[0] + len(voice[1]) > end]
+            np.clip(block, -1.0, 1.0, out=block)
+            self._sink.write(block)
+            frame = end
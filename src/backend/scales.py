@@ -1,7 +1,9 @@
+import functools
 from typing import Optional
 from typing import Tuple
 from typing import List
 from typing import Any
+from typing import Union
 
 from . import intervals
 from .notes import Note
@@ -10,6 +12,16 @@ from .notes import CHROMATIC_NOTES_SHARPS
 from .notes import ROOT_ACCIDENTALS_MAP
 from .notes import FLAT_KEYS
 from .notes import SHARP_KEYS
+from .notes import KeyType
+from .notes import LETTERS
+from .notes import LETTER_NAMES
+from .notes import NOTE_SPELLINGS
+from .notes import PITCH_CLASSES
+from .pitch_class_set import PitchClassSet
+
+
+NUM_NOTES = 12
+SCALE_CACHE_SIZE = 1024
 
 
 def replace_list_item(input_list: List, item_1: Any, item_2: Any):
@@ -22,6 +34,79 @@ def replace_list_item(input_list: List, item_1: Any, item_2: Any):
     input_list[idx] = item_2
 
 
+def _build_chromatic_notes(root: Note, sharps: bool) -> Tuple[Note]:
+    """
+    Build the notes of a chromatic scale starting with `root`, spelled with
+    sharps or flats. E♯/B♯ and C♭/F♭ are used for keys with more than five
+    sharps or flats, respectively.
+
+    :param root: The root note to use for this scale.
+    :param sharps: Whether to spell the scale with sharps instead of flats.
+    """
+    if sharps:
+        chr_notes = list(CHROMATIC_NOTES_SHARPS)
+        num_sharps = ROOT_ACCIDENTALS_MAP[root]
+        if num_sharps > 5:
+            replace_list_item(chr_notes, Note.F, Note.ESharp)
+        if num_sharps == 7:
+            replace_list_item(chr_notes, Note.C, Note.BSharp)
+    else:
+        chr_notes = list(CHROMATIC_NOTES_FLATS)
+        num_flats = ROOT_ACCIDENTALS_MAP[root]
+        if num_flats > 5:
+            replace_list_item(chr_notes, Note.B, Note.CFlat)
+        if num_flats == 7:
+            replace_list_item(chr_notes, Note.E, Note.FFlat)
+    root_idx = chr_notes.index(root)
+    return tuple(chr_notes[root_idx:] + chr_notes[:root_idx])
+
+
+# Every supported (root, sharps) spelling is built once at import so scales
+# only ever hand out these shared tuples.
+_CHROMATIC_SCALES = {
+    **{(root, True): _build_chromatic_notes(root, True)
+       for root in (Note.C, *SHARP_KEYS)},
+    **{(root, False): _build_chromatic_notes(root, False)
+       for root in (Note.C, *FLAT_KEYS)}
+}
+
+
+# Looking up enum members on their class is slow, so the checks below compare
+# against these instead.
+_SHARP_KEY = KeyType.Sharp
+_FLAT_KEY = KeyType.Flat
+
+
+def uses_sharps(root: Note) -> bool:
+    """
+    Return whether the chromatic scale of `root` is spelled with sharps by
+    default. Roots from sharp or flat keys can only have sharps or flats,
+    respectively. C defaults to flats.
+
+    :raise RuntimeError: if `root` isn't a conventional root note.
+    """
+    try:
+        key_type = root.info.key_type
+    except AttributeError:
+        key_type = None
+    if key_type is not None:
+        return key_type is _SHARP_KEY
+    msg = f'{root} is either not a Note enum or is an unconventional root' \
+          f' note.'
+    raise RuntimeError(msg)
+
+
+def chromatic_notes(root: Note, sharps: bool) -> Tuple[Note]:
+    """
+    Return the precomputed chromatic scale starting with `root`.
+
+    :param root: The root note of the scale.
+    :param sharps: Whether to spell the scale with sharps instead of flats.
+    :raise KeyError: if `root` can't be spelled with the requested accidentals.
+    """
+    return _CHROMATIC_SCALES[root, sharps]
+
+
 class ChromaticScale:
     """
     An ascending chromatic scale starting with any natural, single sharp, or
@@ -61,17 +146,7 @@ class ChromaticScale:
         respectively. C defaults to flats but can be changed by use_sharps()
         or use_flats().
         """
-        if self._root in SHARP_KEYS:
-            sharps = True
-        elif self._root in FLAT_KEYS:
-            sharps = False
-        elif self._root == Note.C:
-            sharps = False
-        else:
-            msg = f'{self._root} is either not a Note enum or is an' \
-                  f' unconventional root note.'
-            raise RuntimeError(msg)
-        self._sharps = sharps
+        self._sharps = uses_sharps(self._root)
 
     @property
     def notes(self) -> Tuple[Note]:
@@ -100,43 +175,94 @@ class ChromaticScale:
         Return the notes of a chromatic scale of only sharp variations of notes
         starting with self._root.
         """
-        if self._root in FLAT_KEYS:
+        if self._root.info.key_type is _FLAT_KEY:
             msg = f'The scale root must belong to a sharp key in order to' \
                   f' produce a scale with sharp notes, not {self._root}.'
             raise RuntimeError(msg)
-        chr_notes = list(CHROMATIC_NOTES_SHARPS)
-        num_sharps = ROOT_ACCIDENTALS_MAP[self._root]
-        if num_sharps > 5:
-            replace_list_item(chr_notes, Note.F, Note.ESharp)
-        if num_sharps == 7:
-            replace_list_item(chr_notes, Note.C, Note.BSharp)
-        root_idx = chr_notes.index(self._root)
-        return tuple(chr_notes[root_idx:] + chr_notes[:root_idx])
+        return _CHROMATIC_SCALES[self._root, True]
 
     def _get_scale_notes_flats(self) -> Tuple[Note]:
         """
         Return the notes of a chromatic scale of only flat variations of notes
         starting with self._root.
         """
-        if self._root in SHARP_KEYS:
+        if self._root.info.key_type is _SHARP_KEY:
             msg = f'The scale root must belong to a flat key in order to' \
                   f' produce a scale with flat notes, not {self._root}.'
             raise RuntimeError(msg)
-        chr_notes = list(CHROMATIC_NOTES_FLATS)
-        num_flats = ROOT_ACCIDENTALS_MAP[self._root]
-        if num_flats > 5:
-            replace_list_item(chr_notes, Note.B, Note.CFlat)
-        if num_flats == 7:
-            replace_list_item(chr_notes, Note.E, Note.FFlat)
-        root_idx = chr_notes.index(self._root)
-        return tuple(chr_notes[root_idx:] + chr_notes[:root_idx])
+        return _CHROMATIC_SCALES[self._root, False]
 
 
-class MajorScale:
+@functools.lru_cache(maxsize=SCALE_CACHE_SIZE)
+def scale_notes(root: Note,
+                scale: Union[intervals.ScaleType, Tuple[int, ...]]
+                = intervals.ScaleType.Major) -> Tuple[Note]:
+    """
+    Return the notes of a scale built on `root`. Seven-note scales use one
+    letter per degree and the other ScaleTypes use the letters in
+    intervals.SCALE_LETTERS, so D natural minor has B♭ rather than A♯. Degrees
+    that would need a double sharp or flat, and other user-defined scales,
+    are spelled as in the root's chromatic scale. Results are memoized per
+    (root, scale); see scale_cache_info().
 
-    def __init__(self, root: Optional[Note] = Note.C):
+    :param root: The root note of the scale.
+    :param scale: A ScaleType, or a tuple of the steps between consecutive
+        degrees in semitones, like intervals.MAJOR_SCALE_INTS.
+    :raise ValueError: if the steps don't fit within an octave.
+    """
+    scale_ints = intervals.SCALE_INTS.get(scale, scale)
+    if sum(scale_ints) >= NUM_NOTES or min(scale_ints, default=1) < 1:
+        msg = f'Scale steps must be positive and span less than an octave,' \
+              f' not {scale_ints}.'
+        raise ValueError(msg)
+    chromatic_notes = ChromaticScale(root).notes
+    letters = intervals.SCALE_LETTERS.get(scale)
+    if letters is None and len(scale_ints) == len(LETTER_NAMES) - 1:
+        letters = range(len(LETTER_NAMES))
+    root_pitch_class = PITCH_CLASSES[root]
+    degree_notes = [root]
+    current_int = 0
+    for degree, interval in enumerate(scale_ints, start=1):
+        current_int += interval
+        note = None
+        if letters is not None:
+            letter = (LETTERS[root] + letters[degree]) % len(LETTER_NAMES)
+            note = NOTE_SPELLINGS.get(
+                ((root_pitch_class + current_int) % NUM_NOTES, letter))
+        degree_notes.append(note or chromatic_notes[current_int])
+    return tuple(degree_notes)
+
+
+def scale_cache_info():
+    """
+    Return the hit/miss statistics of the scale_notes() cache.
+    """
+    return scale_notes.cache_info()
+
+
+def clear_scale_cache():
+    """
+    Empty the scale_notes() cache and reset its statistics.
+    """
+    scale_notes.cache_clear()
+
+
+class Scale:
+    """
+    A scale of any ScaleType or user-defined interval pattern.
+    """
+
+    def __init__(self,
+                 root: Optional[Note] = Note.C,
+                 scale: Union[intervals.ScaleType, Tuple[int, ...]]
+                 = intervals.ScaleType.Major):
+        """
+        :param root: The root note to use for this scale.
+        :param scale: A ScaleType, or a tuple of the steps between consecutive
+            degrees in semitones.
+        """
         self._root = None
-        self._chromatic_scale = None
+        self._scale = scale
         self._notes = None
         self.root = root
 
@@ -149,28 +275,37 @@ class MajorScale:
         self._root = root
         self._update_scale()
 
+    @property
+    def scale(self) -> Union[intervals.ScaleType, Tuple[int, ...]]:
+        return self._scale
+
     @property
     def notes(self) -> Optional[Tuple[Note]]:
         """
-        Return a list of notes in the currect major scale. None if no root is
-        set.
+        Return a tuple of notes in the current scale. None if no root is set.
         """
         return self._notes
 
+    @property
+    def pitch_class_set(self) -> Optional[PitchClassSet]:
+        """
+        Return the pitch classes of the current scale. None if no root is set.
+        """
+        if self._notes is None:
+            return None
+        return PitchClassSet.from_notes(self._notes)
+
     def _update_scale(self):
         """
-        Update the chromatic and major scale based on the current root note.
+        Update the scale notes based on the current root note.
         """
         if not self.root:
-            self._chromatic_scale = None
             self._notes = None
             return
-        self._chromatic_scale = ChromaticScale(self.root)
-        scale_notes = [self._root]
-        chromatic_notes = self._chromatic_scale.notes
-        current_int = 0
-        for interval in intervals.MAJOR_SCALE_INTS:
-            current_int += interval
-            scale_notes.append(chromatic_notes[current_int])
-        self._notes = tuple(scale_notes)
+        self._notes = scale_notes(self.root, self._scale)
+
 
+class MajorScale(Scale):
+
+    def __init__(self, root: Optional[Note] = Note.C):
+        super().__init__(root, intervals.ScaleType.Major)
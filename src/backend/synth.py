@@ -0,0 +1,204 @@
+"""
+Synthesize notes, scales and chords as NumPy sample buffers.
+
+Oscillators and envelopes are computed over whole arrays. Rendered notes are
+memoized per (MIDI number, duration, timbre), so a scale or chord is mostly
+a matter of mixing cached buffers.
+"""
+import enum
+import functools
+import os
+import wave
+from typing import BinaryIO
+from typing import Iterable
+from typing import List
+from typing import Sequence
+from typing import Union
+
+import numpy as np
+
+from . import intervals
+from .midi import Step
+from .midi import chord_steps
+from .midi import scale_steps
+from .notes import Note
+from .pitched import iter_chord
+
+
+SAMPLE_RATE = 44100
+NOTE_CACHE_SIZE = 512
+DEFAULT_DURATION = 0.5
+ATTACK = 0.01
+DECAY = 0.1
+SUSTAIN_LEVEL = 0.7
+RELEASE = 0.05
+# Leaves headroom when several notes are mixed
+PEAK = 0.8
+
+
+class Timbre(enum.Enum):
+    Sine = 'Sine'
+    Organ = 'Organ'
+    Reed = 'Reed'
+
+
+# Relative amplitudes of the fundamental and its overtones
+_HARMONICS = {
+    Timbre.Sine: (1.0,),
+    Timbre.Organ: (1.0, 0.5, 0.25, 0.125),
+    Timbre.Reed: (1.0, 0.0, 0.33, 0.0, 0.2, 0.0, 0.14),
+}
+
+
+def frequency(midi: int) -> float:
+    """
+    Return the equal-tempered frequency of a MIDI number, with A4 at 440 Hz.
+    """
+    return 440.0 * 2.0 ** ((midi - 69) / 12)
+
+
+def envelope(num_samples: int, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """
+    Return an attack-decay-sustain-release envelope over `num_samples`. The
+    stages are shortened proportionally for very short notes.
+    """
+    duration = num_samples / sample_rate
+    scale = min(1.0, duration / (ATTACK + DECAY + RELEASE))
+    attack, decay, release = (stage * scale
+                              for stage in (ATTACK, DECAY, RELEASE))
+    times = np.arange(num_samples, dtype=np.float32) / sample_rate
+    return np.interp(times,
+                     (0.0, attack, attack + decay, duration - release,
+                      duration),
+                     (0.0, 1.0, SUSTAIN_LEVEL, SUSTAIN_LEVEL, 0.0)
+                     ).astype(np.float32)
+
+
+@functools.lru_cache(maxsize=NOTE_CACHE_SIZE)
+def render_note(midi: int,
+                duration: float = DEFAULT_DURATION,
+                timbre: Timbre = Timbre.Sine,
+                sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """
+    Return the samples of a single note as a read-only float32 array in
+    [-1, 1]. Results are memoized; see note_cache_info().
+    """
+    num_samples = int(round(duration * sample_rate))
+    harmonics = _HARMONICS[timbre]
+    nyquist = sample_rate / 2
+    phase = (2 * np.pi * frequency(midi) / sample_rate) \
+        * np.arange(num_samples, dtype=np.float64)
+    samples = np.zeros(num_samples, dtype=np.float64)
+    for n, amplitude in enumerate(harmonics, start=1):
+        # Overtones above the Nyquist frequency would alias
+        if amplitude and n * frequency(midi) < nyquist:
+            samples += amplitude * np.sin(n * phase)
+    samples *= PEAK / sum(harmonics)
+    samples = samples.astype(np.float32) * envelope(num_samples, sample_rate)
+    samples.setflags(write=False)
+    return samples
+
+
+def note_cache_info():
+    """
+    Return the hit/miss statistics of the render_note() cache.
+    """
+    return render_note.cache_info()
+
+
+def clear_note_cache():
+    """
+    Empty the render_note() cache and reset its statistics.
+    """
+    render_note.cache_clear()
+
+
+def render_steps(steps: Sequence[Step],
+                 duration: float = DEFAULT_DURATION,
+                 timbre: Timbre = Timbre.Sine,
+                 sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """
+    Return the samples of `steps` played one after another, each lasting
+    `duration`. Notes in a step are mixed and scaled to keep the peak level.
+    """
+    step_size = int(round(duration * sample_rate))
+    out = np.zeros(len(steps) * step_size, dtype=np.float32)
+    for i, step in enumerate(steps):
+        if not step:
+            continue
+        segment = out[i * step_size:(i + 1) * step_size]
+        for midi in step:
+            segment += render_note(midi, duration, timbre, sample_rate)
+        segment /= len(step)
+    return out
+
+
+def render_scale(root: Note,
+                 duration: float = DEFAULT_DURATION,
+                 timbre: Timbre = Timbre.Sine,
+                 octave: int = 4) -> np.ndarray:
+    """
+    Return one ascending octave of the major scale on `root`.
+    """
+    return render_steps(scale_steps(root, octave), duration, timbre)
+
+
+def render_chord(root: Note,
+                 quality: Union[intervals.Triad, intervals.SeventhChord],
+                 duration: float = 2 * DEFAULT_DURATION,
+                 timbre: Timbre = Timbre.Sine,
+                 octave: int = 4) -> np.ndarray:
+    """
+    Return a chord in root position with its bass in `octave`.
+    """
+    step = tuple(note.midi for note in iter_chord(root, quality,
+                                                  octave=octave))
+    return render_steps((step,), duration, timbre)
+
+
+def render_key(root: Note,
+               duration: float = DEFAULT_DURATION,
+               timbre: Timbre = Timbre.Sine) -> np.ndarray:
+    """
+    Return the major scale on `root` followed by each of its chords.
+    """
+    return np.concatenate((
+        render_steps(scale_steps(root), duration, timbre),
+        render_steps(chord_steps(root), 2 * duration, timbre)))
+
+
+def to_pcm16(samples: np.ndarray) -> bytes:
+    """
+    Return float samples in [-1, 1] as little-endian 16-bit PCM.
+    """
+    pcm = np.clip(samples, -1.0, 1.0) * np.iinfo(np.int16).max
+    return pcm.astype('<i2').tobytes()
+
+
+def write_wav(samples: np.ndarray,
+              f: Union[str, BinaryIO],
+              sample_rate: int = SAMPLE_RATE):
+    """
+    Write mono samples to the path or binary file `f` as a 16-bit WAV file.
+    """
+    with wave.open(f, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(to_pcm16(samples))
+
+
+def export_keys(roots: Iterable[Note],
+                directory: str,
+                timbre: Timbre = Timbre.Sine) -> List[str]:
+    """
+    Render each root with render_key() to a WAV file in `directory`, named
+    after the Note member, and return their paths.
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for root in roots:
+        path = os.path.join(directory, f'{root.name}.wav')
+        write_wav(render_key(root, timbre=timbre), path)
+        paths.append(path)
+    return paths
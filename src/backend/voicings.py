@@ -0,0 +1,172 @@
+"""
+Enumerate every voicing of every chord quality within a MIDI pitch range.
+
+A voicing is an ascending set of MIDI notes that covers every chord tone, with
+optional doubled tones, no wider than a maximum span. The work is sharded by
+root, quality and a run of bass notes across a process pool and streamed back
+in chunks.
+"""
+import collections
+import functools
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from . import intervals
+from .chord_builder import build_chord
+from .notes import Note
+from .notes import PITCH_CLASSES
+
+
+NUM_NOTES = 12
+CLOSE = 'close'
+OPEN = 'open'
+DEFAULT_MAX_SPAN = 24
+DEFAULT_CHUNK_SIZE = 10000
+# Bass notes per shard. Bigger shards amortize inter-process overhead, and
+# the count caps how many voicings a shard can hold.
+BASS_NOTES_PER_SHARD = 12
+
+ChordQuality = Union[intervals.Triad, intervals.SeventhChord]
+
+
+class Voicing(NamedTuple):
+    """
+    `midi` holds the MIDI note numbers from low to high. `inversion` is 0 when
+    the root is in the bass. Only these fields are stored, which keeps
+    voicings cheap to send between processes; the rest is derived on access.
+    """
+    root: Note
+    quality: ChordQuality
+    midi: Tuple[int, ...]
+    inversion: int
+
+    @property
+    def notes(self) -> Tuple[Note, ...]:
+        """
+        Return the spelled Note of every MIDI note.
+        """
+        spelled = _spelled_chord_tones(self.root, self.quality)
+        return tuple(spelled[midi % NUM_NOTES] for midi in self.midi)
+
+    @property
+    def spacing(self) -> str:
+        """
+        Return CLOSE if the voicing fits within an octave, else OPEN.
+        """
+        return CLOSE if self.midi[-1] - self.midi[0] < NUM_NOTES else OPEN
+
+
+@functools.lru_cache(maxsize=None)
+def _spelled_chord_tones(root: Note, quality: ChordQuality) -> Dict[int, Note]:
+    """
+    Return pitch class -> spelled Note for the tones of a chord.
+    """
+    return {PITCH_CLASSES[note]: note for note in build_chord(root, quality)}
+
+
+def iter_voicings(root: Note,
+                  quality: ChordQuality,
+                  low: int,
+                  high: int,
+                  extra_voices: int = 1,
+                  max_span: int = DEFAULT_MAX_SPAN) -> Iterator[Voicing]:
+    """
+    Yield every voicing of a chord with all notes in [low, high].
+
+    :param extra_voices: The maximum number of doubled chord tones.
+    :param max_span: The maximum distance in semitones from the lowest to the
+        highest note.
+    """
+    return _iter_voicings(root, quality, range(low, high + 1), high,
+                          extra_voices, max_span)
+
+
+def _iter_voicings(root: Note,
+                   quality: ChordQuality,
+                   bass_notes: range,
+                   high: int,
+                   extra_voices: int,
+                   max_span: int) -> Iterator[Voicing]:
+    """
+    Yield the voicings of a chord whose lowest note is in `bass_notes` and
+    whose highest note is at most `high`.
+    """
+    chord_pcs = [PITCH_CLASSES[note] for note in build_chord(root, quality)]
+    chord_pc_set = set(chord_pcs)
+    num_tones = len(chord_pcs)
+    for bass_note in bass_notes:
+        bass_pc = bass_note % NUM_NOTES
+        if bass_pc not in chord_pc_set:
+            continue
+        inversion = chord_pcs.index(bass_pc)
+        top = min(high, bass_note + max_span)
+        upper_notes = [midi for midi in range(bass_note + 1, top + 1)
+                       if midi % NUM_NOTES in chord_pc_set]
+        for num_upper in range(num_tones - 1, num_tones + extra_voices):
+            for upper in itertools.combinations(upper_notes, num_upper):
+                pcs = {bass_pc, *(midi % NUM_NOTES for midi in upper)}
+                if len(pcs) < num_tones:
+                    continue
+                yield Voicing(root, quality, (bass_note, *upper), inversion)
+
+
+def _enumerate_shard(shard: Tuple) -> List[Voicing]:
+    """
+    Return every voicing of one (root, quality, bass notes) shard. Runs in
+    the worker processes.
+    """
+    return list(_iter_voicings(*shard))
+
+
+def iter_voicing_chunks(roots: Iterable[Note],
+                        qualities: Iterable[ChordQuality],
+                        low: int,
+                        high: int,
+                        extra_voices: int = 1,
+                        max_span: int = DEFAULT_MAX_SPAN,
+                        workers: Optional[int] = None,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE
+                        ) -> Iterator[List[Voicing]]:
+    """
+    Enumerate the voicings of every quality on every root across a process
+    pool and yield them in lists of at most `chunk_size`, in the same order as
+    iter_voicings(). At most two shards per worker are in flight. A shard
+    covers BASS_NOTES_PER_SHARD bass notes, so its size depends on
+    `max_span` and `extra_voices` but not on the width of [low, high].
+
+    :param workers: The number of worker processes. Defaults to the number of
+        CPUs.
+    """
+    workers = workers or os.cpu_count() or 1
+    shards = ((root, quality,
+               range(start, min(start + BASS_NOTES_PER_SHARD, high + 1)),
+               high, extra_voices, max_span)
+              for root in roots
+              for quality in qualities
+              for start in range(low, high + 1, BASS_NOTES_PER_SHARD))
+    chunk = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = collections.deque(
+            executor.submit(_enumerate_shard, shard)
+            for shard in itertools.islice(shards, 2 * workers))
+        while pending:
+            voicings = pending.popleft().result()
+            for shard in itertools.islice(shards, 1):
+                pending.append(executor.submit(_enumerate_shard, shard))
+            chunk.extend(voicings)
+            if len(chunk) >= chunk_size:
+                full = len(chunk) - len(chunk) % chunk_size
+                for start in range(0, full, chunk_size):
+                    yield chunk[start:start + chunk_size]
+                chunk = chunk[full:]
+    if chunk:
+        yield chunk
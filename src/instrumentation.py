@@ -0,0 +1,159 @@
+import collections
+import contextlib
+import json
+import time
+from typing import Dict
+from typing import Iterator
+from typing import List
+
+from PySide2.QtCore import QObject
+from PySide2.QtCore import QTimer
+from PySide2.QtCore import Property
+from PySide2.QtCore import Signal
+from PySide2.QtCore import Slot
+
+
+SLOT_TIMER = 'slot'
+MODEL_TIMER = 'model'
+FRAME_TIMER = 'frame'
+KEY_CHANGE_TIMER = 'keyChange'
+TIMERS = (SLOT_TIMER, MODEL_TIMER, KEY_CHANGE_TIMER, FRAME_TIMER)
+
+DEFAULT_SIZE = 1024
+SUMMARY_INTERVAL_MS = 500
+
+
+class RingBuffer:
+    """
+    The most recent `size` samples of a measurement, in milliseconds.
+    """
+
+    def __init__(self, size: int = DEFAULT_SIZE):
+        self._samples = collections.deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def append(self, sample: float):
+        self._samples.append(sample)
+
+    def samples(self) -> List[float]:
+        return list(self._samples)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Return the nearest-rank `percent` percentile of the samples, or 0.0 if
+        there are none.
+        """
+        if not self._samples:
+            return 0.0
+        samples = sorted(self._samples)
+        rank = max(0, min(len(samples) - 1,
+                          round(percent / 100 * len(samples)) - 1))
+        return samples[rank]
+
+
+class Instrumentation(QObject):
+    """
+    Records slot execution time, model update time, frame intervals and the
+    latency from a key change to the next rendered frame into ring buffers.
+    The p50/p99 summary is exposed to QML and refreshed periodically.
+    """
+
+    summaryChanged = Signal()
+
+    def __init__(self, size: int = DEFAULT_SIZE, parent=None):
+        super().__init__(parent)
+        self._buffers = {name: RingBuffer(size) for name in TIMERS}
+        self._last_frame = None
+        self._key_change_start = None
+        self._summary = ''
+        self._dirty = False
+        self._summary_timer = QTimer(self)
+        self._summary_timer.setInterval(SUMMARY_INTERVAL_MS)
+        self._summary_timer.timeout.connect(self._updateSummary)
+        self._summary_timer.start()
+
+    def _getSummary(self) -> str:
+        return self._summary
+
+    summary = Property(str, _getSummary, notify=summaryChanged)
+
+    def buffer(self, name: str) -> RingBuffer:
+        return self._buffers[name]
+
+    @contextlib.contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """
+        Record the time spent in the `with` block into the `name` buffer.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record(name, time.perf_counter() - start)
+
+    def markKeyChange(self):
+        """
+        Start timing a key change. It ends on the next rendered frame.
+        """
+        self._key_change_start = time.perf_counter()
+
+    def attachFrameSignal(self, signal):
+        """
+        Record a frame every time `signal` is emitted. Use a QQuickWindow's
+        frameSwapped signal, or afterRendering for a QQuickWidget, whose
+        offscreen window never swaps.
+        """
+        signal.connect(self.onFrame)
+
+    @Slot()
+    def onFrame(self):
+        now = time.perf_counter()
+        if self._last_frame is not None:
+            self._record(FRAME_TIMER, now - self._last_frame)
+        self._last_frame = now
+        if self._key_change_start is not None:
+            self._record(KEY_CHANGE_TIMER, now - self._key_change_start)
+            self._key_change_start = None
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Return the sample count, p50 and p99 in milliseconds of every buffer.
+        """
+        return {
+            name: {
+                'count': len(buffer),
+                'p50': buffer.percentile(50),
+                'p99': buffer.percentile(99)
+            }
+            for name, buffer in self._buffers.items()
+        }
+
+    def dump(self, path: str):
+        """
+        Write the stats and raw samples of every buffer to `path` as JSON.
+        """
+        data = {
+            'stats': self.stats(),
+            'samples': {name: buffer.samples()
+                        for name, buffer in self._buffers.items()}
+        }
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=4)
+
+    def _record(self, name: str, seconds: float):
+        self._buffers[name].append(seconds * 1e3)
+        # Frames alone don't refresh the overlay, or it would keep itself busy
+        if name != FRAME_TIMER:
+            self._dirty = True
+
+    @Slot()
+    def _updateSummary(self):
+        if not self._dirty:
+            return
+        self._dirty = False
+        lines = [f'{name:<9} p50 {stats["p50"]:6.2f}  p99 {stats["p99"]:6.2f} ms'
+                 for name, stats in self.stats().items()]
+        self._summary = '\n'.join(lines)
+        self.summaryChanged.emit()
@@ -1,23 +1,21 @@
+import contextlib
 import os
 import sys
+from typing import Dict
 from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
 from typing import Union
 
 from PySide2 import QtCore
-from PySide2 import QtGui
+from PySide2.QtCore import QAbstractListModel
+from PySide2.QtCore import QModelIndex
 from PySide2.QtCore import QObject
-from PySide2.QtCore import QUrl
 from PySide2.QtCore import Slot
 from PySide2.QtCore import Property
-from PySide2.QtCore import QStringListModel
-from PySide2.QtGui import QGuiApplication
-from PySide2.QtGui import QStandardItemModel
-from PySide2.QtWidgets import QApplication
-from PySide2.QtWidgets import QWidget
-from PySide2.QtWidgets import QVBoxLayout
-from PySide2.QtQuick import QQuickView
-from PySide2.QtQuickWidgets import QQuickWidget
 
+from src import instrumentation as instr
 from src.backend import scales
 from src.backend import notes
 from src.backend.notes import Note
@@ -30,25 +28,50 @@ SIGNATUTE_NAME_ROLE = QtCore.Qt.UserRole + 1002
 FLAT = 'Flat'
 SHARP = 'Sharp'
 NO_ACCIDENTALS = 'Flats/Sharps'
+# The index of a combo box with nothing selected
+NO_ROW = -1
+_SIGNATURE_ACCIDENTALS = {
+    notes.KeyType.Natural: NO_ACCIDENTALS,
+    notes.KeyType.Sharp: SHARP,
+    notes.KeyType.Flat: FLAT,
+}
 
 
-class RootNotes(QStandardItemModel):
+class RootNotes(QAbstractListModel):
     """
     A collection of note enums and note names.
     """
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        roles = {
-            NOTE_ROLE: b'noteEnum',
-            NOTE_NAME_ROLE: b'noteName'
-        }
-        self.setItemRoleNames(roles)
+        self._notes = []
+        self._rows = {}
 
         root_notes = notes.USED_KEYS
         root_notes = sorted(root_notes, key=lambda root: root.value)
         self.addNotes(root_notes)
 
+    def roleNames(self) -> Dict[int, bytes]:
+        return {
+            NOTE_ROLE: b'noteEnum',
+            NOTE_NAME_ROLE: b'noteName'
+        }
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._notes)
+
+    def data(self, index: QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._notes):
+            return None
+        note = self._notes[index.row()]
+        if role == NOTE_ROLE:
+            return note
+        if role in (NOTE_NAME_ROLE, QtCore.Qt.DisplayRole):
+            return note.value
+        return None
+
     def addNotes(self, notes: Iterable[Note]):
         """
         Add multiple rows of note data to the model.
@@ -60,63 +83,189 @@ class RootNotes(QStandardItemModel):
         """
         Add a row of note data to the model.
         """
-        item = QtGui.QStandardItem()
-        item.setData(note, NOTE_ROLE)
-        item.setData(note.value, NOTE_NAME_ROLE)
-        self.appendRow(item)
+        row = len(self._notes)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows[note] = row
+        self._notes.append(note)
+        self.endInsertRows()
+
+    def noteForRow(self, row: int) -> Optional[Note]:
+        """
+        Return the note stored in `row`, or None if there is no such row,
+        e.g. -1 from a combo box with nothing selected.
+        """
+        if 0 <= row < len(self._notes):
+            return self._notes[row]
+        return None
+
+    def rowForNote(self, note: Note) -> Optional[int]:
+        """
+        Return the row where `note` is stored, or None if it isn't.
+        """
+        return self._rows.get(note)
 
 
-class KeySignatures(QStandardItemModel):
+class KeySignatures(QAbstractListModel):
     """
     A collection of key root enums (Note) and their key signatures.
     """
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        roles = {
+        self._notes = []
+        self._signature_names = []
+        self._rows = {}
+        for root in notes.ROOT_ACCIDENTALS_MAP.keys():
+            self.addSignature(root)
+
+    def roleNames(self) -> Dict[int, bytes]:
+        return {
             NOTE_ROLE: b'rootNote',
             SIGNATUTE_NAME_ROLE: b'signatureName'
         }
-        self.setItemRoleNames(roles)
-        for root in notes.ROOT_ACCIDENTALS_MAP.keys():
-            self.addSignature(root)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._notes)
+
+    def data(self, index: QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._notes):
+            return None
+        if role == NOTE_ROLE:
+            return self._notes[index.row()]
+        if role in (SIGNATUTE_NAME_ROLE, QtCore.Qt.DisplayRole):
+            return self._signature_names[index.row()]
+        return None
 
     def addSignature(self, root: Note):
         """
         Add a row of key signature data based on a root note.
         """
         signature_name = self._generateSignatureName(root)
-        item = QtGui.QStandardItem()
-        item.setData(root, NOTE_ROLE)
-        item.setData(signature_name, SIGNATUTE_NAME_ROLE)
-        self.appendRow(item)
+        row = len(self._notes)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows[root] = row
+        self._notes.append(root)
+        self._signature_names.append(signature_name)
+        self.endInsertRows()
+
+    def noteForRow(self, row: int) -> Optional[Note]:
+        """
+        Return the root note stored in `row`, or None if there is no such row,
+        e.g. -1 from a combo box with nothing selected.
+        """
+        if 0 <= row < len(self._notes):
+            return self._notes[row]
+        return None
+
+    def rowForNote(self, root: Note) -> Optional[int]:
+        """
+        Return the row where `root` is stored, or None if it isn't.
+        """
+        return self._rows.get(root)
 
     def _generateSignatureName(self, root: Note) -> str:
         """
         Generate the key signature name from a root note.
         E.g: _generateSignatureName(Note.E) -> '4 Sharps'.
+
+        :raise: ValueError if `root` is not the root of a key, e.g. Note.DSharp
         """
-        accidental = NO_ACCIDENTALS
-        if root in notes.FLAT_KEYS:
-            accidental = FLAT
-        elif root in notes.SHARP_KEYS:
-            accidental = SHARP
-        num_accidentals = notes.ROOT_ACCIDENTALS_MAP[root]
+        info = root.info
+        num_accidentals = info.num_accidentals
+        if num_accidentals is None:
+            raise ValueError(f'{root} is not the root of a key.')
+        accidental = _SIGNATURE_ACCIDENTALS[info.key_type]
         if num_accidentals > 1:
             accidental += 's'
         return f'{num_accidentals} {accidental}'
 
 
+class ScaleNoteNames(QAbstractListModel):
+    """
+    The note names of the current scale. Updates only notify views about the
+    rows that changed, so delegates are kept rather than recreated.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._note_names = []
+
+    def roleNames(self) -> Dict[int, bytes]:
+        return {QtCore.Qt.DisplayRole: b'display'}
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._note_names)
+
+    def data(self, index: QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._note_names):
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            return self._note_names[index.row()]
+        return None
+
+    def noteNames(self) -> List[str]:
+        return list(self._note_names)
+
+    def setNoteNames(self, note_names: Sequence[str]):
+        """
+        Replace the note names, emitting dataChanged for each run of changed
+        rows and inserting or removing rows at the end when the length
+        changes.
+        """
+        old_count = len(self._note_names)
+        new_count = len(note_names)
+        if new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            del self._note_names[new_count:]
+            self.endRemoveRows()
+
+        first_changed = None
+        for row in range(min(old_count, new_count)):
+            if self._note_names[row] != note_names[row]:
+                self._note_names[row] = note_names[row]
+                if first_changed is None:
+                    first_changed = row
+            elif first_changed is not None:
+                self._emitDataChanged(first_changed, row - 1)
+                first_changed = None
+        if first_changed is not None:
+            self._emitDataChanged(first_changed, min(old_count, new_count) - 1)
+
+        if new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._note_names.extend(note_names[old_count:])
+            self.endInsertRows()
+
+    def _emitDataChanged(self, first_row: int, last_row: int):
+        self.dataChanged.emit(self.index(first_row), self.index(last_row),
+                              [QtCore.Qt.DisplayRole])
+
+
 class Manager(QObject):
     """
     Manages models for QML views and contains logic for some event handling
     with decorated methods.
     """
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None,
+                 instrumentation: Optional[instr.Instrumentation] = None,
+                 player=None):
+        """
+        :param instrumentation: Records slot and model update timings when
+            given.
+        :param player: A backend.playback.Player to play clicked notes on.
+            Notes are silent without one.
+        """
         super().__init__(parent)
+        self._instrumentation = instrumentation
+        self._player = player
+        self._root = None
         self._root_notes = RootNotes()
-        self._scale_note_names = QStringListModel()
+        self._scale_note_names = ScaleNoteNames()
         # Initializing this model last sets the starting key to C because of
         # ROOTS_ACCIDENTAL_MAP
         self._key_signatures = KeySignatures()
@@ -139,10 +288,12 @@ class Manager(QObject):
         Determine the currently selected root note to update the scale note
         names. Returns the index that the key signatures combo should be set to.
         """
-        item = self._root_notes.item(combo_index)
-        new_root = item.data(NOTE_ROLE)
-        self._updateScaleNoteNames(new_root)
-        return self._getComboIndex(self._key_signatures, new_root)
+        with self._measure(instr.SLOT_TIMER):
+            new_root = self._root_notes.noteForRow(combo_index)
+            if new_root is None:
+                return NO_ROW
+            self._updateScaleNoteNames(new_root)
+            return self._getComboIndex(self._key_signatures, new_root)
 
     @Slot(int, result=int)
     def onKeySignatureIndexChanged(self, combo_index):
@@ -151,22 +302,42 @@ class Manager(QObject):
         update the scale note names. Returns the index that the root combo
         should be set to.
         """
-        item = self._key_signatures.item(combo_index)
-        new_root = item.data(NOTE_ROLE)
-        self._updateScaleNoteNames(new_root)
-        return self._getComboIndex(self._root_notes, new_root)
+        with self._measure(instr.SLOT_TIMER):
+            new_root = self._key_signatures.noteForRow(combo_index)
+            if new_root is None:
+                return NO_ROW
+            self._updateScaleNoteNames(new_root)
+            return self._getComboIndex(self._root_notes, new_root)
+
+    @Slot(str)
+    def playNote(self, note_name: str):
+        """
+        Queue the note named `note_name` for playback. The audio thread does
+        the mixing, so this returns immediately.
+        """
+        if self._player is not None:
+            with self._measure(instr.SLOT_TIMER):
+                self._player.play_note(Note(note_name))
+
+    @Slot()
+    def playScale(self):
+        """
+        Queue the major scale of the current root for playback.
+        """
+        if self._player is not None and self._root is not None:
+            with self._measure(instr.SLOT_TIMER):
+                self._player.play_scale(self._root)
 
     def _getComboIndex(self,
                        model: Union[RootNotes, KeySignatures],
                        root: Note) -> int:
         """
         Return the combo index to set `model`'s view to. This is th same as the
-        row number within `model` where `root` is stored.
+        row number within `model` where `root` is stored, or NO_ROW if it
+        isn't stored.
         """
-        for row in range(model.rowCount()):
-            item = model.item(row)
-            if item.data(NOTE_ROLE) == root:
-                return row
+        row = model.rowForNote(root)
+        return NO_ROW if row is None else row
 
     def _updateScaleNoteNames(self, root: Note):
         """
@@ -174,10 +345,23 @@ class Manager(QObject):
         note.
         """
         assert isinstance(root, Note)
+        self._root = root
         maj_scale = scales.MajorScale(root)
         notes = maj_scale.notes
         note_names = [note.value for note in notes]
-        self._scale_note_names.setStringList(note_names)
+        if self._instrumentation is not None:
+            self._instrumentation.markKeyChange()
+        with self._measure(instr.MODEL_TIMER):
+            self._scale_note_names.setNoteNames(note_names)
+
+    def _measure(self, name: str):
+        """
+        Return a context manager timing its block into the `name` buffer of the
+        instrumentation, or one that does nothing without instrumentation.
+        """
+        if self._instrumentation is None:
+            return contextlib.nullcontext()
+        return self._instrumentation.measure(name)
 
 
 if __name__ == '__main__':
@@ -186,6 +370,9 @@ if __name__ == '__main__':
         """
         Run QML without any QWidgets.
         """
+        from PySide2.QtCore import QUrl
+        from PySide2.QtGui import QGuiApplication
+        from PySide2.QtQuick import QQuickView
 
         # Set up the application window
         app = QGuiApplication(sys.argv)
@@ -195,6 +382,7 @@ if __name__ == '__main__':
         # Expose the manager to the Qml code
         manager = Manager()
         view.rootContext().setContextProperty("manager", manager)
+        view.rootContext().setContextProperty("instrumentation", None)
 
         # Load the QML file
         qml_file = os.path.join(os.path.dirname(__file__), "main.qml")
@@ -214,6 +402,12 @@ if __name__ == '__main__':
         """
         Run QML inside a QWidget.
         """
+        from PySide2.QtCore import QUrl
+        from PySide2.QtWidgets import QApplication
+        from PySide2.QtWidgets import QWidget
+        from PySide2.QtWidgets import QVBoxLayout
+        from PySide2.QtQuickWidgets import QQuickWidget
+
         # Set up the application window
         app = QApplication(sys.argv)
         window = QWidget()
@@ -225,6 +419,7 @@ if __name__ == '__main__':
         # Expose the manager to the Qml code
         manager = Manager()
         qquick_widget.rootContext().setContextProperty("manager", manager)
+        qquick_widget.rootContext().setContextProperty("instrumentation", None)
 
         # Load the QML file
         qml_file = os.path.join(os.path.dirname(__file__), "main.qml")
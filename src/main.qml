@@ -79,6 +79,12 @@ Page {
         font.bold: true
         color: '#2699fb'
         text: 'Scale'
+
+        MouseArea {
+            anchors.fill: parent
+            cursorShape: Qt.PointingHandCursor
+            onClicked: { manager.playScale() }
+        }
     }
 
     Row {
@@ -94,6 +100,15 @@ Page {
         }
     }
 
+    Loader {
+        id: perfOverlay
+        active: !!instrumentation
+        source: 'PerfOverlay.qml'
+        anchors.bottom: bottomBar.top
+        anchors.right: parent.right
+        anchors.margins: 5
+    }
+
     Rectangle {
         id: bottomBar
         height: 15
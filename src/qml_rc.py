@@ -0,0 +1,582 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created: Sun Oct 18 18:45:26 2026
+#      by: The Resource Compiler for PySide2 (Qt v5.13.2)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PySide2 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x05q\
+i\
+mport QtQuick 2.\
+15\x0aimport QtQuic\
+k.Controls 2.15\x0a\
+\x0aItem {\x0a    id: \
+root\x0a    width: \
+450\x0a    height: \
+100\x0a\x0a    propert\
+y alias headerTe\
+xt: headerText.t\
+ext\x0a    property\
+ alias descText:\
+ descText.text\x0a \
+   property alia\
+s comboModel: co\
+mbo.model\x0a    pr\
+operty alias com\
+boTextRole: comb\
+o.textRole\x0a    p\
+roperty alias co\
+mboCurrentIndex:\
+ combo.currentIn\
+dex\x0a\x0a    signal \
+comboChanged\x0a\x0a  \
+  Rectangle {\x0a  \
+      id: rectBo\
+rder\x0a        anc\
+hors.fill: paren\
+t\x0a        color:\
+ 'white'\x0a       \
+ border.color: '\
+#bce0fd'\x0a       \
+ border.width: 1\
+\x0a    }\x0a\x0a    Item\
+ {\x0a        id: t\
+extItem\x0a        \
+height: headerTe\
+xt.height + desc\
+Text.height + 4\x0a\
+        anchors.\
+verticalCenter: \
+root.verticalCen\
+ter\x0a        anch\
+ors.left: root.l\
+eft\x0a        anch\
+ors.leftMargin: \
+20\x0a\x0a        Text\
+ {\x0a            i\
+d: headerText\x0a  \
+          color:\
+ '#2699fb'\x0a     \
+       font.poin\
+tSize: 20\x0a      \
+      font.bold:\
+ true\x0a        }\x0a\
+\x0a        Text {\x0a\
+            id: \
+descText\x0a       \
+     anchors.top\
+: headerText.bot\
+tom\x0a            \
+anchors.topMargi\
+n: 4\x0a           \
+ color: '#2699fb\
+'\x0a            fo\
+nt.pointSize: 14\
+\x0a        }\x0a    }\
+\x0a\x0a    ComboBox {\
+\x0a        id: com\
+bo\x0a        x: (3\
+/5) * root.width\
+\x0a        width: \
+200\x0a        heig\
+ht: 40\x0a        a\
+nchors.verticalC\
+enter: root.vert\
+icalCenter\x0a     \
+   editable: fal\
+se\x0a        font.\
+pixelSize: 20\x0a  \
+      anchors.ri\
+ght: root.right\x0a\
+        anchors.\
+rightMargin: 20\x0a\
+\x0a        onCurre\
+ntIndexChanged: \
+{ root.comboChan\
+ged() }\x0a    }\x0a}\x0a\
+\
+\x00\x00\x04.\
+i\
+mport QtQuick 2.\
+15\x0a\x0aItem {\x0a    i\
+d: root\x0a    prop\
+erty alias text:\
+ noteName.text\x0a \
+   property alia\
+s degree: scaleD\
+egree.text\x0a\x0a    \
+width: 50\x0a    he\
+ight: 50\x0a\x0a    Re\
+ctangle {\x0a      \
+  id: rect\x0a     \
+   anchors.fill:\
+ parent\x0a        \
+color: '#2699fb'\
+\x0a        radius:\
+ 5\x0a\x0a        Mous\
+eArea {\x0a        \
+    anchors.fill\
+: parent\x0a       \
+     enabled: tr\
+ue\x0a            h\
+overEnabled: tru\
+e\x0a            on\
+Entered: { rect.\
+color = '#f5c26c\
+' }\x0a            \
+onExited: { rect\
+.color = '#2699f\
+b' }\x0a           \
+ onClicked: { ma\
+nager.playNote(n\
+oteName.text) }\x0a\
+        }\x0a    }\x0a\
+    Text {\x0a     \
+   id: scaleDegr\
+ee\x0a        ancho\
+rs.top: parent.t\
+op\x0a        ancho\
+rs.topMargin: 3\x0a\
+        anchors.\
+left: parent.lef\
+t\x0a        anchor\
+s.leftMargin: 5\x0a\
+        color: '\
+white'\x0a        f\
+ont.pointSize: 1\
+0\x0a    }\x0a\x0a    Tex\
+t {\x0a        id: \
+noteName\x0a       \
+ anchors.fill: p\
+arent\x0a        ve\
+rticalAlignment:\
+ Text.AlignVCent\
+er\x0a        horiz\
+ontalAlignment: \
+Text.AlignHCente\
+r\x0a        color:\
+ 'white'\x0a       \
+ font.pointSize:\
+ 20\x0a        font\
+.bold: true\x0a    \
+}\x0a}\x0a/*##^##\x0aDesi\
+gner {\x0a    D{i:0\
+;formeditorZoom:\
+1.65999996662139\
+9}\x0a}\x0a##^##*/\x0a\
+\x00\x00\x05w\
+i\
+mport QtQuick 2.\
+0\x0aimport QtQml.M\
+odels 2.2\x0a\x0aItem \
+{\x0a\x0a    DelegateM\
+odel {\x0a        i\
+d: circlesViewMo\
+del\x0a        mode\
+l: manager.circl\
+esModel\x0a        \
+delegate:\x0a      \
+      NoteCircle\
+ {\x0a             \
+   text: noteNam\
+e\x0a            }\x0a\
+    }\x0a\x0a//    Pat\
+hView {\x0a//      \
+  anchors.fill: \
+parent\x0a//       \
+ model: circlesV\
+iewModel\x0a//     \
+   path: Path {\x0a\
+\x0a//             \
+     startX: 188\
+; startY: 420\x0a\x0a/\
+/               \
+   PathArc {\x0a// \
+                \
+     x: 266; y: \
+382\x0a//          \
+            radi\
+usX: 100; radius\
+Y: 100\x0a//       \
+           }\x0a// \
+                \
+ PathArc {\x0a//   \
+                \
+   x: 285; y: 29\
+8\x0a//            \
+          radius\
+X: 100; radiusY:\
+ 100\x0a//         \
+         }\x0a//   \
+               P\
+athArc {\x0a//     \
+                \
+ x: 231; y: 230\x0a\
+//              \
+        radiusX:\
+ 100; radiusY: 1\
+00\x0a//           \
+       }\x0a//     \
+             Pat\
+hArc {\x0a//       \
+               x\
+: 144; y: 230\x0a//\
+                \
+      radiusX: 1\
+00; radiusY: 100\
+\x0a//             \
+     }\x0a//       \
+           PathA\
+rc {\x0a//         \
+             x: \
+90; y: 298\x0a//   \
+                \
+   radiusX: 100;\
+ radiusY: 100\x0a//\
+                \
+  }\x0a//          \
+        PathArc \
+{\x0a//            \
+          x: 109\
+; y: 382\x0a//     \
+                \
+ radiusX: 100; r\
+adiusY: 100\x0a//  \
+                \
+}\x0a//            \
+      PathArc {\x0a\
+//              \
+        x: 188; \
+y: 420\x0a//       \
+               r\
+adiusX: 100; rad\
+iusY: 100\x0a//    \
+              }\x0a\
+//        }\x0a//  \
+  }\x0a}\x0a\
+\x00\x00\x012\
+p\
+ragma Singleton\x0a\
+import QtQuick 2\
+.15\x0a\x0aQtObject {\x0a\
+\x0a    // Text\x0a   \
+ readonly proper\
+ty int mainTextS\
+ize: 20\x0a    read\
+only property in\
+t subTextSize: 1\
+4\x0a\x0a    // Colors\
+\x0a    readonly pr\
+operty color mai\
+nBlue: '#2699fb'\
+\x0a    readonly pr\
+operty color lig\
+htBlue: '#bce0fd\
+'\x0a    readonly p\
+roperty color or\
+ange: 'f5c26c'\x0a}\
+\x0a\
+\x00\x00\x006\
+m\
+odule Constants\x0a\
+singleton Consta\
+nts 1.0 Constant\
+s.qml\
+\x00\x00\x01\x84\
+i\
+mport QtQuick 2.\
+15\x0a\x0aRectangle {\x0a\
+    id: root\x0a   \
+ width: summaryT\
+ext.implicitWidt\
+h + 12\x0a    heigh\
+t: summaryText.i\
+mplicitHeight + \
+8\x0a    color: '#c\
+c000000'\x0a    rad\
+ius: 3\x0a\x0a    Text\
+ {\x0a        id: s\
+ummaryText\x0a     \
+   anchors.cente\
+rIn: parent\x0a    \
+    text: instru\
+mentation ? inst\
+rumentation.summ\
+ary : ''\x0a       \
+ color: 'white'\x0a\
+        font.fam\
+ily: 'monospace'\
+\x0a        font.po\
+intSize: 8\x0a    }\
+\x0a}\x0a\
+\x00\x00\x0d9\
+i\
+mport QtQuick 2.\
+15\x0aimport QtQuic\
+k.Controls 2.15\x0a\
+\x0a\x0aPage {\x0a    id:\
+ root\x0a    width:\
+ 500\x0a    height:\
+ 475\x0a    visible\
+: true\x0a\x0a    Rect\
+angle {\x0a        \
+id: background\x0a \
+       anchors.f\
+ill: parent\x0a    \
+    color: \x22whit\
+e\x22\x0a    }\x0a\x0a    Re\
+ctangle {\x0a      \
+  id: topBar\x0a   \
+     height: 55\x0a\
+        anchors.\
+top: parent.top\x0a\
+        anchors.\
+left: parent.lef\
+t\x0a        anchor\
+s.right: parent.\
+right\x0a        co\
+lor: '#2699fb'\x0a\x0a\
+        Text {\x0a \
+           id: h\
+eaderText\x0a      \
+      text: 'Maj\
+or scales'\x0a     \
+       anchors.l\
+eft: parent.left\
+\x0a            anc\
+hors.leftMargin:\
+ 10\x0a            \
+anchors.vertical\
+Center: parent.v\
+erticalCenter\x0a  \
+          color:\
+ 'white'\x0a       \
+     font.pointS\
+ize: 20\x0a        \
+    font.bold: t\
+rue\x0a        }\x0a  \
+  }\x0a\x0a    Item {\x0a\
+        id: sele\
+ctorsContainer\x0a \
+       width: ro\
+otNoteSelector.w\
+idth\x0a        hei\
+ght: rootNoteSel\
+ector.height + k\
+eySignatureSelec\
+tor.height + 15\x0a\
+        anchors.\
+horizontalCenter\
+: parent.horizon\
+talCenter\x0a      \
+  anchors.top: t\
+opBar.bottom\x0a   \
+     anchors.top\
+Margin: 30\x0a\x0a    \
+    Selector {\x0a \
+           id: r\
+ootNoteSelector\x0a\
+            head\
+erText: 'Root no\
+te'\x0a            \
+descText: 'The f\
+irst note in the\
+ scale'\x0a        \
+    comboModel: \
+manager.rootNote\
+s\x0a            co\
+mboTextRole: 'no\
+teName'\x0a        \
+    onComboChang\
+ed: {\x0a          \
+      keySignatu\
+reSelector.combo\
+CurrentIndex = m\
+anager.onRootInd\
+exChanged(comboC\
+urrentIndex)\x0a   \
+         }\x0a     \
+       anchors.t\
+op: parent.top\x0a \
+           ancho\
+rs.left: parent.\
+left\x0a        }\x0a\x0a\
+        Selector\
+ {\x0a            i\
+d: keySignatureS\
+elector\x0a        \
+    headerText: \
+'Key signature'\x0a\
+            desc\
+Text: 'The numbe\
+r of sharps or f\
+lats'\x0a          \
+  comboModel: ma\
+nager.keySignatu\
+res\x0a            \
+comboTextRole: '\
+signatureName'\x0a \
+           onCom\
+boChanged: {\x0a   \
+             roo\
+tNoteSelector.co\
+mboCurrentIndex \
+= manager.onKeyS\
+ignatureIndexCha\
+nged(comboCurren\
+tIndex)\x0a        \
+    }\x0a          \
+  anchors.top: r\
+ootNoteSelector.\
+bottom\x0a         \
+   anchors.topMa\
+rgin: 15\x0a       \
+     anchors.lef\
+t: parent.left\x0a \
+       }\x0a    }\x0a\x0a\
+    Text {\x0a     \
+   id: noteCircl\
+esHeader\x0a       \
+ anchors.left: n\
+oteCircles.left\x0a\
+        anchors.\
+top: selectorsCo\
+ntainer.bottom\x0a \
+       anchors.t\
+opMargin: 20\x0a   \
+     font.pointS\
+ize: 20\x0a        \
+font.bold: true\x0a\
+        color: '\
+#2699fb'\x0a       \
+ text: 'Scale'\x0a\x0a\
+        MouseAre\
+a {\x0a            \
+anchors.fill: pa\
+rent\x0a           \
+ cursorShape: Qt\
+.PointingHandCur\
+sor\x0a            \
+onClicked: { man\
+ager.playScale()\
+ }\x0a        }\x0a   \
+ }\x0a\x0a    Row {\x0a  \
+      id: noteCi\
+rcles\x0a        an\
+chors.horizontal\
+Center: parent.h\
+orizontalCenter\x0a\
+        anchors.\
+top: noteCircles\
+Header.bottom\x0a  \
+      anchors.ma\
+rgins: 20\x0a      \
+  spacing: 6\x0a   \
+     Repeater {\x0a\
+            mode\
+l: manager.scale\
+NoteNames\x0a      \
+      delegate:\x0a\
+                \
+NoteRect { text:\
+ display; degree\
+: index + 1 }\x0a  \
+      }\x0a    }\x0a\x0a \
+   Loader {\x0a    \
+    id: perfOver\
+lay\x0a        acti\
+ve: !!instrument\
+ation\x0a        so\
+urce: 'PerfOverl\
+ay.qml'\x0a        \
+anchors.bottom: \
+bottomBar.top\x0a  \
+      anchors.ri\
+ght: parent.righ\
+t\x0a        anchor\
+s.margins: 5\x0a   \
+ }\x0a\x0a    Rectangl\
+e {\x0a        id: \
+bottomBar\x0a      \
+  height: 15\x0a   \
+     color: '#f2\
+f2f2'\x0a        an\
+chors.bottom: pa\
+rent.bottom\x0a    \
+    anchors.left\
+: parent.left\x0a  \
+      anchors.ri\
+ght: parent.righ\
+t\x0a\x0a        Text \
+{\x0a            te\
+xt: 'sanchezayal\
+a.marco@gmail.co\
+m'\x0a            f\
+ont.pointSize: 8\
+\x0a            anc\
+hors.verticalCen\
+ter: parent.vert\
+icalCenter\x0a     \
+       anchors.r\
+ight: parent.rig\
+ht\x0a            a\
+nchors.rightMarg\
+in: 5\x0a        }\x0a\
+    }\x0a}\x0a\
+"
+
+qt_resource_name = b"\
+\x00\x0c\
+\x00]\x03|\
+\x00S\
+\x00e\x00l\x00e\x00c\x00t\x00o\x00r\x00.\x00q\x00m\x00l\
+\x00\x0c\
+\x01\x0a\x05<\
+\x00N\
+\x00o\x00t\x00e\x00R\x00e\x00c\x00t\x00.\x00q\x00m\x00l\
+\x00\x13\
+\x08\xa3\xb1|\
+\x00C\
+\x00i\x00r\x00c\x00l\x00e\x00A\x00n\x00i\x00m\x00a\x00t\x00i\x00o\x00n\x00.\x00q\
+\x00m\x00l\
+\x00\x0d\
+\x01\x81\x02\x1c\
+\x00C\
+\x00o\x00n\x00s\x00t\x00a\x00n\x00t\x00s\x00.\x00q\x00m\x00l\
+\x00\x06\
+\x07\x84+\x02\
+\x00q\
+\x00m\x00l\x00d\x00i\x00r\
+\x00\x0f\
+\x03\xe8\x96<\
+\x00P\
+\x00e\x00r\x00f\x00O\x00v\x00e\x00r\x00l\x00a\x00y\x00.\x00q\x00m\x00l\
+\x00\x08\
+\x08\x01Z\x5c\
+\x00m\
+\x00a\x00i\x00n\x00.\x00q\x00m\x00l\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x07\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x1e\x00\x00\x00\x00\x00\x01\x00\x00\x05u\
+\x00\x00\x00h\x00\x00\x00\x00\x00\x01\x00\x00\x0f\x22\
+\x00\x00\x00\x9a\x00\x00\x00\x00\x00\x01\x00\x00\x10\x92\
+\x00\x00\x00\x88\x00\x00\x00\x00\x00\x01\x00\x00\x10X\
+\x00\x00\x00\xbe\x00\x00\x00\x00\x00\x01\x00\x00\x12\x1a\
+\x00\x00\x00<\x00\x00\x00\x00\x00\x01\x00\x00\x09\xa7\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
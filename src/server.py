@@ -0,0 +1,226 @@
+"""
+A small asyncio HTTP/JSON service for scale and chord lookups.
+
+Every response in the finite (root, scale/chord) space is serialized once at
+startup, so serving a request is a dict lookup and a socket write. Run from the
+repository root with `python -m src.server --port 8000`.
+
+Routes, with roots and scale types given by their enum member names and chord
+qualities by slugs of their values (e.g. `dominant-7`):
+
+    GET /chromatic/<root>
+    GET /scales/<root>[/<scale type>]
+    GET /chords/<root>[/<quality>]
+"""
+import argparse
+import asyncio
+import json
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from src.backend import intervals
+from src.backend.chord_builder import build_chord
+from src.backend.notes import ROOT_ACCIDENTALS_MAP
+from src.backend.scales import ChromaticScale
+from src.backend.scales import scale_notes
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8000
+# Requests whose head is longer than this get a 400 response
+MAX_HEADER_SIZE = 8192
+
+_REASONS = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed'
+}
+
+
+def quality_slug(quality) -> str:
+    """
+    Return the URL form of a chord quality, e.g. 'half-diminished-7'.
+    """
+    return quality.value.lower().replace(' ', '-')
+
+
+def encode_response(status: int, body: Any) -> bytes:
+    """
+    Return a complete HTTP/1.1 response with `body` serialized as JSON.
+    """
+    payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+    head = f'HTTP/1.1 {status} {_REASONS[status]}\r\n' \
+           f'Content-Type: application/json; charset=utf-8\r\n' \
+           f'Content-Length: {len(payload)}\r\n' \
+           f'\r\n'
+    return head.encode('ascii') + payload
+
+
+def parse_headers(lines: List[str]) -> Dict[str, str]:
+    """
+    Return lowercase header name -> value for the header lines of a request
+    head. Repeated headers are joined with commas.
+    """
+    headers = {}
+    for line in lines:
+        name, sep, value = line.partition(':')
+        if not sep:
+            continue
+        name = name.strip().lower()
+        value = value.strip()
+        if name in headers:
+            value = f'{headers[name]}, {value}'
+        headers[name] = value
+    return headers
+
+
+def header_tokens(value: str) -> List[str]:
+    """
+    Return the lowercase comma-separated tokens of a header value such as
+    'keep-alive, Close'.
+    """
+    return [token.strip().lower() for token in value.split(',')]
+
+
+def _names(notes) -> List[str]:
+    return [note.value for note in notes]
+
+
+def build_responses() -> Dict[str, bytes]:
+    """
+    Return request path -> serialized response for every route.
+    """
+    bodies = {}
+    for root in ROOT_ACCIDENTALS_MAP:
+        bodies[f'/chromatic/{root.name}'] = {
+            'root': root.value,
+            'notes': _names(ChromaticScale(root).notes)
+        }
+        for scale_type in intervals.ScaleType:
+            bodies[f'/scales/{root.name}/{scale_type.name}'] = {
+                'root': root.value,
+                'scale': scale_type.value,
+                'notes': _names(scale_notes(root, scale_type))
+            }
+        bodies[f'/scales/{root.name}'] = \
+            bodies[f'/scales/{root.name}/{intervals.ScaleType.Major.name}']
+        chords = []
+        for quality in intervals.ALL_CHORD_INTS:
+            chord = {
+                'root': root.value,
+                'quality': quality.value,
+                'notes': _names(build_chord(root, quality))
+            }
+            bodies[f'/chords/{root.name}/{quality_slug(quality)}'] = chord
+            chords.append(chord)
+        bodies[f'/chords/{root.name}'] = chords
+    return {path: encode_response(200, body) for path, body in bodies.items()}
+
+
+class ScaleServer:
+    """
+    Serves the precomputed responses over HTTP/1.1 with keep-alive.
+    """
+
+    def __init__(self):
+        self._responses = build_responses()
+        self._not_found = encode_response(404, {'error': 'Not found'})
+        self._bad_request = encode_response(400, {'error': 'Bad request'})
+        self._not_allowed = encode_response(405, {'error': 'Only GET is '
+                                                           'supported'})
+        self._server = None
+
+    @property
+    def port(self) -> Optional[int]:
+        if self._server is None:
+            return None
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        self._server = await asyncio.start_server(self._handle, host, port,
+                                                  limit=MAX_HEADER_SIZE)
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    def close(self):
+        self._server.close()
+
+    async def wait_closed(self):
+        await self._server.wait_closed()
+
+    def response_for(self, method: str, target: str) -> bytes:
+        """
+        Return the serialized response for a request line's method and target.
+        """
+        if method != 'GET':
+            return self._not_allowed
+        path = target.split('?', 1)[0].rstrip('/')
+        return self._responses.get(path, self._not_found)
+
+    async def _handle(self, reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    writer.write(self._bad_request)
+                    break
+                lines = head.decode('latin-1').split('\r\n')
+                request_line = lines[0].split()
+                if len(request_line) != 3:
+                    writer.write(self._bad_request)
+                    break
+                method, target, version = request_line
+                headers = parse_headers(lines[1:])
+                writer.write(self.response_for(method, target))
+                # Discard any body so it isn't read as the next request head.
+                # Bodies without a plain length can't be skipped safely.
+                if 'transfer-encoding' in headers:
+                    break
+                length = headers.get('content-length', '0')
+                if not length.isdigit():
+                    break
+                if int(length):
+                    try:
+                        await reader.readexactly(int(length))
+                    except (asyncio.IncompleteReadError, ConnectionError):
+                        break
+                connection = header_tokens(headers.get('connection', ''))
+                if 'close' in connection or version == 'HTTP/1.0':
+                    break
+                await writer.drain()
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+    server = ScaleServer()
+    await server.start(host, port)
+    print(f'Serving on http://{host}:{server.port}')
+    await server.serve_forever()
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
 from src.backend import chord_builder
+from src.backend import intervals
+from src.backend import notes
 from src.backend.intervals import Triad
 from src.backend.intervals import SeventhChord
 from src.backend.notes import Note
@@ -74,4 +80,51 @@ class TestChordBuilder:
         assert c_half_dim_7 == [Note.C, Note.EFlat, Note.GFlat, Note.BFlat]
 
         c_dim_7 = builder.build_chord(SeventhChord.Diminished)
-        assert c_dim_7 == [Note.C, Note.EFlat, Note.GFlat, Note.A]
\ No newline at end of file
+        assert c_dim_7 == [Note.C, Note.EFlat, Note.GFlat, Note.A]
+
+
+def test_build_chord():
+    """
+    Make sure the stateless function spells chords per request without
+    changing the builder's chromatic scale.
+    """
+    assert chord_builder.build_chord(Note.C, Triad.Augmented) == \
+           (Note.C, Note.E, Note.GSharp)
+    assert chord_builder.build_chord(Note.C, Triad.Minor, sharps=True) == \
+           (Note.C, Note.DSharp, Note.G)
+    assert chord_builder.build_chord(Note.FSharp, SeventhChord.Major) == \
+           (Note.FSharp, Note.ASharp, Note.CSharp, Note.ESharp)
+    with pytest.raises(KeyError):
+        chord_builder.build_chord(Note.G, Triad.Major, sharps=False)
+
+    builder = chord_builder.ChordBuilder(Note.C)
+    chromatic_notes = builder.chromatic_scale.notes
+    builder.build_chord(Triad.Augmented)
+    assert builder.chromatic_scale.notes is chromatic_notes
+    assert builder.chromatic_scale.sharps is False
+
+
+def test_build_chord_threads():
+    """
+    Stress a shared builder and the stateless function from many threads and
+    make sure every result matches the single-threaded one.
+    """
+    qualities = list(intervals.ALL_CHORD_INTS)
+    builders = {root: chord_builder.ChordBuilder(root)
+                for root in notes.ROOT_ACCIDENTALS_MAP}
+    expected = {(root, quality): builder.build_chord(quality)
+                for root, builder in builders.items()
+                for quality in qualities}
+    jobs = list(expected) * 200
+
+    def build(job):
+        root, quality = job
+        return (builders[root].build_chord(quality),
+                list(chord_builder.build_chord(root, quality)))
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(build, jobs, chunksize=16))
+
+    for job, (from_builder, from_function) in zip(jobs, results):
+        assert from_builder == expected[job]
+        assert from_function == expected[job]
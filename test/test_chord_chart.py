@@ -0,0 +1,83 @@
+import types
+
+import pytest
+
+from src.backend import chord_chart
+from src.backend.intervals import SeventhChord
+from src.backend.intervals import Triad
+from src.backend.notes import Note
+
+
+@pytest.mark.parametrize('symbol, root, quality', [
+    ('C', Note.C, Triad.Major),
+    ('Cmaj7', Note.C, SeventhChord.Major),
+    ('F#m', Note.FSharp, Triad.Minor),
+    ('Bbm7b5', Note.BFlat, SeventhChord.HalfDiminished),
+    ('E♭ø7', Note.EFlat, SeventhChord.HalfDiminished),
+    ('G7', Note.G, SeventhChord.Dominant),
+    ('Abdim7', Note.AFlat, SeventhChord.Diminished),
+    ('Dm(maj7)', Note.D, SeventhChord.MinorMajor),
+    ('C+', Note.C, Triad.Augmented),
+    # Roots that aren't key roots are respelled
+    ('D#m', Note.EFlat, Triad.Minor),
+    ('Fb', Note.E, Triad.Major),
+])
+def test_resolve_symbol(symbol, root, quality):
+    chord = chord_chart.resolve_symbol(symbol)
+    assert chord.symbol == symbol
+    assert chord.root == root
+    assert chord.quality == quality
+    assert chord.bass is None
+
+
+def test_resolve_symbol_slash():
+    chord = chord_chart.resolve_symbol('Am7/G')
+    assert chord.bass == Note.G
+    assert chord.notes == (Note.A, Note.C, Note.E, Note.G)
+
+
+@pytest.mark.parametrize('symbol', ['', 'H7', 'Cmaj9', 'C/X', 'Cb#',
+                                    'Cmaj7/'])
+def test_resolve_symbol_invalid(symbol):
+    with pytest.raises(ValueError):
+        chord_chart.resolve_symbol(symbol)
+
+
+def test_symbol_cache():
+    chord_chart.clear_symbol_cache()
+    chords = list(chord_chart.iter_chords(b'C | F | C G7 | C ||'))
+    assert chords[0] is chords[2] is chords[4]
+    info = chord_chart.symbol_cache_info()
+    assert info.misses == 3
+    assert info.hits == 2
+
+
+def test_iter_chords_errors():
+    chart = b'Am | ?? | E7 :|'
+    with pytest.raises(ValueError, match='byte 5'):
+        list(chord_chart.iter_chords(chart))
+    assert [chord.symbol for chord in
+            chord_chart.iter_chords(chart, chord_chart.SKIP)] == ['Am', 'E7']
+    with pytest.raises(ValueError):
+        list(chord_chart.iter_chords(chart, 'ignore'))
+
+
+def test_iter_chords_non_chords():
+    """
+    Make sure simile marks and no chord markings aren't treated as errors.
+    """
+    chart = b'Dm7 | G7 | Cmaj7 % | N.C. | NC %% | C%|'
+    assert [chord.symbol for chord in chord_chart.iter_chords(chart)] == \
+        ['Dm7', 'G7', 'Cmaj7', 'C']
+
+
+def test_iter_chart_file(tmp_path):
+    path = tmp_path / 'chart.txt'
+    path.write_text('|: Dm7 | G7 | Cmaj7 | % :|\n', encoding='utf-8')
+    chords = chord_chart.iter_chart_file(str(path))
+    assert isinstance(chords, types.GeneratorType)
+    assert [chord.symbol for chord in chords] == ['Dm7', 'G7', 'Cmaj7']
+
+    empty = tmp_path / 'empty.txt'
+    empty.write_bytes(b'')
+    assert list(chord_chart.iter_chart_file(str(empty))) == []
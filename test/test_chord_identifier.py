@@ -0,0 +1,45 @@
+from src.backend import chord_builder
+from src.backend import chord_identifier
+from src.backend import intervals
+from src.backend import notes
+from src.backend.chord_identifier import ChordMatch
+from src.backend.intervals import SeventhChord
+from src.backend.intervals import Triad
+from src.backend.notes import Note
+
+
+def test_identify_every_chord():
+    """
+    Make sure every chord the builder produces is identified in root position
+    and in every inversion.
+    """
+    for root in notes.ROOT_ACCIDENTALS_MAP:
+        for quality in intervals.ALL_CHORD_INTS:
+            chord_notes = chord_builder.build_chord(root, quality)
+            for inversion in range(len(chord_notes)):
+                voicing = chord_notes[inversion:] + chord_notes[:inversion]
+                matches = chord_identifier.identify_chords(voicing)
+                assert ChordMatch(root, quality, inversion) in matches
+
+
+def test_identify_chord():
+    """
+    Make sure doublings, inversions and symmetric chords are handled and
+    non-chords aren't matched.
+    """
+    assert chord_identifier.identify_chord(
+        [Note.E, Note.G, Note.C, Note.E]) == \
+           ChordMatch(Note.C, Triad.Major, 1)
+    assert chord_identifier.identify_chord(
+        [Note.BFlat, Note.D, Note.F, Note.AFlat]) == \
+           ChordMatch(Note.BFlat, SeventhChord.Dominant, 0)
+    # Symmetric chords prefer the bass as root
+    assert chord_identifier.identify_chord(
+        [Note.E, Note.GSharp, Note.C]) == \
+           ChordMatch(Note.E, Triad.Augmented, 0)
+    assert len(chord_identifier.identify_chords(
+        [Note.B, Note.D, Note.F, Note.AFlat])) == 4
+
+    assert chord_identifier.identify_chord([Note.C, Note.D, Note.E]) is None
+    assert chord_identifier.identify_chord([]) is None
+
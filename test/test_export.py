@@ -0,0 +1,58 @@
+import csv
+import io
+import json
+import types
+
+from src.backend import export
+from src.backend import intervals
+from src.backend.notes import Note
+
+
+def test_iter_records():
+    """
+    Make sure records are generated lazily, a scale first and then every
+    chord for each root.
+    """
+    records = export.iter_records([Note.G, Note.BFlat])
+    assert isinstance(records, types.GeneratorType)
+    first = next(records)
+    assert first == {
+        'root': 'G',
+        'type': export.SCALE,
+        'name': 'Major',
+        'notes': ['G', 'A', 'B', 'C', 'D', 'E', 'F♯']
+    }
+    rest = list(records)
+    assert len(rest) == 2 * len(intervals.ALL_CHORD_INTS) + 1
+    assert rest[0]['name'] == intervals.Triad.Major.value
+    assert rest[0]['notes'] == ['G', 'B', 'D']
+
+
+def test_iter_chord_records():
+    chords = [(Note.D, intervals.SeventhChord.Minor,
+               (Note.D, Note.F, Note.A, Note.C))]
+    assert list(export.iter_chord_records(chords)) == [{
+        'root': 'D',
+        'type': export.CHORD,
+        'name': 'Minor 7',
+        'notes': ['D', 'F', 'A', 'C']
+    }]
+
+
+def test_write_jsonl():
+    stream = io.StringIO()
+    count = export.write_jsonl(export.iter_records([Note.C]), stream)
+    lines = stream.getvalue().splitlines()
+    assert count == len(lines) == len(intervals.ALL_CHORD_INTS) + 1
+    assert json.loads(lines[1])['notes'] == ['C', 'E', 'G']
+
+
+def test_write_csv():
+    stream = io.StringIO()
+    count = export.write_csv(
+        export.iter_records(export.default_roots()), stream)
+    stream.seek(0)
+    rows = list(csv.reader(stream))
+    assert rows[0] == list(export.FIELDS)
+    assert count == len(rows) - 1 == 15 * (len(intervals.ALL_CHORD_INTS) + 1)
+    assert rows[1] == ['C', export.SCALE, 'Major', 'C D E F G A B']
@@ -0,0 +1,66 @@
+import json
+
+from src import instrumentation
+from src import main
+from src.instrumentation import Instrumentation
+from src.instrumentation import RingBuffer
+
+
+class TestRingBuffer:
+
+    def test_percentile(self):
+        buffer = RingBuffer(size=100)
+        assert buffer.percentile(50) == 0.0
+        for sample in range(1, 201):
+            buffer.append(float(sample))
+        # Only the latest 100 samples are kept
+        assert len(buffer) == 100
+        assert buffer.percentile(50) == 150.0
+        assert buffer.percentile(99) == 199.0
+        assert buffer.percentile(100) == 200.0
+
+
+class TestInstrumentation:
+
+    def setup(self):
+        self.instrumentation = Instrumentation(size=10)
+
+    def test_measure(self):
+        with self.instrumentation.measure(instrumentation.SLOT_TIMER):
+            pass
+        assert len(self.instrumentation.buffer(instrumentation.SLOT_TIMER)) \
+               == 1
+
+    def test_frames(self):
+        """
+        Make sure frame intervals are recorded and a key change ends on the
+        next frame only.
+        """
+        self.instrumentation.onFrame()
+        self.instrumentation.markKeyChange()
+        self.instrumentation.onFrame()
+        self.instrumentation.onFrame()
+        stats = self.instrumentation.stats()
+        assert stats[instrumentation.FRAME_TIMER]['count'] == 2
+        assert stats[instrumentation.KEY_CHANGE_TIMER]['count'] == 1
+
+    def test_dump(self, tmp_path):
+        self.instrumentation.onFrame()
+        self.instrumentation.onFrame()
+        path = tmp_path / 'timings.json'
+        self.instrumentation.dump(str(path))
+        with open(path) as f:
+            data = json.load(f)
+        assert set(data['stats']) == set(instrumentation.TIMERS)
+        assert len(data['samples'][instrumentation.FRAME_TIMER]) == 1
+
+    def test_manager(self):
+        """
+        Make sure the Manager slots record slot and model update timings.
+        """
+        manager = main.Manager(instrumentation=self.instrumentation)
+        manager.onRootIndexChanged(0)
+        manager.onKeySignatureIndexChanged(1)
+        stats = self.instrumentation.stats()
+        assert stats[instrumentation.SLOT_TIMER]['count'] == 2
+        assert stats[instrumentation.MODEL_TIMER]['count'] == 2
@@ -0,0 +1,43 @@
+from src.backend import key_finder
+from src.backend import notes
+from src.backend.intervals import ScaleType
+from src.backend.notes import Note
+from src.backend.scales import MajorScale
+from src.backend.scales import Scale
+
+
+def test_keys_containing():
+    """
+    Make sure the index agrees with checking every MajorScale.
+    """
+    melodies = (
+        [Note.C, Note.E, Note.G],
+        [Note.FSharp, Note.B],
+        [Note.BFlat, Note.EFlat, Note.AFlat, Note.DFlat],
+        [Note.C, Note.CSharp],
+        []
+    )
+    for melody in melodies:
+        melody_pcs = {notes.PITCH_CLASSES[note] for note in melody}
+        expected = [
+            root for root in notes.ROOT_ACCIDENTALS_MAP
+            if melody_pcs <= {notes.PITCH_CLASSES[note]
+                              for note in MajorScale(root).notes}
+        ]
+        assert key_finder.keys_containing(melody) == expected
+
+    assert key_finder.keys_containing([Note.C, Note.CSharp, Note.D]) == []
+    a_minor = Scale(Note.A, ScaleType.HarmonicMinor).notes
+    assert key_finder.keys_containing(
+        a_minor, ScaleType.HarmonicMinor) == [Note.A]
+
+
+def test_closest_keys():
+    """
+    Make sure keys are ranked by how many notes fall outside them.
+    """
+    melody = Scale(Note.A, ScaleType.HarmonicMinor).notes
+    closest = key_finder.closest_keys(melody, count=3)
+    assert closest == [(Note.C, 1), (Note.F, 2), (Note.G, 2)]
+    assert len(key_finder.closest_keys(melody)) == \
+           len(notes.ROOT_ACCIDENTALS_MAP)
@@ -1,4 +1,7 @@
+from unittest import mock
+
 import pytest
+from PySide2 import QtCore
 
 from src import main
 from src.backend.notes import Note
@@ -15,6 +18,51 @@ class TestManager:
         """
         assert True
 
+    def test_combo_sync(self):
+        """
+        Make sure changing either combo returns the other combo's row for the
+        same root.
+        """
+        root_notes = self.manager.rootNotes
+        key_signatures = self.manager.keySignatures
+        for row in range(root_notes.rowCount()):
+            signature_row = self.manager.onRootIndexChanged(row)
+            assert key_signatures.noteForRow(signature_row) == \
+                   root_notes.noteForRow(row)
+            assert self.manager.onKeySignatureIndexChanged(signature_row) == row
+
+    def test_no_selection(self):
+        """
+        Make sure an empty combo selection leaves the scale alone.
+        """
+        self.manager.onRootIndexChanged(0)
+        names = self.manager.scaleNoteNames.noteNames()
+        assert names
+        assert self.manager.onRootIndexChanged(main.NO_ROW) == main.NO_ROW
+        assert self.manager.onKeySignatureIndexChanged(
+            self.manager.keySignatures.rowCount()) == main.NO_ROW
+        assert self.manager.scaleNoteNames.noteNames() == names
+
+
+class TestManagerPlayback:
+
+    def setup(self):
+        self.player = mock.Mock()
+        self.manager = main.Manager(player=self.player)
+
+    def test_play_note(self):
+        self.manager.playNote('F♯')
+        self.player.play_note.assert_called_once_with(Note.FSharp)
+
+    def test_play_scale(self):
+        self.manager.onKeySignatureIndexChanged(
+            self.manager.keySignatures.rowForNote(Note.BFlat))
+        self.manager.playScale()
+        self.player.play_scale.assert_called_once_with(Note.BFlat)
+
+    def test_no_player(self):
+        main.Manager().playNote('C')
+
 
 class TestRootNotes:
 
@@ -28,12 +76,27 @@ class TestRootNotes:
         # C + 7 sharp keys + 7 flat keys
         assert self.model.rowCount() == 15
 
-        first_item = self.model.item(0)
-        first_note = first_item.data(main.NOTE_ROLE)
-        first_note_name = first_item.data(main.NOTE_NAME_ROLE)
+        first_index = self.model.index(0)
+        first_note = self.model.data(first_index, main.NOTE_ROLE)
+        first_note_name = self.model.data(first_index, main.NOTE_NAME_ROLE)
         assert first_note == Note.A
         assert first_note_name == 'A'
 
+    def test_row_index(self):
+        """
+        Make sure the note -> row index stays correct as rows are added.
+        """
+        for row in range(self.model.rowCount()):
+            note = self.model.data(self.model.index(row), main.NOTE_ROLE)
+            assert self.model.rowForNote(note) == row
+            assert self.model.noteForRow(row) is note
+
+        assert self.model.rowForNote(Note.DSharp) is None
+        assert self.model.noteForRow(-1) is None
+        assert self.model.noteForRow(self.model.rowCount()) is None
+        self.model.addNote(Note.DSharp)
+        assert self.model.rowForNote(Note.DSharp) == 15
+
 
 class TestKeySignatures:
 
@@ -47,8 +110,49 @@ class TestKeySignatures:
         # C + 7 sharp keys + 7 flat keys
         assert self.model.rowCount() == 15
 
-        first_signature = self.model.item(0)
-        first_note = first_signature.data(main.NOTE_ROLE)
-        first_signature_name = first_signature.data(main.SIGNATUTE_NAME_ROLE)
+        first_index = self.model.index(0)
+        first_note = self.model.data(first_index, main.NOTE_ROLE)
+        first_signature_name = self.model.data(first_index,
+                                               main.SIGNATUTE_NAME_ROLE)
         assert first_note == Note.C
         assert first_signature_name == '0 Flats/Sharps'
+
+    def test_signature_name(self):
+        """
+        Make sure signature names are generated for key roots only.
+        """
+        assert self.model._generateSignatureName(Note.E) == '4 Sharps'
+        assert self.model._generateSignatureName(Note.F) == '1 Flat'
+        with pytest.raises(ValueError):
+            self.model._generateSignatureName(Note.DSharp)
+
+
+class TestScaleNoteNames:
+
+    def setup(self):
+        self.model = main.ScaleNoteNames()
+        self.changes = []
+        self.model.dataChanged.connect(
+            lambda first, last, roles: self.changes.append(
+                (first.row(), last.row())))
+
+    def test_set_note_names(self):
+        """
+        Make sure only runs of changed rows are reported and rows are inserted
+        or removed at the end when the length changes.
+        """
+        self.model.setNoteNames(['C', 'D', 'E', 'F', 'G', 'A', 'B'])
+        assert self.model.rowCount() == 7
+        assert self.changes == []
+
+        # Changing only row 3 emits a single-row dataChanged
+        self.model.setNoteNames(['C', 'D', 'E', 'F♯', 'G', 'A', 'B'])
+        assert self.changes == [(3, 3)]
+
+        self.changes.clear()
+        self.model.setNoteNames(['D', 'E', 'E', 'F♯', 'A', 'B'])
+        assert self.changes == [(0, 1), (4, 5)]
+        assert self.model.rowCount() == 6
+        assert self.model.noteNames() == ['D', 'E', 'E', 'F♯', 'A', 'B']
+        assert self.model.data(self.model.index(0), QtCore.Qt.DisplayRole) \
+               == 'D'
@@ -0,0 +1,49 @@
+import io
+
+import pytest
+
+from src.backend import midi
+from src.backend.notes import Note
+from src.backend.notes import ROOT_ACCIDENTALS_MAP
+
+
+def test_encode_track():
+    track = midi.encode_track([(60,), (), (60, 64)], duration=200)
+    assert track == b'MTrk' + (31).to_bytes(4, 'big') + bytes((
+        0x00, 0x90, 60, 96,
+        0x81, 0x48, 0x80, 60, 0,
+        0x81, 0x48, 0x90, 60, 96,
+        0x00, 0x90, 64, 96,
+        0x81, 0x48, 0x80, 60, 0,
+        0x00, 0x80, 64, 0,
+        0x00, 0xff, 0x2f, 0x00))
+
+    with pytest.raises(ValueError):
+        midi.encode_track([(128,)])
+    with pytest.raises(ValueError):
+        midi.encode_track([(60,)], channel=16)
+
+
+def test_encode_file():
+    track = midi.encode_track([(60,)])
+    single = midi.encode_file([track])
+    assert single[:14] == b'MThd\x00\x00\x00\x06\x00\x00\x00\x01\x01\xe0'
+    assert single[14:] == track
+
+    stream = io.BytesIO()
+    written = midi.write_file([track, track], stream)
+    assert written == len(stream.getvalue()) == 14 + 2 * len(track)
+    assert stream.getvalue()[8:12] == b'\x00\x01\x00\x02'
+
+
+def test_steps():
+    assert midi.scale_steps(Note.D) == [
+        (62,), (64,), (66,), (67,), (69,), (71,), (73,), (74,)]
+    assert midi.chord_steps(Note.C)[0] == (60, 64, 67)
+
+
+def test_export_keys(tmp_path):
+    paths = midi.export_keys(ROOT_ACCIDENTALS_MAP, str(tmp_path))
+    assert len(paths) == len(ROOT_ACCIDENTALS_MAP)
+    with open(tmp_path / 'FSharp.mid', 'rb') as f:
+        assert f.read() == midi.encode_key(Note.FSharp)
@@ -0,0 +1,121 @@
+import pytest
+
+from src.backend import notes
+from src.backend.notes import KeyType
+from src.backend.notes import Note
+
+
+def test_note_info():
+    info = notes.NOTE_INFO[Note.FSharp]
+    assert info.pitch_class == 6
+    assert info.letter == notes.LETTER_NAMES.index('F')
+    assert info.accidental == 1
+    assert info.key_type is KeyType.Sharp
+    assert info.num_accidentals == 6
+    assert info.enharmonics == (Note.GFlat,)
+
+    assert notes.NOTE_INFO[Note.C].key_type is KeyType.Natural
+    assert notes.NOTE_INFO[Note.C].enharmonics == (Note.BSharp,)
+    assert notes.NOTE_INFO[Note.CFlat].accidental == -1
+    assert notes.NOTE_INFO[Note.CFlat].key_type is KeyType.Flat
+    assert notes.NOTE_INFO[Note.ESharp].key_type is None
+    assert notes.NOTE_INFO[Note.ESharp].num_accidentals is None
+
+
+def test_note_info_consistent():
+    """
+    Make sure the records agree with the key tuples they replace.
+    """
+    for note in Note:
+        info = notes.NOTE_INFO[note]
+        assert (info.key_type is KeyType.Sharp) == (note in notes.SHARP_KEYS)
+        assert (info.key_type is KeyType.Flat) == (note in notes.FLAT_KEYS)
+        assert info.num_accidentals == notes.ROOT_ACCIDENTALS_MAP.get(note)
+        assert info.pitch_class == notes.PITCH_CLASSES[note]
+        assert note.info is info
+
+
+@pytest.mark.parametrize('name, note', [
+    ('C', Note.C),
+    ('c', Note.C),
+    ('C#', Note.CSharp),
+    ('c♯', Note.CSharp),
+    ('cis', Note.CSharp),
+    ('Db', Note.DFlat),
+    ('DB', Note.DFlat),
+    ('des', Note.DFlat),
+    ('es', Note.EFlat),
+    ('Ees', Note.EFlat),
+    ('as', Note.AFlat),
+    ('Bes', Note.BFlat),
+    ('F sharp', Note.FSharp),
+    ('g-Flat', Note.GFlat),
+    ('FSharp', Note.FSharp),
+    (' cFlat ', Note.CFlat),
+    ('E♯', Note.ESharp),
+])
+def test_parse_note(name, note):
+    assert notes.parse_note(name) is note
+
+
+@pytest.mark.parametrize('name', ['', 'H', 'C##', 'Cbb', 'sharp', 'C♯4'])
+def test_parse_note_invalid(name):
+    with pytest.raises(ValueError):
+        notes.parse_note(name)
+
+
+def test_parse_notes():
+    expected = [Note.C, Note.FSharp, Note.BFlat, Note.EFlat]
+    assert notes.parse_notes('C f# Bb\n\tes') == expected
+    assert notes.parse_notes(b'C  f#\nBb es') == expected
+    assert notes.parse_notes(['c', 'F♯', 'bes', 'E-FLAT']) == expected
+    assert notes.parse_notes(iter(['C', 'FIS'])) == expected[:2]
+    assert notes.parse_notes('') == []
+    with pytest.raises(ValueError):
+        notes.parse_notes('C D X')
+
+
+@pytest.mark.parametrize('name, note', [
+    ('h', Note.B),
+    ('H', Note.B),
+    ('his', Note.BSharp),
+    ('H#', Note.BSharp),
+    ('b', Note.BFlat),
+    ('B', Note.BFlat),
+    ('cis', Note.CSharp),
+    ('es', Note.EFlat),
+    ('Fb', Note.FFlat),
+])
+def test_parse_note_german(name, note):
+    assert notes.parse_note(name, german=True) is note
+
+
+def test_parse_note_english_b():
+    """
+    Make sure B and H keep their English meaning unless German is requested.
+    """
+    assert notes.parse_note('b') is Note.B
+    assert notes.parse_note('Bb') is Note.BFlat
+    with pytest.raises(ValueError):
+        notes.parse_note('h')
+    with pytest.raises(ValueError):
+        notes.parse_note('bes', german=True)
+
+
+def test_parse_note_values():
+    """
+    Make sure every Note value parses as its Note in both modes, except 'B',
+    which is B flat in German.
+    """
+    for note in Note:
+        assert notes.parse_note(note.value) is note
+        if note is not Note.B:
+            assert notes.parse_note(note.value, german=True) is note
+    assert notes.parse_note('B', german=True) is Note.BFlat
+    assert notes.parse_note('b♭', german=True) is Note.BFlat
+
+
+def test_parse_notes_german():
+    expected = [Note.B, Note.BFlat, Note.FSharp]
+    assert notes.parse_notes('h b fis', german=True) == expected
+    assert notes.parse_notes(['H', ' B ', 'Fis'], german=True) == expected
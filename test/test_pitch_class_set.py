@@ -0,0 +1,81 @@
+import pickle
+
+import pytest
+
+from src.backend.chord_builder import ChordBuilder
+from src.backend.intervals import SeventhChord
+from src.backend.intervals import Triad
+from src.backend.notes import Note
+from src.backend.pitch_class_set import PitchClassSet
+from src.backend.scales import MajorScale
+
+
+class TestPitchClassSet:
+
+    def setup(self):
+        self.c_major = PitchClassSet([0, 4, 7])
+        self.a_minor = PitchClassSet([9, 0, 4])
+
+    def test_init(self):
+        """
+        Make sure sets are built from pitch classes, masks and notes, and that
+        equal sets are shared.
+        """
+        assert self.c_major.mask == 0b10010001
+        assert PitchClassSet([12, 16, 19]) is self.c_major
+        assert PitchClassSet.from_mask(0b10010001) is self.c_major
+        assert PitchClassSet.from_notes(
+            [Note.BSharp, Note.FFlat, Note.G]) is self.c_major
+        assert not PitchClassSet()
+        assert pickle.loads(pickle.dumps(self.c_major)) is self.c_major
+
+    def test_container(self):
+        assert list(self.a_minor) == [0, 4, 9]
+        assert len(self.a_minor) == 3
+        assert 9 in self.a_minor
+        assert Note.A in self.a_minor
+        assert Note.BFlat not in self.a_minor
+        assert {self.c_major, PitchClassSet([7, 4, 0])} == {self.c_major}
+
+    def test_set_algebra(self):
+        assert list(self.c_major | self.a_minor) == [0, 4, 7, 9]
+        assert list(self.c_major & self.a_minor) == [0, 4]
+        assert list(self.c_major - self.a_minor) == [7]
+        assert list(self.c_major ^ self.a_minor) == [7, 9]
+        assert (self.c_major & self.a_minor) <= self.c_major
+        assert self.c_major.issuperset(PitchClassSet([0]))
+        assert len(self.c_major.complement()) == 9
+        assert not self.c_major & self.c_major.complement()
+
+    def test_foreign_operands(self):
+        """
+        Make sure other types raise TypeError rather than AttributeError.
+        """
+        for other in ({0, 4}, 0, None):
+            for operation in (lambda s: s | other, lambda s: s & other,
+                              lambda s: s - other, lambda s: s ^ other,
+                              lambda s: s <= other, lambda s: s >= other,
+                              lambda s: s.union(other),
+                              lambda s: s.issubset(other)):
+                with pytest.raises(TypeError):
+                    operation(self.c_major)
+        assert self.c_major != {0, 4, 7}
+
+    def test_transpose(self):
+        assert list(self.c_major.transpose(7)) == [2, 7, 11]
+        assert list(self.c_major.transpose(-1)) == [3, 6, 11]
+        assert self.c_major.transpose(12) is self.c_major
+
+
+def test_scale_and_chord_sets():
+    """
+    Make sure scales and chords can return their pitch class sets.
+    """
+    assert MajorScale(Note.C).pitch_class_set == \
+           PitchClassSet([0, 2, 4, 5, 7, 9, 11])
+    assert MajorScale(None).pitch_class_set is None
+
+    builder = ChordBuilder(Note.D)
+    assert builder.build_chord_set(Triad.Major) == PitchClassSet([2, 6, 9])
+    assert builder.build_chord_set(SeventhChord.Dominant) == \
+           PitchClassSet([0, 2, 6, 9])
@@ -0,0 +1,173 @@
+import numpy as np
+import pytest
+
+from src.backend import intervals
+from src.backend import notes
+from src.backend import pitch_classes
+from src.backend.chord_builder import ChordBuilder
+from src.backend.intervals import SeventhChord
+from src.backend.intervals import Triad
+from src.backend.notes import Note
+from src.backend.scales import ChromaticScale
+from src.backend.scales import MajorScale
+
+
+def test_encode_decode():
+    """
+    Make sure notes survive a round trip through their note codes.
+    """
+    all_notes = list(Note)
+    codes = pitch_classes.encode(all_notes)
+    assert codes.dtype == np.int8
+    assert pitch_classes.decode_list(codes) == all_notes
+    assert pitch_classes.decode(codes.reshape(3, 7)).shape == (3, 7)
+
+
+def test_pitch_classes():
+    """
+    Make sure enharmonic notes share a pitch class.
+    """
+    codes = pitch_classes.encode(
+        [Note.C, Note.BSharp, Note.CSharp, Note.DFlat, Note.FFlat, Note.CFlat])
+    assert pitch_classes.pitch_classes(codes).tolist() == [0, 0, 1, 1, 4, 11]
+
+
+def test_transpose():
+    """
+    Make sure transposition wraps around the octave and broadcasts.
+    """
+    result = pitch_classes.transpose([0, 7, 11], [[1], [-1], [24]])
+    assert result.tolist() == [[1, 8, 0], [11, 6, 10], [0, 7, 11]]
+
+
+def test_spell():
+    """
+    Make sure pitch classes are spelled as in the root's chromatic scale.
+    """
+    for root in notes.ROOT_ACCIDENTALS_MAP:
+        chromatic = ChromaticScale(root).notes
+        pcs = pitch_classes.pitch_classes(pitch_classes.encode(chromatic))
+        roots = pitch_classes.encode([root])
+        spelled = pitch_classes.spell(pcs, roots)
+        assert pitch_classes.decode_list(spelled) == list(chromatic)
+
+    with pytest.raises(ValueError):
+        pitch_classes.spell([0], pitch_classes.encode([Note.DSharp]))
+
+
+def test_transpose_notes():
+    """
+    Make sure notes are transposed and respelled in the target keys.
+    """
+    codes = pitch_classes.encode([Note.C, Note.E, Note.G])
+    roots = pitch_classes.encode([Note.DFlat, Note.FSharp])[:, np.newaxis]
+    semitones = np.array([[1], [6]])
+    result = pitch_classes.transpose_notes(codes, semitones, roots)
+    assert pitch_classes.decode_list(result) == [
+        [Note.DFlat, Note.F, Note.AFlat],
+        [Note.FSharp, Note.ASharp, Note.CSharp]
+    ]
+
+
+def test_transpose_key():
+    """
+    Make sure melodies keep their letter distances from the root where
+    possible and fall back to the target key's chromatic spelling.
+    """
+    c, f_sharp, e_flat = pitch_classes.encode([Note.C, Note.FSharp,
+                                               Note.EFlat])
+    melody = pitch_classes.encode([Note.C, Note.FSharp, Note.DFlat,
+                                   Note.GSharp, Note.B])
+    assert pitch_classes.decode_list(
+        pitch_classes.transpose_key(melody, c, e_flat)) == \
+        [Note.EFlat, Note.A, Note.FFlat, Note.B, Note.D]
+    # G♯ would be D double sharp in F♯
+    assert pitch_classes.decode_list(
+        pitch_classes.transpose_key(melody, c, f_sharp)) == \
+        [Note.FSharp, Note.BSharp, Note.G, Note.D, Note.ESharp]
+    with pytest.raises(ValueError):
+        pitch_classes.transpose_key(melody, c, pitch_classes.NOTE_CODES[
+            Note.DSharp])
+
+
+@pytest.mark.parametrize('codes, source, target', [
+    # -1 would otherwise index C♭, the last note
+    ([0], -1, 0),
+    ([0], 0, -1),
+    ([0], 0, len(pitch_classes.NOTES)),
+    # Only -1 is padding; -2 would wrap into the C♭ column
+    ([0, -2], 0, 0),
+    ([len(pitch_classes.NOTES)], 0, 0),
+])
+def test_transpose_key_out_of_range(codes, source, target):
+    with pytest.raises(ValueError):
+        pitch_classes.transpose_key(np.array(codes, dtype=np.int8), source,
+                                    target)
+
+
+def test_transpose_key_scales():
+    """
+    Make sure transposing a major scale between any two keys gives the major
+    scale of the target key.
+    """
+    roots = pitch_classes.encode(notes.ROOT_ACCIDENTALS_MAP)
+    degrees = pitch_classes.scale_degrees(roots)
+    for source, scale in zip(roots, degrees):
+        np.testing.assert_array_equal(
+            pitch_classes.transpose_key(scale, source, roots[:, np.newaxis]),
+            degrees)
+
+
+def test_transpose_key_progression():
+    """
+    Make sure padded chord tables transpose as a whole.
+    """
+    a, b_flat = pitch_classes.encode([Note.A, Note.BFlat])
+    progression = pitch_classes.build_chords(
+        np.array([a]), [Triad.Major, SeventhChord.Dominant]).codes
+    transposed = pitch_classes.transpose_key(progression, a, b_flat)
+    np.testing.assert_array_equal(
+        transposed,
+        pitch_classes.build_chords(
+            np.array([b_flat]), [Triad.Major, SeventhChord.Dominant]).codes)
+    assert transposed[0, 0, -1] == -1
+
+
+def test_scale_degrees():
+    """
+    Make sure every major scale matches MajorScale.
+    """
+    roots = list(notes.ROOT_ACCIDENTALS_MAP)
+    degrees = pitch_classes.scale_degrees(pitch_classes.encode(roots))
+    assert degrees.shape == (len(roots), 7)
+    for root, scale in zip(roots, pitch_classes.decode_list(degrees)):
+        assert tuple(scale) == MajorScale(root).notes
+
+
+def test_build_chords():
+    """
+    Make sure the dense chord table matches ChordBuilder for every root and
+    quality, including padding for triads.
+    """
+    roots = list(notes.ROOT_ACCIDENTALS_MAP)
+    table = pitch_classes.build_chords(pitch_classes.encode(roots))
+    shape = (len(roots), len(intervals.ALL_CHORD_INTS),
+             pitch_classes.MAX_CHORD_TONES)
+    assert table.codes.shape == shape
+    assert table.names.shape == shape
+    for i, root in enumerate(roots):
+        builder = ChordBuilder(root)
+        for j, quality in enumerate(pitch_classes.CHORD_QUALITIES):
+            chord_notes = builder.build_chord(quality)
+            names = [note.value for note in chord_notes]
+            padding = [''] * (pitch_classes.MAX_CHORD_TONES - len(names))
+            assert table.names[i, j].tolist() == names + padding
+
+    c_aug = pitch_classes.build_chords(pitch_classes.encode([Note.C]),
+                                       [Triad.Augmented, SeventhChord.Major])
+    assert c_aug.names.tolist() == [[['C', 'E', 'G♯', ''],
+                                     ['C', 'E', 'G', 'B']]]
+    assert c_aug.codes[0, 0, 3] == -1
+
+    with pytest.raises(ValueError):
+        pitch_classes.build_chords(pitch_classes.encode([Note.ESharp]))
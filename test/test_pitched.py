@@ -0,0 +1,57 @@
+import types
+
+import pytest
+
+from src.backend import pitched
+from src.backend.intervals import ScaleType
+from src.backend.intervals import SeventhChord
+from src.backend.intervals import Triad
+from src.backend.notes import Note
+from src.backend.pitched import PitchedNote
+
+
+def test_midi_number():
+    assert pitched.midi_number(Note.C, 4) == 60
+    assert pitched.midi_number(Note.A, 4) == 69
+    assert pitched.midi_number(Note.BSharp, 3) == 60
+    assert pitched.midi_number(Note.CFlat, 4) == 59
+    assert pitched.midi_number(Note.FFlat, 4) == 64
+
+
+def test_octave():
+    assert PitchedNote(60, Note.C).name == 'C4'
+    assert PitchedNote(60, Note.BSharp).name == 'B♯3'
+    assert PitchedNote(59, Note.CFlat).name == 'C♭4'
+    assert PitchedNote(21, Note.A).name == 'A0'
+
+
+def test_iter_scale():
+    """
+    Make sure scales are generated lazily across octaves and clipped to the
+    MIDI range.
+    """
+    notes = pitched.iter_scale(Note.CSharp, 61, 73)
+    assert isinstance(notes, types.GeneratorType)
+    assert [note.name for note in notes] == [
+        'C♯4', 'D♯4', 'E♯4', 'F♯4', 'G♯4', 'A♯4', 'B♯4', 'C♯5'
+    ]
+    assert [note.name for note in pitched.iter_scale(Note.CFlat, 58, 60)] == \
+           ['B♭3', 'C♭4']
+
+    pentatonic = list(pitched.iter_scale(Note.A, -100, 1000,
+                                         ScaleType.MinorPentatonic))
+    assert pentatonic[0].midi >= pitched.MIDI_MIN
+    assert pentatonic[-1].midi <= pitched.MIDI_MAX
+
+
+def test_iter_chord():
+    assert list(pitched.iter_chord(Note.C, Triad.Major)) == [
+        PitchedNote(60, Note.C), PitchedNote(64, Note.E),
+        PitchedNote(67, Note.G)
+    ]
+    second_inversion = pitched.iter_chord(Note.FSharp, SeventhChord.Major,
+                                          inversion=2, octave=3)
+    assert [note.name for note in second_inversion] == \
+           ['C♯3', 'E♯3', 'F♯3', 'A♯3']
+    with pytest.raises(ValueError):
+        list(pitched.iter_chord(Note.C, Triad.Major, inversion=3))
@@ -0,0 +1,72 @@
+import time
+import wave
+
+import numpy as np
+
+from src.backend import playback
+from src.backend import synth
+from src.backend.intervals import Triad
+from src.backend.midi import scale_steps
+from src.backend.notes import Note
+
+
+def test_schedule_steps():
+    schedule = playback.schedule_steps([(60,), (), (60, 64)], 0.1)
+    step_size = int(0.1 * synth.SAMPLE_RATE)
+    assert [offset for offset, _ in schedule] == [0, 2 * step_size,
+                                                  2 * step_size]
+    np.testing.assert_array_equal(schedule[0][1], synth.render_note(60, 0.1))
+    np.testing.assert_allclose(schedule[1][1], synth.render_note(60, 0.1) / 2)
+
+
+def test_sample_accurate(tmp_path):
+    """
+    Make sure a sequence comes out exactly as if it had been rendered
+    offline, whatever the block size.
+    """
+    path = str(tmp_path / 'scale.wav')
+    player = playback.Player(playback.WavSink(path), block_size=100)
+    player.start()
+    assert player.play_scale(Note.E, duration=0.05)
+    player.stop()
+
+    expected = synth.to_pcm16(synth.render_steps(scale_steps(Note.E), 0.05))
+    with wave.open(path, 'rb') as wav:
+        frames = wav.readframes(wav.getnframes())
+    assert frames[:len(expected)] == expected
+    assert not frames[len(expected):].strip(b'\x00')
+
+
+def test_queue_full():
+    player = playback.Player(playback.NullSink(), queue_size=1)
+    assert player.play_note(Note.C)
+    assert not player.play_note(Note.C)
+    assert player.dropped == 1
+
+
+def test_latency():
+    sink = playback.NullSink()
+    player = playback.Player(sink)
+    player.start()
+    try:
+        clicked = time.perf_counter()
+        assert player.play_note(Note.A, duration=0.05)
+        deadline = clicked + 1.0
+        while sink.first_sound_time is None and time.perf_counter() < deadline:
+            time.sleep(0.001)
+        assert sink.first_sound_time - clicked < 0.1
+    finally:
+        player.stop()
+
+
+def test_play_chord(tmp_path):
+    path = str(tmp_path / 'chord.wav')
+    player = playback.Player(playback.WavSink(path))
+    player.start()
+    assert player.play_chord(Note.A, Triad.Minor, duration=0.05)
+    player.stop()
+
+    expected = synth.to_pcm16(synth.render_steps([(69, 72, 76)], 0.05))
+    with wave.open(path, 'rb') as wav:
+        frames = wav.readframes(wav.getnframes())
+    assert frames[:len(expected)] == expected
@@ -2,9 +2,12 @@ import pytest
 from unittest import mock
 
 from src.backend import notes
+from src.backend import scales
+from src.backend.intervals import ScaleType
 from src.backend.notes import Note
 from src.backend.scales import ChromaticScale
 from src.backend.scales import MajorScale
+from src.backend.scales import Scale
 
 
 class TestChromaticScale:
@@ -112,6 +115,39 @@ class TestChromaticScale:
         assert _get_scale_notes_sharps.call_count == 1
         assert _get_scale_notes_flats.call_count == 0
 
+    def test_notes_shared(self):
+        """
+        Make sure the notes property returns the same precomputed tuple on
+        every access and for every scale with the same root.
+        """
+        assert self.sharp_scale.notes is self.sharp_scale.notes
+        assert self.sharp_scale.notes is ChromaticScale(Note.G).notes
+
+        self.c_scale.use_sharps()
+        assert self.c_scale.notes is scales.chromatic_notes(Note.C, True)
+        self.c_scale.use_flats()
+        assert self.c_scale.notes is scales.chromatic_notes(Note.C, False)
+
+
+def test_chromatic_notes():
+    """
+    Make sure the precomputed tables match the scales built from scratch and
+    only contain conventional roots.
+    """
+    for root in (Note.C, *notes.SHARP_KEYS):
+        assert scales.chromatic_notes(root, True) == \
+               scales._build_chromatic_notes(root, True)
+    for root in (Note.C, *notes.FLAT_KEYS):
+        assert scales.chromatic_notes(root, False) == \
+               scales._build_chromatic_notes(root, False)
+
+    assert scales.chromatic_notes(Note.CSharp, True)[-1] is Note.BSharp
+    assert scales.chromatic_notes(Note.CFlat, False)[5] is Note.FFlat
+    with pytest.raises(KeyError):
+        scales.chromatic_notes(Note.G, False)
+    with pytest.raises(KeyError):
+        scales.chromatic_notes(Note.DSharp, True)
+
 
 class TestMajorScale:
 
@@ -157,8 +193,79 @@ class TestMajorScale:
         scale = self.c_scale
         scale._root = Note.A
         scale._update_scale()
-        assert scale._chromatic_scale.root is Note.A
         assert scale.notes == (
             Note.A, Note.B, Note.CSharp, Note.D, Note.E, Note.FSharp,
             Note.GSharp
         )
+
+
+class TestScale:
+
+    def test_modes(self):
+        """
+        Make sure modes and minor scales have the right notes.
+        """
+        assert Scale(Note.D, ScaleType.Dorian).notes == (
+            Note.D, Note.E, Note.F, Note.G, Note.A, Note.B, Note.C
+        )
+        assert Scale(Note.A, ScaleType.HarmonicMinor).notes == (
+            Note.A, Note.B, Note.C, Note.D, Note.E, Note.F, Note.GSharp
+        )
+        assert Scale(Note.C, ScaleType.MelodicMinor).notes == (
+            Note.C, Note.D, Note.EFlat, Note.F, Note.G, Note.A, Note.B
+        )
+        assert Scale(Note.C, ScaleType.Blues).notes == (
+            Note.C, Note.EFlat, Note.F, Note.GFlat, Note.G, Note.BFlat
+        )
+        assert Scale(Note.G, ScaleType.MajorPentatonic).notes == (
+            Note.G, Note.A, Note.B, Note.D, Note.E
+        )
+
+    def test_spelled_by_letter(self):
+        """
+        Make sure every degree gets its own letter, whatever the root's
+        chromatic scale would use.
+        """
+        assert Scale(Note.D, ScaleType.NaturalMinor).notes == (
+            Note.D, Note.E, Note.F, Note.G, Note.A, Note.BFlat, Note.C
+        )
+        assert Scale(Note.G, ScaleType.HarmonicMinor).notes == (
+            Note.G, Note.A, Note.BFlat, Note.C, Note.D, Note.EFlat,
+            Note.FSharp
+        )
+        assert Scale(Note.C, ScaleType.Lydian).notes == (
+            Note.C, Note.D, Note.E, Note.FSharp, Note.G, Note.A, Note.B
+        )
+        assert Scale(Note.A, ScaleType.Blues).notes == (
+            Note.A, Note.C, Note.D, Note.EFlat, Note.E, Note.G
+        )
+        assert Scale(Note.E, ScaleType.MinorPentatonic).notes == (
+            Note.E, Note.G, Note.A, Note.B, Note.D
+        )
+        # E double sharp doesn't exist, so C♯ Lydian falls back to G
+        assert Scale(Note.CSharp, ScaleType.Lydian).notes[3] == Note.G
+
+    def test_user_defined(self):
+        """
+        Make sure tuples of steps are accepted and validated.
+        """
+        whole_tone = Scale(Note.C, (2, 2, 2, 2, 2))
+        assert whole_tone.notes == (
+            Note.C, Note.D, Note.E, Note.GFlat, Note.AFlat, Note.BFlat
+        )
+        with pytest.raises(ValueError):
+            scales.scale_notes(Note.C, (6, 6))
+
+    def test_cache(self):
+        """
+        Make sure repeated lookups are served from the cache.
+        """
+        scales.clear_scale_cache()
+        first = scales.scale_notes(Note.E, ScaleType.Lydian)
+        assert scales.scale_notes(Note.E, ScaleType.Lydian) is first
+        assert MajorScale(Note.E).notes is \
+               scales.scale_notes(Note.E, ScaleType.Major)
+        info = scales.scale_cache_info()
+        assert info.misses == 2
+        assert info.hits == 2
+        assert info.maxsize == scales.SCALE_CACHE_SIZE
@@ -0,0 +1,132 @@
+import asyncio
+import json
+
+from src import server
+from src.backend import intervals
+
+
+def test_build_responses():
+    """
+    Make sure every root, scale type and chord quality has a response.
+    """
+    responses = server.build_responses()
+    num_chords = len(intervals.ALL_CHORD_INTS)
+    num_scales = len(intervals.ScaleType)
+    assert len(responses) == 15 * (1 + num_scales + 1 + num_chords + 1)
+    head, body = responses['/scales/CFlat/Major'].split(b'\r\n\r\n')
+    assert head.startswith(b'HTTP/1.1 200 OK')
+    assert f'Content-Length: {len(body)}'.encode() in head
+    assert json.loads(body)['notes'][3] == 'F♭'
+
+
+def test_scale_spelling():
+    """
+    Make sure scales are served with one letter per degree.
+    """
+    responses = server.build_responses()
+    for path, notes in (
+            ('/scales/D/NaturalMinor', ['D', 'E', 'F', 'G', 'A', 'B♭', 'C']),
+            ('/scales/G/HarmonicMinor',
+             ['G', 'A', 'B♭', 'C', 'D', 'E♭', 'F♯']),
+            ('/scales/C/Lydian', ['C', 'D', 'E', 'F♯', 'G', 'A', 'B'])):
+        body = responses[path].split(b'\r\n\r\n')[1]
+        assert json.loads(body)['notes'] == notes
+
+
+def test_server():
+    """
+    Make sure several requests are answered over one keep-alive connection,
+    including errors.
+    """
+    async def request(reader, writer, line):
+        writer.write(f'{line}\r\nHost: localhost\r\n\r\n'.encode())
+        head = await reader.readuntil(b'\r\n\r\n')
+        length = int(head.split(b'Content-Length: ')[1].split(b'\r\n')[0])
+        return head.split(b'\r\n')[0], json.loads(
+            await reader.readexactly(length))
+
+    async def run():
+        scale_server = server.ScaleServer()
+        await scale_server.start('127.0.0.1', 0)
+        reader, writer = await asyncio.open_connection('127.0.0.1',
+                                                       scale_server.port)
+        results = [
+            await request(reader, writer, 'GET /chords/C/augmented-triad '
+                                          'HTTP/1.1'),
+            await request(reader, writer, 'GET /scales/D/Dorian/ HTTP/1.1'),
+            await request(reader, writer, 'GET /scales/DSharp HTTP/1.1'),
+            await request(reader, writer, 'POST /scales/D HTTP/1.1')
+        ]
+        writer.close()
+        scale_server.close()
+        await scale_server.wait_closed()
+        return results
+
+    augmented, dorian, missing, post = asyncio.run(run())
+    assert augmented == (b'HTTP/1.1 200 OK', {
+        'root': 'C',
+        'quality': 'Augmented Triad',
+        'notes': ['C', 'E', 'G♯']
+    })
+    assert dorian[1]['notes'] == ['D', 'E', 'F', 'G', 'A', 'B', 'C']
+    assert missing[0] == b'HTTP/1.1 404 Not Found'
+    assert post[0] == b'HTTP/1.1 405 Method Not Allowed'
+
+
+def test_parse_headers():
+    headers = server.parse_headers(['Host: localhost', 'Connection:close',
+                                    'connection: Keep-Alive ', 'Bad line'])
+    assert headers == {'host': 'localhost',
+                       'connection': 'close, Keep-Alive'}
+    assert server.header_tokens(headers['connection']) == ['close',
+                                                           'keep-alive']
+
+
+def test_request_body():
+    """
+    Make sure a rejected request's body is skipped rather than parsed as the
+    next request, and that any Connection: close token ends the connection.
+    """
+    async def run():
+        scale_server = server.ScaleServer()
+        await scale_server.start('127.0.0.1', 0)
+        reader, writer = await asyncio.open_connection('127.0.0.1',
+                                                       scale_server.port)
+        body = 'GET /scales/C HTTP/1.1\r\n\r\n'
+        writer.write(f'POST /scales/D HTTP/1.1\r\n'
+                     f'Content-Length: {len(body)}\r\n\r\n{body}'
+                     f'GET /scales/D HTTP/1.1\r\n'
+                     f'Connection: Keep-Alive, Close \r\n\r\n'.encode())
+        response = await asyncio.wait_for(reader.read(), 5)
+        writer.close()
+        scale_server.close()
+        await scale_server.wait_closed()
+        return response
+
+    response = asyncio.run(run())
+    assert response.startswith(b'HTTP/1.1 405 Method Not Allowed')
+    assert response.count(b'HTTP/1.1') == 2
+    second = response.split(b'HTTP/1.1 ')[2]
+    assert second.startswith(b'200 OK')
+    assert json.loads(second.split(b'\r\n\r\n')[1])['root'] == 'D'
+
+
+def test_header_limit():
+    """
+    Make sure a request head longer than MAX_HEADER_SIZE is rejected.
+    """
+    async def run():
+        scale_server = server.ScaleServer()
+        await scale_server.start('127.0.0.1', 0)
+        reader, writer = await asyncio.open_connection('127.0.0.1',
+                                                       scale_server.port)
+        padding = 'x' * server.MAX_HEADER_SIZE
+        writer.write(f'GET /scales/C HTTP/1.1\r\nX-Padding: {padding}\r\n'
+                     f'\r\n'.encode())
+        response = await asyncio.wait_for(reader.read(), 5)
+        writer.close()
+        scale_server.close()
+        await scale_server.wait_closed()
+        return response
+
+    assert asyncio.run(run()).startswith(b'HTTP/1.1 400 Bad Request')
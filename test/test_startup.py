@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+BACKEND_MODULES = (
+    'src.backend.__main__',
+    'src.backend.chord_builder',
+    'src.backend.chord_chart',
+    'src.backend.chord_identifier',
+    'src.backend.export',
+    'src.backend.key_finder',
+    'src.backend.midi',
+    'src.backend.pitch_class_set',
+    'src.backend.scales',
+    'src.server'
+)
+
+
+def test_backend_does_not_import_qt():
+    """
+    Make sure the headless backend modules never pull in PySide2.
+    """
+    code = f'import sys\n' \
+           f'for module in {BACKEND_MODULES!r}:\n' \
+           f'    __import__(module)\n' \
+           f'assert not [m for m in sys.modules if m.startswith("PySide2")]'
+    subprocess.run([sys.executable, '-c', code], cwd=ROOT_DIR, check=True)
@@ -0,0 +1,81 @@
+import io
+import os
+import wave
+
+import numpy as np
+import pytest
+
+from src.backend import synth
+from src.backend.intervals import Triad
+from src.backend.notes import Note
+
+
+def test_frequency():
+    assert synth.frequency(69) == 440.0
+    assert synth.frequency(81) == 880.0
+    assert synth.frequency(60) == pytest.approx(261.626, abs=1e-3)
+
+
+def test_envelope():
+    env = synth.envelope(synth.SAMPLE_RATE)
+    assert env[0] == 0.0
+    assert env.max() == pytest.approx(1.0, abs=1e-3)
+    assert env[synth.SAMPLE_RATE // 2] == pytest.approx(synth.SUSTAIN_LEVEL)
+    assert env[-1] == pytest.approx(0.0, abs=1e-3)
+    # Stages shrink to fit notes shorter than the envelope
+    assert len(synth.envelope(100)) == 100
+
+
+class TestRenderNote:
+    def setup(self):
+        synth.clear_note_cache()
+
+    def test_render_note(self):
+        samples = synth.render_note(69, 0.25, synth.Timbre.Organ)
+        assert samples.dtype == np.float32
+        assert len(samples) == synth.SAMPLE_RATE // 4
+        assert np.abs(samples).max() <= synth.PEAK
+        with pytest.raises(ValueError):
+            samples[0] = 1.0
+
+    def test_cache(self):
+        first = synth.render_note(60, 0.1)
+        assert synth.render_note(60, 0.1) is first
+        assert synth.render_note(60, 0.1, synth.Timbre.Reed) is not first
+        assert synth.note_cache_info().hits == 1
+        assert synth.note_cache_info().misses == 2
+
+
+def test_render_steps():
+    step_size = int(0.1 * synth.SAMPLE_RATE)
+    samples = synth.render_steps([(60,), (), (60, 64, 67)], 0.1)
+    assert len(samples) == 3 * step_size
+    assert not samples[step_size:2 * step_size].any()
+    assert np.abs(samples).max() <= synth.PEAK
+    np.testing.assert_array_equal(samples[:step_size],
+                                  synth.render_note(60, 0.1))
+
+
+def test_render():
+    assert len(synth.render_scale(Note.G, 0.1)) == \
+           8 * int(0.1 * synth.SAMPLE_RATE)
+    assert len(synth.render_chord(Note.G, Triad.Minor, 0.1)) == \
+           int(0.1 * synth.SAMPLE_RATE)
+
+
+def test_write_wav():
+    samples = synth.render_chord(Note.C, Triad.Major, 0.05)
+    stream = io.BytesIO()
+    synth.write_wav(samples, stream)
+    stream.seek(0)
+    with wave.open(stream, 'rb') as wav:
+        assert wav.getframerate() == synth.SAMPLE_RATE
+        assert wav.getsampwidth() == 2
+        assert wav.getnframes() == len(samples)
+
+
+def test_export_keys(tmp_path):
+    paths = synth.export_keys([Note.C, Note.EFlat], str(tmp_path))
+    assert [os.path.basename(path) for path in paths] == ['C.wav', 'EFlat.wav']
+    with wave.open(paths[1], 'rb') as wav:
+        assert wav.getnframes() == len(synth.render_key(Note.EFlat))
@@ -0,0 +1,58 @@
+from src.backend import intervals
+from src.backend import voicings
+from src.backend.intervals import SeventhChord
+from src.backend.intervals import Triad
+from src.backend.notes import Note
+from src.backend.notes import PITCH_CLASSES
+
+
+def test_iter_voicings():
+    """
+    Make sure every voicing covers the chord, stays in range and reports its
+    inversion and spacing.
+    """
+    results = list(voicings.iter_voicings(Note.C, Triad.Major, 48, 72))
+    assert len(results) == len({voicing.midi for voicing in results})
+    for voicing in results:
+        assert 48 <= voicing.midi[0] and voicing.midi[-1] <= 72
+        assert list(voicing.midi) == sorted(set(voicing.midi))
+        assert {note % 12 for note in voicing.midi} == {0, 4, 7}
+        assert 3 <= len(voicing.midi) <= 4
+        assert voicing.inversion == (0, 4, 7).index(voicing.midi[0] % 12)
+        span = voicing.midi[-1] - voicing.midi[0]
+        assert voicing.spacing == (voicings.CLOSE if span < 12
+                                   else voicings.OPEN)
+
+    midis = {voicing.midi for voicing in results}
+    assert (48, 52, 55) in midis
+    assert (52, 55, 60) in midis
+    assert (48, 55, 64) in midis
+    assert (48, 52, 55, 60) in midis
+
+
+def test_spelling():
+    voicing = next(voicings.iter_voicings(Note.FSharp, SeventhChord.Major,
+                                          53, 70))
+    assert voicing.midi == (53, 54, 58, 61)
+    assert voicing.notes == (Note.ESharp, Note.FSharp, Note.ASharp,
+                             Note.CSharp)
+    assert voicing.inversion == 3
+    for voicing in voicings.iter_voicings(Note.FSharp, SeventhChord.Major,
+                                          53, 70):
+        assert [PITCH_CLASSES[note] for note in voicing.notes] == \
+               [midi % 12 for midi in voicing.midi]
+
+
+def test_iter_voicing_chunks():
+    """
+    Make sure the process pool yields the same voicings as the serial
+    generator, in bounded chunks.
+    """
+    roots = [Note.C, Note.EFlat]
+    qualities = list(intervals.ALL_CHORD_INTS)
+    expected = [voicing for root in roots for quality in qualities
+                for voicing in voicings.iter_voicings(root, quality, 55, 72)]
+    chunks = list(voicings.iter_voicing_chunks(roots, qualities, 55, 72,
+                                               workers=2, chunk_size=100))
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert [voicing for chunk in chunks for voicing in chunk] == expected